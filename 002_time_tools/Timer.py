@@ -1,15 +1,34 @@
 import tkinter as tk
-from tkinter import messagebox
-import threading
+from tkinter import filedialog, messagebox, ttk
+from array import array
+import csv
+import heapq
+import math
 import time
 import sys
 import platform
 
+def parse_hms(text):
+    """'시:분:초' 문자열을 초로 변환 (형식이 틀리면 ValueError)"""
+    h, m, s = map(int, text.split(":"))
+    return h * 3600 + m * 60 + s
+
+def format_hms(total_seconds):
+    """초를 'HH:MM:SS' 문자열로 변환"""
+    mins, secs = divmod(total_seconds, 60)
+    hours, mins = divmod(mins, 60)
+    return f"{hours:02}:{mins:02}:{secs:02}"
+
+def format_elapsed(ns):
+    """나노초를 'HH:MM:SS.mmm' 문자열로 변환 (밀리초 아래는 버림)"""
+    seconds, ns = divmod(ns, 1_000_000_000)
+    return f"{format_hms(seconds)}.{ns // 1_000_000:03}"
+
 class SilentTimer:
     def __init__(self, root):
         self.root = root
         self.root.title("소리 없는 타이머")
-        self.root.geometry("300x200")
+        self.root.geometry("300x240")
 
         # 입력 필드 레이블
         tk.Label(root, text="시간(시:분:초)").pack(pady=5)
@@ -35,19 +54,32 @@ class SilentTimer:
         self.stop_button = tk.Button(button_frame, text="타이머 중단", command=self.stop_timer, state="disabled")
         self.stop_button.pack(side="left", padx=5)
 
+        # 다른 모드 버튼 프레임
+        mode_frame = tk.Frame(root)
+        mode_frame.pack()
+
+        # 여러 타이머 창 열기 버튼
+        tk.Button(mode_frame, text="여러 타이머", command=self.open_multi_timer).pack(side="left", padx=5)
+
+        # 스톱워치 창 열기 버튼
+        tk.Button(mode_frame, text="스톱워치", command=self.open_stopwatch).pack(side="left", padx=5)
+
         # macOS에서 앱이 활성화되는 메서드 등록
         if platform.system() == 'Darwin':  # macOS 확인
             self.root.createcommand('::tk::mac::RaiseWindow', self.root.lift)
 
         self.timer_running = False  # 타이머 실행 상태 플래그
+        self.deadline = None  # 종료 시각 (time.monotonic() 기준)
+        self.after_id = None  # 다음 화면 갱신 예약 (root.after)
         self.popup = None  # 팝업 창 참조 저장
+        self.multi_window = None  # 여러 타이머 창 (열려 있을 때만)
+        self.stopwatch_window = None  # 스톱워치 창 (열려 있을 때만)
 
     def start_timer(self):
         time_str = self.entry_time.get()
         
         try:
-            h, m, s = map(int, time_str.split(":"))
-            total_seconds = h * 3600 + m * 60 + s
+            total_seconds = parse_hms(time_str)
             
             if total_seconds <= 0:
                 messagebox.showerror("오류", "시간을 1초 이상 입력하세요.")
@@ -57,33 +89,47 @@ class SilentTimer:
             self.start_button.config(state="disabled")  # 시작 버튼 비활성화
             self.stop_button.config(state="normal")  # 중단 버튼 활성화
             self.entry_time.config(state="disabled")  # 입력 필드 비활성화
-            threading.Thread(target=self.countdown, args=(total_seconds,), daemon=True).start()
+            # 1초씩 빼 나가지 않고 종료 시각을 한 번 정해 두고 매번 남은 시간을 다시 계산
+            self.deadline = time.monotonic() + total_seconds
+            self.countdown()
 
         except ValueError:
             messagebox.showerror("오류", "올바른 시간 형식(HH:MM:SS)으로 입력하세요.")
 
     def stop_timer(self):
         self.timer_running = False
+        self.deadline = None
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
         self.remaining_label.config(text="남은 시간: 00:00:00")  # 남은 시간 초기화
         self.start_button.config(state="normal")  # 시작 버튼 활성화
         self.stop_button.config(state="disabled")  # 중단 버튼 비활성화
         self.entry_time.config(state="normal")  # 입력 필드 활성화
 
-    def countdown(self, total_seconds):
-        while total_seconds > 0 and self.timer_running:
-            self.update_time_label(total_seconds)
-            time.sleep(1)
-            total_seconds -= 1
+    def countdown(self):
+        """남은 시간 표시를 갱신하고 다음 초 경계에 다시 실행되도록 예약 (Tk 메인 스레드에서 실행)
 
-        if self.timer_running:  # 타이머가 중단되지 않은 경우
+        after()가 늦게 불려도 남은 시간은 종료 시각에서 다시 계산하므로 오차가
+        쌓이지 않고, 표시가 바뀌는 순간(남은 시간이 정수 초가 되는 때)에 맞춰
+        깨어나므로 완료 시각도 종료 시각에서 몇 ms 안에 맞는다.
+        """
+        self.after_id = None
+        if not self.timer_running:
+            return
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            self.update_time_label(0)
             self.show_popup()
+            return
+        shown = math.ceil(remaining)
+        self.update_time_label(shown)
+        # 표시가 shown - 1초로 바뀌는 시각까지 대기 (일찍 깨어나면 남은 만큼 다시 예약)
+        delay_ms = max(1, math.ceil((remaining - (shown - 1)) * 1000))
+        self.after_id = self.root.after(delay_ms, self.countdown)
 
     def update_time_label(self, total_seconds):
-        mins, secs = divmod(total_seconds, 60)
-        hours, mins = divmod(mins, 60)
-        time_format = f"{hours:02}:{mins:02}:{secs:02}"
-        self.remaining_label.config(text=f"남은 시간: {time_format}")
-        self.root.update()
+        self.remaining_label.config(text=f"남은 시간: {format_hms(total_seconds)}")
 
     def show_popup(self):
         """팝업이 항상 화면에 보이도록 설정"""
@@ -140,6 +186,521 @@ class SilentTimer:
         self.popup = None
         self.stop_timer()  # 타이머 중단 로직 호출
 
+    def open_multi_timer(self):
+        """여러 타이머 창 열기 (이미 열려 있으면 앞으로 가져옴)"""
+        if self.multi_window is not None:
+            self.multi_window.window.lift()
+            return
+        self.multi_window = MultiTimerWindow(self.root, on_close=self.on_multi_timer_closed)
+
+    def on_multi_timer_closed(self):
+        self.multi_window = None
+
+    def open_stopwatch(self):
+        """스톱워치 창 열기 (이미 열려 있으면 앞으로 가져옴)"""
+        if self.stopwatch_window is not None:
+            self.stopwatch_window.window.lift()
+            return
+        self.stopwatch_window = StopwatchWindow(self.root, on_close=self.on_stopwatch_closed)
+
+    def on_stopwatch_closed(self):
+        self.stopwatch_window = None
+
+class NamedTimer:
+    """여러 타이머 모드의 타이머 하나 (cancel은 표시만 하고 힙에서는 나중에 버림)"""
+    __slots__ = ('name', 'deadline', 'done', 'cancelled', 'iid', 'shown')
+
+    def __init__(self, name, deadline):
+        self.name = name
+        self.deadline = deadline  # time.monotonic() 기준 종료 시각
+        self.done = False
+        self.cancelled = False
+        self.iid = None  # 목록(Treeview) 행 id
+        self.shown = None  # 목록에 마지막으로 쓴 남은 시간 문자열
+
+class TimerScheduler:
+    """여러 타이머의 종료 시각을 힙 하나로 관리하고 root.after는 하나만 예약
+
+    가장 이른 종료 시각과 다음 화면 갱신 시각(1초 간격) 중 이른 쪽에만 after를
+    걸어 두므로, 타이머가 몇 개든 스레드는 늘지 않고 깨어나는 횟수도 같다.
+    취소된 타이머는 힙 맨 앞에 올라왔을 때 버린다.
+    """
+    TICK = 1.0  # 화면 갱신 간격(초)
+
+    def __init__(self, root, on_expire, on_tick):
+        self.root = root
+        self.on_expire = on_expire  # 만료된 타이머 목록을 받는 콜백
+        self.on_tick = on_tick  # 1초마다 부르는 화면 갱신 콜백
+        self.heap = []
+        self.seq = 0  # 종료 시각이 같은 타이머의 순서 고정
+        self.active = 0  # 실행 중(완료/취소 전) 타이머 수
+        self.after_id = None
+        self.wake_at = None  # 예약된 after가 깨어날 시각
+        self.next_tick = None  # 다음 화면 갱신 시각 (갱신이 필요 없으면 None)
+        self.keep_ticking = False  # 실행 중 타이머가 없어도 1초 갱신 유지 (완료 팝업 표시 중)
+
+    def add(self, name, seconds):
+        """seconds초 뒤에 끝나는 타이머 추가"""
+        now = time.monotonic()
+        timer = NamedTimer(name, now + seconds)
+        self.seq += 1
+        heapq.heappush(self.heap, (timer.deadline, self.seq, timer))
+        self.active += 1
+        self.arm(now)
+        return timer
+
+    def cancel(self, timer):
+        """타이머 취소 (O(1), 힙에서는 맨 앞에 올 때 버림)"""
+        if not timer.done and not timer.cancelled:
+            timer.cancelled = True
+            self.active -= 1
+            self.arm()
+
+    def set_keep_ticking(self, flag):
+        self.keep_ticking = flag
+        self.arm()
+
+    def arm(self, now=None):
+        """가장 이른 종료 시각과 다음 갱신 시각 중 이른 쪽에 after 하나 예약"""
+        now = time.monotonic() if now is None else now
+        heap = self.heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+        if self.active or self.keep_ticking:
+            if self.next_tick is None:
+                self.next_tick = now + self.TICK
+        else:
+            self.next_tick = None
+        wake = min(heap[0][0] if heap else math.inf,
+                   self.next_tick if self.next_tick is not None else math.inf)
+        if wake == self.wake_at:
+            return  # 이미 같은 시각에 예약돼 있음
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+            self.wake_at = None
+        if wake != math.inf:
+            delay_ms = max(1, math.ceil((wake - now) * 1000))
+            self.after_id = self.root.after(delay_ms, self.run)
+            self.wake_at = wake
+
+    def run(self):
+        """after 콜백: 만료된 타이머 처리, 갱신 시각이 됐으면 화면 갱신, 다시 예약"""
+        self.after_id = None
+        self.wake_at = None
+        now = time.monotonic()
+        heap = self.heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            if timer.cancelled:
+                continue
+            timer.done = True
+            self.active -= 1
+            expired.append(timer)
+        if expired:
+            self.on_expire(expired, now)
+        if self.next_tick is not None and now >= self.next_tick:
+            # 늦게 깨어나도 1초 격자는 유지하고 밀린 갱신은 한 번만 함
+            self.next_tick += self.TICK * (1 + int((now - self.next_tick) // self.TICK))
+            self.on_tick(now)
+        self.arm(now)
+
+    def stop(self):
+        """예약된 after와 모든 타이머 제거"""
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = None
+        self.wake_at = None
+        self.heap.clear()
+        self.active = 0
+        self.next_tick = None
+
+class MultiTimerWindow:
+    """이름 붙인 타이머 여러 개(수백 개)를 한 목록에서 관리하는 창
+
+    모든 타이머는 TimerScheduler 하나가 처리하고, 1초마다 목록에서 화면에
+    보이는 행의 남은 시간만 다시 쓴다 (글자가 바뀐 행만).
+    """
+    MAX_POPUP_NAMES = 5  # 완료 팝업에 이름을 보여줄 최대 개수
+
+    def __init__(self, root, on_close=None):
+        self.on_close = on_close
+        self.window = tk.Toplevel(root)
+        self.window.title("여러 타이머")
+        self.window.geometry("380x440")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        # 입력 행: 이름, 시간, 개수 (개수가 2 이상이면 '이름 1', '이름 2', ...)
+        form = tk.Frame(self.window)
+        form.pack(pady=5)
+        tk.Label(form, text="이름").grid(row=0, column=0)
+        tk.Label(form, text="시간(시:분:초)").grid(row=0, column=1)
+        tk.Label(form, text="개수").grid(row=0, column=2)
+        self.entry_name = tk.Entry(form, width=12)
+        self.entry_name.insert(0, "타이머")
+        self.entry_name.grid(row=1, column=0, padx=2)
+        self.entry_time = tk.Entry(form, width=10, justify="center")
+        self.entry_time.insert(0, "00:05:00")
+        self.entry_time.grid(row=1, column=1, padx=2)
+        self.entry_count = tk.Entry(form, width=4, justify="center")
+        self.entry_count.insert(0, "1")
+        self.entry_count.grid(row=1, column=2, padx=2)
+        tk.Button(form, text="추가", command=self.add_timers).grid(row=1, column=3, padx=2)
+
+        # 타이머 목록 (한 줄에 이름/남은 시간/상태)
+        list_frame = tk.Frame(self.window)
+        list_frame.pack(fill="both", expand=True, padx=5)
+        self.tree = ttk.Treeview(list_frame, columns=("name", "remaining", "status"), show="headings")
+        for column, text, width in (("name", "이름", 150), ("remaining", "남은 시간", 90), ("status", "상태", 70)):
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor="w" if column == "name" else "center")
+        self.tree.tag_configure("done", foreground="gray")
+        self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        # 스크롤로 새로 보이게 된 행도 바로 갱신
+        self.tree.configure(yscrollcommand=self.on_yscroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        # 아래 버튼/상태 표시
+        bottom = tk.Frame(self.window)
+        bottom.pack(pady=5)
+        tk.Button(bottom, text="선택 삭제", command=self.remove_selected).pack(side="left", padx=5)
+        tk.Button(bottom, text="완료 항목 정리", command=self.clear_done).pack(side="left", padx=5)
+        self.status_label = tk.Label(self.window, text="")
+        self.status_label.pack(pady=(0, 5))
+
+        self.timers = {}  # 행 id -> NamedTimer
+        self.order = []  # 목록 순서대로의 행 id (보이는 범위 계산용)
+        self.done_count = 0
+        self.popup = None
+        self.popup_label = None
+        self.finished_names = []  # 팝업을 닫기 전까지 완료된 타이머 이름
+        self.scheduler = TimerScheduler(root, self.on_expire, self.on_tick)
+        self.update_status()
+
+    def add_timers(self):
+        """입력한 이름/시간으로 타이머를 개수만큼 추가"""
+        try:
+            seconds = parse_hms(self.entry_time.get())
+            count = int(self.entry_count.get())
+        except ValueError:
+            messagebox.showerror("오류", "올바른 시간 형식(HH:MM:SS)과 개수를 입력하세요.", parent=self.window)
+            return
+        if seconds <= 0 or count <= 0:
+            messagebox.showerror("오류", "시간은 1초 이상, 개수는 1개 이상 입력하세요.", parent=self.window)
+            return
+        name = self.entry_name.get().strip() or "타이머"
+        shown = format_hms(seconds)
+        for i in range(count):
+            label = name if count == 1 else f"{name} {i + 1}"
+            timer = self.scheduler.add(label, seconds)
+            timer.iid = self.tree.insert("", "end", values=(label, shown, "실행 중"))
+            timer.shown = shown
+            self.timers[timer.iid] = timer
+            self.order.append(timer.iid)
+        self.update_status()
+
+    def visible_rows(self):
+        """목록에서 지금 화면에 보이는 행 id들"""
+        n = len(self.order)
+        if n == 0:
+            return []
+        first, last = self.tree.yview()
+        return self.order[int(first * n):min(n, math.ceil(last * n))]
+
+    def refresh_visible(self, now=None):
+        """보이는 행 중 남은 시간 글자가 바뀐 행만 다시 씀"""
+        now = time.monotonic() if now is None else now
+        for iid in self.visible_rows():
+            timer = self.timers[iid]
+            if timer.done:
+                continue
+            text = format_hms(max(0, math.ceil(timer.deadline - now)))
+            if text != timer.shown:
+                timer.shown = text
+                self.tree.set(iid, "remaining", text)
+
+    def on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh_visible()
+
+    def on_tick(self, now):
+        """1초마다: 보이는 행 갱신, 완료 팝업이 떠 있으면 다시 맨 앞으로"""
+        self.refresh_visible(now)
+        if self.popup is not None and self.popup.winfo_exists():
+            self.popup.lift()
+            self.popup.attributes("-topmost", True)
+
+    def on_expire(self, timers, now):
+        """만료된 타이머 행을 완료로 바꾸고 완료 팝업에 이름 추가"""
+        for timer in timers:
+            timer.shown = format_hms(0)
+            self.tree.item(timer.iid, values=(timer.name, timer.shown, "완료"), tags=("done",))
+            self.finished_names.append(timer.name)
+        self.done_count += len(timers)
+        self.update_status()
+        self.show_popup()
+
+    def show_popup(self):
+        """완료된 타이머 이름을 보여주는 팝업 (하나만 띄우고 내용을 갱신)"""
+        if self.popup is None or not self.popup.winfo_exists():
+            self.popup = tk.Toplevel(self.window)
+            self.popup.title("타이머 완료")
+            self.popup.geometry("260x140")
+            self.popup.attributes("-topmost", True)
+            self.popup.protocol("WM_DELETE_WINDOW", self.close_popup)
+            self.popup_label = tk.Label(self.popup, font=("Arial", 12), justify="center")
+            self.popup_label.pack(pady=15)
+            tk.Button(self.popup, text="확인", command=self.close_popup).pack()
+            # 다시 맨 앞으로 가져오는 일은 스케줄러의 1초 갱신에서 함께 처리
+            self.scheduler.set_keep_ticking(True)
+        names = self.finished_names[-self.MAX_POPUP_NAMES:]
+        more = len(self.finished_names) - len(names)
+        text = "⏰ 완료: " + ", ".join(names)
+        if more:
+            text += f" 외 {more}개"
+        self.popup_label.config(text=text, wraplength=230)
+        self.popup.lift()
+        self.popup.focus_force()
+
+    def close_popup(self):
+        if self.popup is not None and self.popup.winfo_exists():
+            self.popup.destroy()
+        self.popup = None
+        self.finished_names = []
+        self.scheduler.set_keep_ticking(False)
+
+    def remove_timers(self, iids):
+        """행 id 목록의 타이머를 취소하고 목록에서 삭제"""
+        if not iids:
+            return
+        for iid in iids:
+            timer = self.timers.pop(iid)
+            if timer.done:
+                self.done_count -= 1
+            self.scheduler.cancel(timer)
+        self.tree.delete(*iids)
+        self.order = [iid for iid in self.order if iid in self.timers]
+        self.update_status()
+
+    def remove_selected(self):
+        self.remove_timers(self.tree.selection())
+
+    def clear_done(self):
+        self.remove_timers([iid for iid in self.order if self.timers[iid].done])
+
+    def update_status(self):
+        running = len(self.timers) - self.done_count
+        self.status_label.config(text=f"실행 중 {running}개 / 완료 {self.done_count}개")
+
+    def close(self):
+        """창 닫기: 모든 타이머와 예약된 after 정리"""
+        self.scheduler.stop()
+        self.close_popup()
+        self.window.destroy()
+        if self.on_close:
+            self.on_close()
+
+class LapLog:
+    """랩 기록: 누적 시간(ns)을 미리 잡아 둔 int64 배열에 차례로 저장
+
+    랩을 누를 때는 배열 칸에 정수 하나만 쓰므로 객체가 새로 생기지 않고,
+    칸이 모자라면 두 배로 늘린다. 구간 시간은 앞 랩과의 차이로 계산한다.
+    """
+    def __init__(self, capacity=1024):
+        self.totals = array('q', bytes(8 * capacity))
+        self.count = 0
+
+    def add(self, total_ns):
+        """누적 시간 total_ns인 랩 추가 후 랩 번호(1부터) 반환"""
+        if self.count == len(self.totals):
+            self.totals.extend(array('q', bytes(8 * len(self.totals))))
+        self.totals[self.count] = total_ns
+        self.count += 1
+        return self.count
+
+    def split(self, index):
+        """index번째(0부터) 랩의 구간 시간(ns)"""
+        previous = self.totals[index - 1] if index > 0 else 0
+        return self.totals[index] - previous
+
+    def clear(self):
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def rows(self):
+        """CSV용 (랩 번호, 구간 ns, 누적 ns, 구간, 누적) 행을 차례로 생성"""
+        previous = 0
+        for i in range(self.count):
+            total = self.totals[i]
+            yield (i + 1, total - previous, total, format_elapsed(total - previous), format_elapsed(total))
+            previous = total
+
+    def write_csv(self, path):
+        """모든 랩을 CSV 파일 하나에 한 번에 기록"""
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(("랩", "구간(ns)", "누적(ns)", "구간", "누적"))
+            writer.writerows(self.rows())
+
+class Stopwatch:
+    """time.perf_counter_ns() 기반 스톱워치 (일시 정지한 시간은 빼고 누적)"""
+    def __init__(self):
+        self.running = False
+        self.started_ns = 0  # 마지막으로 시작한 시각
+        self.accumulated_ns = 0  # 지난 실행 구간들의 합
+
+    def start(self):
+        if not self.running:
+            self.started_ns = time.perf_counter_ns()
+            self.running = True
+
+    def stop(self):
+        if self.running:
+            self.accumulated_ns += time.perf_counter_ns() - self.started_ns
+            self.running = False
+
+    def reset(self):
+        self.running = False
+        self.accumulated_ns = 0
+
+    def elapsed_ns(self, now_ns=None):
+        """지금까지 잰 시간(ns)"""
+        if not self.running:
+            return self.accumulated_ns
+        now_ns = time.perf_counter_ns() if now_ns is None else now_ns
+        return self.accumulated_ns + now_ns - self.started_ns
+
+class StopwatchWindow:
+    """스톱워치와 랩 기록 창
+
+    시간은 버튼/키를 누른 순간 perf_counter_ns()로 읽어 랩 배열에 넣고,
+    화면 표시는 그와 별개로 정해진 간격(after)으로만 다시 그린다.
+    단축키: 스페이스 = 시작/정지, Enter 또는 L = 랩
+    """
+    REFRESH_MS = 50  # 실행 중 표시 갱신 간격 (측정 정밀도와 무관)
+    VISIBLE_LAPS = 200  # 목록에 남겨 둘 최근 랩 수 (CSV에는 전부 저장)
+
+    def __init__(self, root, on_close=None):
+        self.on_close = on_close
+        self.window = tk.Toplevel(root)
+        self.window.title("스톱워치")
+        self.window.geometry("320x380")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.elapsed_label = tk.Label(self.window, text=format_elapsed(0), font=("Arial", 22))
+        self.elapsed_label.pack(pady=10)
+
+        # 버튼이 키보드 포커스를 받으면 버튼 자체의 스페이스 바인딩과 창 단축키가
+        # 둘 다 실행되므로, 버튼은 포커스를 받지 않게 해 키 한 번에 동작 하나만 실행
+        buttons = tk.Frame(self.window)
+        buttons.pack()
+        self.start_button = tk.Button(buttons, text="시작", width=6, command=self.toggle, takefocus=0)
+        self.start_button.pack(side="left", padx=3)
+        self.lap_button = tk.Button(buttons, text="랩", width=6, command=self.lap, state="disabled",
+                                    takefocus=0)
+        self.lap_button.pack(side="left", padx=3)
+        tk.Button(buttons, text="초기화", width=6, command=self.reset, takefocus=0).pack(side="left", padx=3)
+        tk.Button(buttons, text="CSV 저장", command=self.export_csv, takefocus=0).pack(side="left", padx=3)
+
+        # 최근 랩 목록 (최신이 위)
+        list_frame = tk.Frame(self.window)
+        list_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self.tree = ttk.Treeview(list_frame, columns=("lap", "split", "total"), show="headings")
+        for column, text, width in (("lap", "랩", 50), ("split", "구간", 110), ("total", "누적", 110)):
+            self.tree.heading(column, text=text)
+            self.tree.column(column, width=width, anchor="center")
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.window.bind("<space>", lambda event: self.toggle())
+        self.window.bind("<Return>", lambda event: self.lap())
+        self.window.bind("l", lambda event: self.lap())
+
+        self.stopwatch = Stopwatch()
+        self.laps = LapLog()
+        self.lap_rows = []  # 목록에 보이는 랩 행 id (오래된 것부터)
+        self.after_id = None
+
+    def toggle(self):
+        """시작/정지 전환"""
+        if self.stopwatch.running:
+            self.stopwatch.stop()
+            self.cancel_refresh()
+            self.start_button.config(text="시작")
+            self.lap_button.config(state="disabled")
+            self.show_elapsed()
+        else:
+            self.stopwatch.start()
+            self.start_button.config(text="정지")
+            self.lap_button.config(state="normal")
+            self.refresh()
+
+    def lap(self):
+        """지금 시각을 랩으로 기록 (시간을 먼저 읽고 화면 작업은 그 뒤에)"""
+        if not self.stopwatch.running:
+            return
+        total = self.stopwatch.elapsed_ns()
+        number = self.laps.add(total)
+        split = self.laps.split(number - 1)
+        iid = self.tree.insert("", 0, values=(number, format_elapsed(split), format_elapsed(total)))
+        self.lap_rows.append(iid)
+        if len(self.lap_rows) > self.VISIBLE_LAPS:
+            self.tree.delete(self.lap_rows.pop(0))
+
+    def reset(self):
+        """스톱워치와 랩 기록 초기화"""
+        self.stopwatch.reset()
+        self.cancel_refresh()
+        self.laps.clear()
+        if self.lap_rows:
+            self.tree.delete(*self.lap_rows)
+        self.lap_rows = []
+        self.start_button.config(text="시작")
+        self.lap_button.config(state="disabled")
+        self.show_elapsed()
+
+    def show_elapsed(self):
+        self.elapsed_label.config(text=format_elapsed(self.stopwatch.elapsed_ns()))
+
+    def refresh(self):
+        """실행 중에는 REFRESH_MS마다 경과 시간 표시 갱신"""
+        self.after_id = None
+        if not self.stopwatch.running:
+            return
+        self.show_elapsed()
+        self.after_id = self.window.after(self.REFRESH_MS, self.refresh)
+
+    def cancel_refresh(self):
+        if self.after_id is not None:
+            self.window.after_cancel(self.after_id)
+            self.after_id = None
+
+    def export_csv(self):
+        """모든 랩을 CSV 파일로 저장 (목록에서 지워진 오래된 랩 포함)"""
+        if not len(self.laps):
+            messagebox.showinfo("알림", "저장할 랩이 없습니다.", parent=self.window)
+            return
+        path = filedialog.asksaveasfilename(parent=self.window, defaultextension=".csv",
+                                            filetypes=[("CSV 파일", "*.csv")], initialfile="laps.csv")
+        if not path:
+            return
+        try:
+            self.laps.write_csv(path)
+        except OSError as e:
+            messagebox.showerror("오류", f"저장하지 못했습니다: {e}", parent=self.window)
+
+    def close(self):
+        self.cancel_refresh()
+        self.window.destroy()
+        if self.on_close:
+            self.on_close()
+
 # 실행
 if __name__ == "__main__":
     root = tk.Tk()
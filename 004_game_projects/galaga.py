@@ -2,14 +2,27 @@ import pygame
 import random
 import math
 import os
-import pathlib
+import sys
 import json
 import time
+import hashlib
+import heapq
+import threading
+import argparse
+import collections
+import gc
+import tracemalloc
+import numpy as np
 
 # 게임 설정
 SCREEN_WIDTH = 480
 SCREEN_HEIGHT = 640
-FPS = 60
+FPS = 60  # 화면 그리기 최대 프레임
+TICK_RATE = 60  # 게임 로직 고정 틱 (초당). galaga.json의 쿨다운/확률/dive_speed는 틱 단위
+TICK_MS = 1000 / TICK_RATE
+MAX_TICKS_PER_FRAME = 5  # 그리기가 밀렸을 때 한 프레임에 따라잡는 최대 틱 수
+MAX_FRAME_MS = 250  # 창 이동 등으로 멈춘 뒤 한꺼번에 따라잡지 않도록 프레임 시간 상한
+INTERPOLATION_MAX_JUMP = 64  # 한 틱에 이보다 많이 움직이면 순간 이동으로 보고 보간하지 않음
 
 # 색상
 WHITE = (255, 255, 255)
@@ -19,55 +32,310 @@ YELLOW = (255, 255, 0)
 BLUE = (0, 128, 255)
 GREEN = (0, 255, 0)
 
-# 설정 파일 로드
-try:
-    script_path = os.path.dirname(os.path.abspath(__file__))
-    config_path = os.path.join(script_path, 'galaga.json')
-    with open(config_path, 'r', encoding='utf-8') as f:
-        CONFIG = json.load(f)
-except (FileNotFoundError, NameError):
+# 리소스 경로: PyInstaller로 묶였으면 압축 해제 폴더, 아니면 이 파일이 있는 폴더 기준
+ASSET_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+
+def asset_path(*parts):
+    """실행 위치와 상관없이 게임 리소스의 절대 경로 반환"""
+    return os.path.join(ASSET_DIR, *parts)
+
+# 기본 설정 (galaga.json이 없거나 읽을 수 없을 때)
+DEFAULT_CONFIG = {
+    "enemy": {
+        "base_cols": 8,
+        "max_cols": 12,
+        "base_rows": 3,
+        "max_rows": 5,
+        "boss_hp": 3,
+        "mid_hp": 2,
+        "basic_hp": 1,
+        "boss_score": 300,
+        "mid_score": 150,
+        "basic_score": 100
+    },
+    "item": {
+        "drop_rate": 0.2
+    },
+    "difficulty": {
+        "dive_speed": 0.05,
+        "dive_speed_per_wave": 0.003,
+        "dive_cooldown": 800,
+        "dive_cooldown_per_wave": 20,
+        "tractor_cooldown": 1200,
+        "tractor_cooldown_per_wave": 30,
+        "missile_base_chance": 0.005,
+        "missile_per_wave": 0.0005,
+        "max_missiles": 10
+    },
+    "bullet_hell": {
+        "fire_chance_scale": 3.0,
+        "ring_count": 16,
+        "ring_speed": 120,
+        "fan_count": 5,
+        "fan_spread": 0.6,
+        "fan_speed": 180,
+        "speed_per_wave": 6,
+        "max_bullets": 5000,
+        "lifetime_ms": 10000,
+        "hitbox_shrink": 24
+    }
+}
+
+# 폰트 후보: 리소스 폴더의 파일을 먼저 찾고, 없으면 같은 이름의 시스템 폰트
+FONT_FILES = ["NanumGothic.ttf", "malgun.ttf", "AppleGothic.ttf"]
+FONT_SYSTEM_NAMES = ["AppleGothic", "Malgun Gothic", "NanumGothic"]  # macOS, Windows, Linux
+
+# 효과음 이름 -> sounds 폴더의 파일명
+SOUND_FILES = {
+    'shoot': 'shoot.wav',
+    'explosion': 'explosion.wav',
+    'item': 'item.wav',
+    'bomb': 'bomb.wav',
+    'gameover': 'gameover.wav',
+}
+
+# 효과음별 재생 규칙: 카테고리(전용 채널 묶음), 우선순위(클수록 중요), 같은 효과음 최소 재생 간격(ms)
+SOUND_RULES = {
+    'shoot': {'category': 'weapon', 'priority': 1, 'interval_ms': 60},
+    'explosion': {'category': 'explosion', 'priority': 2, 'interval_ms': 40},
+    'item': {'category': 'event', 'priority': 3, 'interval_ms': 100},
+    'bomb': {'category': 'event', 'priority': 4, 'interval_ms': 200},
+    'gameover': {'category': 'event', 'priority': 5, 'interval_ms': 1000},
+}
+VOICE_CHANNELS = {'weapon': 2, 'explosion': 4, 'event': 2}  # 카테고리별로 예약하는 믹서 채널 수
+
+class VoiceManager:
+    """효과음 재생 요청을 모아 프레임마다 한 번에 믹서 채널에 배정
+
+    - 같은 프레임에 들어온 같은 효과음은 한 번만 재생 (merged)
+    - 효과음마다 최소 재생 간격을 두어 연속 요청을 버림 (rate_limited)
+    - 카테고리별로 예약한 채널만 쓰고, 빈 채널이 없으면 우선순위가 같거나
+      낮은 재생 중인 소리 중 가장 오래된 것을 끊고 재생 (stolen), 그마저
+      없으면 버림 (dropped)
+    그래서 폭탄/더블 파이어로 한 프레임에 수십 번 요청이 와도 프레임당
+    실제 재생은 효과음 종류 수를 넘지 않는다.
+    """
+    def __init__(self, rules=SOUND_RULES, channels=VOICE_CHANNELS):
+        self.rules = rules
+        self.channel_counts = channels
+        self.channels = None  # 카테고리 -> [(채널 번호, pygame.mixer.Channel)] (믹서 초기화 후 만듦)
+        self.voices = {}      # 채널 번호 -> (우선순위, 시작 시각)
+        self.pending = {}     # 이번 프레임에 요청된 효과음 이름 -> (Sound, 요청 횟수)
+        self.last_played = {}
+        self.stats = collections.Counter()
+
+    def request(self, name, sound):
+        """재생 요청 (실제 재생은 flush()에서)"""
+        self.stats['requested'] += 1
+        entry = self.pending.get(name)
+        if entry is None:
+            self.pending[name] = (sound, 1)
+        else:
+            self.stats['merged'] += 1
+            self.pending[name] = (sound, entry[1] + 1)
+
+    def reserve_channels(self):
+        """카테고리별 채널을 예약해 Sound.play()의 자동 채널 선택이 쓰지 못하게 함"""
+        total = sum(self.channel_counts.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(total)
+        self.channels = {}
+        index = 0
+        for category, count in self.channel_counts.items():
+            self.channels[category] = [(i, pygame.mixer.Channel(i)) for i in range(index, index + count)]
+            index += count
+
+    def flush(self, now=None):
+        """이번 프레임에 모인 요청을 우선순위 높은 순으로 재생"""
+        if not self.pending:
+            return
+        pending = self.pending
+        self.pending = {}
+        if not pygame.mixer.get_init():
+            return
+        if self.channels is None:
+            self.reserve_channels()
+        now = time.perf_counter() * 1000 if now is None else now
+        for name in sorted(pending, key=lambda n: -self.rules[n]['priority']):
+            sound, count = pending[name]
+            rule = self.rules[name]
+            last = self.last_played.get(name)
+            if last is not None and now - last < rule['interval_ms']:
+                self.stats['rate_limited'] += 1
+                continue
+            channel = self.allocate(rule, now)
+            if channel is None:
+                self.stats['dropped'] += 1
+                continue
+            channel.play(sound)
+            self.last_played[name] = now
+            self.stats['played'] += 1
+
+    def allocate(self, rule, now):
+        """카테고리 채널 중 빈 채널, 없으면 끊을 채널 반환 (모두 더 중요한 소리면 None)"""
+        victim = None
+        for index, channel in self.channels[rule['category']]:
+            if not channel.get_busy():
+                self.voices[index] = (rule['priority'], now)
+                return channel
+            key = self.voices.get(index, (0, 0))
+            if key[0] <= rule['priority'] and (victim is None or key < victim[0]):
+                victim = (key, index, channel)
+        if victim is None:
+            return None
+        _, index, channel = victim
+        channel.stop()
+        self.stats['stolen'] += 1
+        self.voices[index] = (rule['priority'], now)
+        return channel
+
+    def report(self):
+        """재생/합침/간격 제한/끊음/버림 횟수 문자열"""
+        keys = ('requested', 'played', 'merged', 'rate_limited', 'stolen', 'dropped')
+        return "효과음: " + ", ".join(f"{key} {self.stats[key]}" for key in keys)
+
+class AssetManager:
+    """폰트/효과음을 키별로 한 번만 읽어 캐시하고, 리소스별 로딩 시간을 기록
+
+    첫 화면에 꼭 필요한 폰트는 바로 읽고, 효과음은 시작 화면이 떠 있는 동안
+    preload()로 백그라운드 스레드에서 읽는다. 아직 읽지 못한 효과음은
+    play()에서 조용히 건너뛴다.
+    """
+    def __init__(self, base_dir=ASSET_DIR):
+        self.base_dir = base_dir
+        self.fonts = {}
+        self.sounds = {}
+        self.load_times = {}  # 리소스 키 -> 로딩 시간(초)
+        self.errors = {}      # 리소스 키 -> 실패 이유
+        self.font_path = None
+        self.font_resolved = False
+        self.lock = threading.Lock()
+        self.preload_thread = None
+        self.voices = VoiceManager()
+
+    def record(self, key, start, error=None, quiet=False):
+        """로딩 시간/실패 기록 (quiet가 아니면 실패를 처음 한 번만 출력)"""
+        with self.lock:
+            self.load_times[key] = time.perf_counter() - start
+            if error is not None and key not in self.errors:
+                self.errors[key] = error
+                if not quiet:
+                    print(f"리소스 로딩 실패: {key} ({error})")
+
+    def resolve_font_path(self):
+        """사용할 한글 폰트 파일 경로를 한 번만 탐색 (없으면 None = pygame 기본 폰트)"""
+        if not self.font_resolved:
+            start = time.perf_counter()
+            for fname in FONT_FILES:
+                path = os.path.join(self.base_dir, fname)
+                if os.path.exists(path):
+                    self.font_path = path
+                    break
+            else:
+                for name in FONT_SYSTEM_NAMES:
+                    self.font_path = pygame.font.match_font(name)
+                    if self.font_path:
+                        break
+            self.font_resolved = True
+            self.record('font:path', start)
+        return self.font_path
+
+    def font(self, size=24):
+        """크기별 한글 폰트 (캐시)"""
+        font = self.fonts.get(size)
+        if font is None:
+            path = self.resolve_font_path()
+            start = time.perf_counter()
+            try:
+                font = pygame.font.Font(path, size)
+                error = None
+            except (OSError, pygame.error) as e:
+                font = pygame.font.Font(None, size)
+                error = e
+            self.fonts[size] = font
+            self.record(f'font:{size}', start, error)
+        return font
+
+    def load_sound(self, name):
+        """효과음 하나를 읽어 캐시 (파일이 없거나 오디오 장치가 없으면 None)"""
+        if name in self.sounds:
+            return self.sounds[name]
+        start = time.perf_counter()
+        path = os.path.join(self.base_dir, 'sounds', SOUND_FILES[name])
+        sound = None
+        error = None
+        quiet = True  # 효과음 파일/오디오 장치가 없는 것은 정상 실행 환경으로 보고 출력하지 않음
+        if not os.path.exists(path):
+            error = "파일 없음"
+        elif not pygame.mixer.get_init():
+            error = "오디오 장치 없음"
+        else:
+            try:
+                sound = pygame.mixer.Sound(path)
+            except pygame.error as e:
+                error = e
+                quiet = False
+        with self.lock:
+            self.sounds[name] = sound
+        self.record(f'sound:{name}', start, error, quiet)
+        return sound
+
+    def preload_sounds(self):
+        """모든 효과음 읽기 (preload 스레드에서 실행)"""
+        for name in SOUND_FILES:
+            self.load_sound(name)
+
+    def preload(self):
+        """효과음을 백그라운드 스레드에서 미리 읽기 시작"""
+        if self.preload_thread is None:
+            self.preload_thread = threading.Thread(target=self.preload_sounds, daemon=True)
+            self.preload_thread.start()
+        return self.preload_thread
+
+    def play(self, name):
+        """효과음 재생 요청 (아직 읽히지 않았거나 없는 효과음은 건너뜀)
+
+        실제 재생은 프레임마다 한 번 flush_sounds()에서 채널 배정 규칙에 따라 한다.
+        """
+        sound = self.sounds.get(name)
+        if sound:
+            self.voices.request(name, sound)
+
+    def flush_sounds(self):
+        """이번 프레임에 모인 효과음 재생"""
+        self.voices.flush()
+
+    def report(self):
+        """리소스별 로딩 시간(ms) 표 문자열"""
+        with self.lock:
+            items = sorted(self.load_times.items(), key=lambda item: -item[1])
+        lines = [f"{key:<20} {seconds * 1000:8.2f}ms" +
+                 (f"  (실패: {self.errors[key]})" if key in self.errors else '')
+                 for key, seconds in items]
+        return "\n".join(lines)
+
+ASSETS = AssetManager()
+
+def load_config(path=None):
+    """galaga.json 설정 로드 (없거나 깨졌으면 기본 설정)"""
+    path = path or asset_path('galaga.json')
+    start = time.perf_counter()
     try:
-        with open('007_game_projects/galaga.json', 'r', encoding='utf-8') as f:
-            CONFIG = json.load(f)
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        ASSETS.record('config', start)
+        # 예전 설정 파일에 없는 섹션은 기본값으로 채움
+        for section, values in DEFAULT_CONFIG.items():
+            config.setdefault(section, dict(values))
+        return config
     except FileNotFoundError:
-        try:
-            with open('galaga.json', 'r', encoding='utf-8') as f:
-                CONFIG = json.load(f)
-        except FileNotFoundError:
-            # 기본 설정
-            CONFIG = {
-                "enemy": {
-                    "base_cols": 8,
-                    "max_cols": 12,
-                    "base_rows": 3,
-                    "max_rows": 5,
-                    "boss_hp": 3,
-                    "mid_hp": 2,
-                    "basic_hp": 1,
-                    "boss_score": 300,
-                    "mid_score": 150,
-                    "basic_score": 100
-                },
-                "item": {
-                    "drop_rate": 0.2
-                },
-                "difficulty": {
-                    "dive_speed": 0.05,
-                    "dive_speed_per_wave": 0.003,
-                    "dive_cooldown": 800,
-                    "dive_cooldown_per_wave": 20,
-                    "tractor_cooldown": 1200,
-                    "tractor_cooldown_per_wave": 30,
-                    "missile_base_chance": 0.005,
-                    "missile_per_wave": 0.0005,
-                    "max_missiles": 10
-                }
-            }
-
-# 주요 파라미터를 config에서 불러오기
-ENEMY_CONFIG = CONFIG['enemy']
-ITEM_CONFIG = CONFIG['item']
-DIFFICULTY_CONFIG = CONFIG['difficulty']
+        ASSETS.record('config', start)
+    except (OSError, json.JSONDecodeError) as e:
+        ASSETS.record('config', start, e)
+    return DEFAULT_CONFIG
+
+# 설정 파일 로드
+CONFIG = load_config()
 
 # 적 종류
 ENEMY_TYPES = [
@@ -87,41 +355,120 @@ ITEM_TYPES = [
 FORMATION_LEFT = 40
 FORMATION_RIGHT = SCREEN_WIDTH - 40
 FORMATION_TOP = 40  # 화면 위쪽에 위치
-FORMATION_MOVE_X = 2
+FORMATION_START_X = 30  # 첫 열의 처음 x 위치
+FORMATION_COL_SPACING = 35
+FORMATION_ROW_SPACING = 32
+FORMATION_SPEED = 120  # 진형 좌우 이동 속도 (px/초)
 FORMATION_MOVE_Y = 15
+WAVE_PREBUILD_PER_TICK = 8  # 스테이지 클리어 화면에서 틱마다 미리 만드는 다음 웨이브 적 수
+
+# 이동 속도 (px/초)
+PLAYER_SPEED = 300
+BULLET_SPEED = 600
+ENEMY_ENTRANCE_SPEED = 240
+ENEMY_RETURN_SPEED = 300        # 진형 복귀 속도
+ENEMY_RETURN_CLIMB_SPEED = 420  # 플레이어 영역에서 빠져나올 때 상승 속도
+ENEMY_BULLET_SPEED = 180
+ENEMY_BULLET_SPEED_PER_WAVE = 18
+ENEMY_BULLET_MAX_SPEED = 360
+ITEM_SPEED = 180
+CAPTURE_RISE_SPEED = 180        # 포획된 플레이어가 끌려 올라가는 속도
+
+# 지속 시간 (ms, 시뮬레이션 시간)
+TRACTOR_BEAM_DURATION = 2000
+SHIELD_DURATION = 4000
+SHIELD_RADIUS = 24  # 쉴드 원 반지름 (이 안에 들어온 적 총알 제거)
+BOMB_DURATION = 500
+BOMB_FRAME_COUNT = 6  # 폭탄 이펙트 알파 단계 수
 
 def get_korean_font(size=24):
-    # 1. 프로젝트 폴더에 폰트 파일이 있으면 우선 사용
-    for fname in ["NanumGothic.ttf", "malgun.ttf", "AppleGothic.ttf"]:
-        if os.path.exists(fname):
-            return pygame.font.Font(fname, size)
-    # 2. 시스템 폰트 탐색
-    try:
-        return pygame.font.SysFont("AppleGothic", size)  # macOS
-    except:
-        try:
-            return pygame.font.SysFont("Malgun Gothic", size)  # Windows
-        except:
-            return pygame.font.SysFont("NanumGothic", size)  # Linux
-
-# 사운드 로딩 함수
-def load_sound(filename):
-    try:
-        return pygame.mixer.Sound(str(pathlib.Path('sounds')/filename))
-    except Exception:
-        return None
-
-# 효과음 로딩
-shoot_sound = load_sound('shoot.wav')
-explosion_sound = load_sound('explosion.wav')
-item_sound = load_sound('item.wav')
-bomb_sound = load_sound('bomb.wav')
-gameover_sound = load_sound('gameover.wav')
+    """한글 폰트 (AssetManager 캐시 사용)"""
+    return ASSETS.font(size)
+
+# 틱 입력 비트 (리플레이 기록 단위)
+# 누르고 있는 키(좌/우)와 이번 프레임에 눌린 키를 하나의 정수로 묶어 표현
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_SPACE = 4
+INPUT_RESTART = 8     # R키
+INPUT_NEXT = 16       # N키
+INPUT_PAUSE = 32      # P키
+INPUT_TUTORIAL = 64   # F1키
+
+KEYDOWN_BITS = {
+    pygame.K_SPACE: INPUT_SPACE,
+    pygame.K_r: INPUT_RESTART,
+    pygame.K_n: INPUT_NEXT,
+    pygame.K_p: INPUT_PAUSE,
+    pygame.K_F1: INPUT_TUTORIAL,
+}
+HELD_BITS = INPUT_LEFT | INPUT_RIGHT  # 누르고 있는 동안 매 틱 유지되는 입력 (나머지는 한 번만 전달)
+
+REPLAY_VERSION = 11  # 시뮬레이션 규칙/난수 사용 순서가 바뀌면 올림
+
+# 그리기 레이어 (숫자가 클수록 위에 그려짐)
+LAYER_BACKGROUND = 0  # 배경색 (LayeredDirty의 배경 Surface)
+LAYER_STARS = 1
+LAYER_SHIPS = 2       # 플레이어/적/트랙터 빔
+LAYER_BULLETS = 3     # 총알/아이템
+LAYER_EFFECTS = 4     # 폭발/쉴드/폭탄
+LAYER_HUD = 5
+
+# 틱 처리 단계 (순서대로 실행, 그리기는 프레임마다 한 번)
+PHASE_INPUT = 'input'
+PHASE_SPAWN = 'spawn'
+PHASE_MOVEMENT = 'movement'
+PHASE_COLLISION = 'collision'
+PHASE_EFFECTS = 'effects'
+PHASE_CLEANUP = 'cleanup'
+PHASE_RENDER = 'render'
+PHASES = (PHASE_INPUT, PHASE_SPAWN, PHASE_MOVEMENT, PHASE_COLLISION,
+          PHASE_EFFECTS, PHASE_CLEANUP, PHASE_RENDER)
+
+# 게임 시계
+def ms_to_ticks(ms):
+    """시뮬레이션 시간(ms)을 로직 틱 수로 변환"""
+    return max(1, round(ms * TICK_RATE / 1000))
+
+def per_tick(per_second):
+    """초당 이동량(px/초)을 틱당 이동량으로 변환"""
+    return per_second / TICK_RATE
+
+class SimClock:
+    """로직 틱마다 1/TICK_RATE초씩 진행하는 시뮬레이션 시계
+
+    모든 타이머가 실제 시간 대신 이 시계를 보므로, 그리기가 밀려도
+    게임 속도와 무적/쿨다운 시간이 함께 어긋나지 않는다.
+    """
+    def __init__(self, tick_rate=TICK_RATE):
+        self.tick_rate = tick_rate
+        self.tick = 0
+
+    def advance(self):
+        self.tick += 1
+
+    def now(self):
+        return self.tick * 1000 // self.tick_rate
+
+# 게임 스프라이트 공통 부모
+# 종류별 누적 스프라이트 생성 수 (프로파일러가 프레임마다 증가분을 기록)
+SPRITES_CREATED = collections.Counter()
+
+class GameSprite(pygame.sprite.DirtySprite):
+    """매 프레임 움직이거나 모양이 바뀌는 스프라이트 (항상 dirty로 다시 그림)"""
+    def __init__(self):
+        super().__init__()
+        SPRITES_CREATED[type(self).__name__] += 1
+        self.dirty = 2
+        self.prev_topleft = None  # 직전 틱 위치 (그리기 보간용)
 
 # 플레이어 우주선 클래스
-class Player(pygame.sprite.Sprite):
-    def __init__(self):
+class Player(GameSprite):
+    _layer = LAYER_SHIPS
+
+    def __init__(self, game):
         super().__init__()
+        self.game = game
         self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
         # 픽셀 아트 스타일 우주선
         pygame.draw.polygon(self.image, (0,255,0), [(20,2),(6,36),(34,36)])
@@ -133,9 +480,9 @@ class Player(pygame.sprite.Sprite):
         self.speed_x = 0
         self.lives = 3
         self.shoot_delay = 250
-        self.last_shot = pygame.time.get_ticks()
+        self.last_shot = game.now()
         self.invincible = True
-        self.invincible_timer = pygame.time.get_ticks()
+        self.invincible_timer = game.now()
         self.invincible_duration = 5000  # 게임 시작 시 5초 무적
         self.double_fire = False
         self.captured = False
@@ -143,25 +490,23 @@ class Player(pygame.sprite.Sprite):
 
     def update(self):
         self.speed_x = 0
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.speed_x = -5
-        if keys[pygame.K_RIGHT]:
-            self.speed_x = 5
+        if self.game.input_bits & INPUT_LEFT:
+            self.speed_x = -per_tick(PLAYER_SPEED)
+        if self.game.input_bits & INPUT_RIGHT:
+            self.speed_x = per_tick(PLAYER_SPEED)
         self.rect.x += self.speed_x
         if self.rect.left < 0:
             self.rect.left = 0
         if self.rect.right > SCREEN_WIDTH:
             self.rect.right = SCREEN_WIDTH
         # 무적 상태 해제
-        if self.invincible and pygame.time.get_ticks() - self.invincible_timer > self.invincible_duration:
+        if self.invincible and self.game.now() - self.invincible_timer > self.invincible_duration:
             self.invincible = False
 
     def shoot(self, bullets_group, all_sprites):
-        now = pygame.time.get_ticks()
+        now = self.game.now()
         if now - self.last_shot > self.shoot_delay:
-            if shoot_sound:
-                shoot_sound.play()
+            ASSETS.play('shoot')
             if self.double_fire:
                 bullet1 = Bullet(self.rect.centerx - 8, self.rect.top)
                 bullet2 = Bullet(self.rect.centerx + 8, self.rect.top)
@@ -174,7 +519,9 @@ class Player(pygame.sprite.Sprite):
             self.last_shot = now
 
 # 플레이어 총알 클래스
-class Bullet(pygame.sprite.Sprite):
+class Bullet(GameSprite):
+    _layer = LAYER_BULLETS
+
     def __init__(self, x, y):
         super().__init__()
         self.image = pygame.Surface((4, 12), pygame.SRCALPHA)
@@ -182,7 +529,7 @@ class Bullet(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.bottom = y
-        self.speed_y = -10
+        self.speed_y = -per_tick(BULLET_SPEED)
 
     def update(self):
         self.rect.y += self.speed_y
@@ -190,27 +537,25 @@ class Bullet(pygame.sprite.Sprite):
             self.kill()
 
 # 적 우주선 클래스
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, enemy_type, formation_pos):
+class Enemy(GameSprite):
+    _layer = LAYER_SHIPS
+
+    def __init__(self, slot, formation, game):
         super().__init__()
+        self.game = game
+        enemy_type = slot.enemy_type
         self.type = enemy_type['name']
         self.color = enemy_type['color']
         self.score = enemy_type['score']
         self.hp = enemy_type['hp']
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        # 픽셀 아트 스타일 적
-        if self.type == 'boss':
-            pygame.draw.rect(self.image, self.color, (4,4,24,24))
-            pygame.draw.rect(self.image, (255,255,255), (10,10,12,12))
-            pygame.draw.rect(self.image, (255,0,0), (14,18,4,6))
-        elif self.type == 'mid':
-            pygame.draw.rect(self.image, self.color, (6,6,20,20))
-            pygame.draw.rect(self.image, (255,255,255), (12,12,8,8))
-        else:
-            pygame.draw.rect(self.image, self.color, (8,8,16,16))
-            pygame.draw.rect(self.image, (255,255,255), (14,14,4,4))
+        # 같은 종류의 적은 픽셀 아트 이미지 하나를 공유
+        self.image = get_animation_frames('enemy', self.type)[0]
         self.rect = self.image.get_rect()
-        self.formation_x, self.formation_y = formation_pos
+        # 진형 원점 기준 고정 슬롯 (진형이 움직여도 바뀌지 않음)
+        self.formation = formation
+        self.col = slot.col
+        self.slot_x = slot.col * FORMATION_COL_SPACING
+        self.slot_y = slot.row * FORMATION_ROW_SPACING
         self.rect.x = self.formation_x
         self.rect.y = -40
         self.target_y = self.formation_y
@@ -221,44 +566,60 @@ class Enemy(pygame.sprite.Sprite):
         self.dive_radius = 0
         self.dive_center = (0, 0)
         self.dive_time = 0
-        # 기본 속도 제한 (더 느리게 시작)
-        self.dive_speed = 0.03 + random.random() * 0.02
-        self.dive_pattern = random.choice(['curve', 'zigzag'])
-        self.dive_cooldown = random.randint(400, 1000)
+        self.dive_speed = slot.dive_speed
+        self.dive_pattern = slot.dive_pattern
+        self.dive_cooldown = slot.dive_cooldown
         self.entrance = True
         self.tractor_beam_ready = False
-        self.tractor_beam_cooldown = random.randint(900, 1500)
+        self.tractor_beam_cooldown = slot.tractor_beam_cooldown
         self.tractor_beam_active = False
         self.tractor_beam = None
+        self.dive_timer = None  # game.scheduler에 예약된 돌진 타이머
+        self.beam_timer = None  # game.scheduler에 예약된 트랙터 빔 타이머
+        self.beam_ready_tick = None  # 빔 쿨다운이 끝나는 스케줄러 틱
         self.capturing = False
         self.returning_to_formation = False  # 진형으로 복귀 중인지 여부
-        self.return_speed = 5  # 진형 복귀 속도
+        self.return_speed = per_tick(ENEMY_RETURN_SPEED)  # 진형 복귀 속도
+
+    @property
+    def formation_x(self):
+        """현재 진형 원점 기준 자기 슬롯의 x 위치"""
+        return self.formation.origin_x + self.slot_x
+
+    @property
+    def formation_y(self):
+        """현재 진형 원점 기준 자기 슬롯의 y 위치"""
+        return self.formation.origin_y + self.slot_y
 
     def update(self):
+        game = self.game
+        rng = game.rng
+        wave = game.wave
         if self.entrance:
-            self.rect.y += 4
+            self.rect.x = self.formation_x  # 내려오는 동안에도 진형과 함께 좌우 이동
+            self.rect.y += per_tick(ENEMY_ENTRANCE_SPEED)
             if self.rect.y >= self.target_y:
                 self.rect.y = self.target_y
                 self.entrance = False
-                self.in_formation = True
+                self.join_formation()
             return
-            
+
         # 진형 복귀 중인 경우 처리
         if self.returning_to_formation:
             # x, y 방향으로 진형 위치로 이동
             dx = self.formation_x - self.rect.x
             dy = self.formation_y - self.rect.y
             dist = math.sqrt(dx*dx + dy*dy)
-            
+
             # 플레이어 영역 피하기
             player_area_top = SCREEN_HEIGHT - 120
-            
+
             # 진형 위치에 도달했거나 매우 가까울 경우
             if dist < self.return_speed:
                 self.rect.x = self.formation_x
                 self.rect.y = self.formation_y
                 self.returning_to_formation = False
-                self.in_formation = True
+                self.join_formation()
             else:
                 # 플레이어 영역 접근 시 우회 경로 설정
                 if self.rect.y > player_area_top:
@@ -267,15 +628,15 @@ class Enemy(pygame.sprite.Sprite):
                         target_x = 20  # 왼쪽 가장자리로
                     else:
                         target_x = SCREEN_WIDTH - 20  # 오른쪽 가장자리로
-                        
+
                     dx_edge = target_x - self.rect.x
                     dy_edge = -50  # 위로 이동
                     edge_dist = math.sqrt(dx_edge*dx_edge + 50*50)
-                    
+
                     if edge_dist > 0:
                         ratio = self.return_speed / edge_dist
                         self.rect.x += dx_edge * ratio
-                        self.rect.y += -7  # 빠르게 위로 이동
+                        self.rect.y -= per_tick(ENEMY_RETURN_CLIMB_SPEED)  # 빠르게 위로 이동
                 else:
                     # 정상적으로 진형으로 복귀
                     if dist > 0:
@@ -283,61 +644,16 @@ class Enemy(pygame.sprite.Sprite):
                         self.rect.x += dx * ratio
                         self.rect.y += dy * ratio
             return
-            
+
         if self.in_formation:
+            # 진형 대기 중에는 위치만 맞춤 (돌진/트랙터 빔은 game.scheduler 타이머가 시작)
             self.rect.x = self.formation_x
             self.rect.y = self.formation_y
-            
-            # 현재 시간 체크 - 스테이지 시작 직후에는 돌진 준비 안 함
-            current_time = pygame.time.get_ticks()
-            is_startup_period = current_time - stage_start_time < missile_cooldown_duration
-            
-            # 보스 트랙터 빔 준비 (스테이지 시작 3초 후부터)
-            if not is_startup_period and self.type == 'boss':
-                self.tractor_beam_cooldown -= 1
-                if self.tractor_beam_cooldown <= 0 and not self.tractor_beam_active and random.random() < 0.01 + 0.002*wave:
-                    self.tractor_beam_active = True
-                    self.tractor_beam = TractorBeam(self)
-                    all_sprites.add(self.tractor_beam)
-                    tractor_beams_group.add(self.tractor_beam)
-                    self.tractor_beam_cooldown = random.randint(900, 1800)
-                    
-            # 돌진 패턴 준비 (스테이지 시작 3초 후부터)
-            if not is_startup_period:
-                self.dive_cooldown -= 1
-                if self.dive_cooldown <= 0 and random.random() < 0.01 + 0.003*wave:
-                    self.in_formation = False
-                    self.dive_angle = math.pi/2
-                    self.dive_radius = 0
-                    self.dive_center = (self.rect.centerx, self.rect.centery)
-                    self.dive_time = 0
-                    
-                    # 돌진 시작 방향 결정 - 화면 좌/우측 선택
-                    if random.random() < 0.5:
-                        # 좌측으로 시작
-                        target_x = FORMATION_LEFT - 20
-                    else:
-                        # 우측으로 시작
-                        target_x = FORMATION_RIGHT + 20
-                        
-                    # 플레이어 영역 피하기 위한 목표 y값 설정
-                    target_y = random.randint(FORMATION_TOP, SCREEN_HEIGHT - 200)
-                    
-                    # 목표 지점 향하는 벡터 설정
-                    dx = target_x - self.rect.centerx
-                    dy = target_y - self.rect.centery
-                    self.dive_direction = (dx, dy)
-                    
-                    # 스테이지가 높을수록 다양한 돌진 패턴 등장
-                    patterns = ['curve', 'zigzag']
-                    if wave >= 3:
-                        patterns.append('spiral')
-                    self.dive_pattern = random.choice(patterns)
         else:
             # 돌진 중 속도 제한
             max_time_increment = min(0.08, self.dive_speed)
             self.dive_time += max_time_increment
-            
+
             if self.dive_pattern == 'curve':
                 # 커브 패턴 수정 - 플레이어 영역 침범 방지
                 self.rect.x = int(self.dive_center[0] + 100 * math.cos(self.dive_angle + self.dive_time))
@@ -355,32 +671,122 @@ class Enemy(pygame.sprite.Sprite):
                 # 나선형 패턴 수정 - 플레이어 영역 침범 방지
                 r = 40 + 8*self.dive_time
                 self.rect.x = int(self.dive_center[0] + r * math.cos(self.dive_angle + self.dive_time))
-                
+
                 # y 방향 계산 후 최대값 제한
                 y_offset = r * math.sin(self.dive_angle + self.dive_time)
                 max_allowed_y = SCREEN_HEIGHT - 150
                 self.rect.y = int(min(self.dive_center[1] + y_offset, max_allowed_y))
-            # 돌진 중 총알 발사(보스/중간 적만)
-            if self.type in ['boss', 'mid'] and random.random() < DIFFICULTY_CONFIG['missile_base_chance'] + DIFFICULTY_CONFIG['missile_per_wave']*wave:
-                bullet = EnemyBullet(self.rect.centerx, self.rect.bottom)
-                all_sprites.add(bullet)
-                enemy_bullets_group.add(bullet)
+            # 돌진 중 총알 발사(보스/중간 적만)는 FireScheduler가 처리
             # 화면 밖으로 나가거나 돌진 시간이 길어지면 진형으로 복귀
-            if (self.rect.top > SCREEN_HEIGHT or 
-                self.rect.bottom < -50 or 
-                self.rect.left < -50 or 
+            if (self.rect.top > SCREEN_HEIGHT or
+                self.rect.bottom < -50 or
+                self.rect.left < -50 or
                 self.rect.right > SCREEN_WIDTH + 50 or
                 self.dive_time > 12 or  # 돌진 최대 시간 제한
                 # 추가: 플레이어 영역에 도달하면 즉시 진형으로 복귀
                 self.rect.bottom > SCREEN_HEIGHT - 120):  # 플레이어 위치보다 위쪽
-                
+
                 # 돌진 종료 후 진형으로 복귀 시작
                 self.returning_to_formation = True
                 self.in_formation = False
-                self.dive_cooldown = max(100, random.randint(300, 800) - wave*20)
+                self.dive_cooldown = max(100, rng.randint(300, 800) - wave*20)
                 self.tractor_beam_active = False
                 self.tractor_beam = None
 
+    def join_formation(self):
+        """진형 대기 상태로 전환하고 돌진/트랙터 빔 타이머 예약 (이미 예약돼 있으면 유지)
+
+        기존에는 진형의 적이 매 틱 쿨다운을 1씩 줄이고, 0 이하가 되면 매 틱
+        확률로 돌진/빔을 시도했다. 같은 분포로 '남은 쿨다운 + 기하분포 대기'
+        틱 뒤에 한 번만 깨어나도록 예약한다.
+        """
+        self.in_formation = True
+        game = self.game
+        if self.dive_timer is None:
+            delay = max(self.dive_cooldown, 1) + sample_ticks_until(game.rng, 0.01 + 0.003*game.wave) - 1
+            self.dive_timer = game.scheduler.call_later(delay, self.on_dive_timer)
+        if self.type == 'boss' and self.beam_timer is None and not self.tractor_beam_active:
+            self.beam_ready_tick = game.scheduler.tick + self.tractor_beam_cooldown
+            delay = max(self.tractor_beam_cooldown, 1) + sample_ticks_until(game.rng, 0.01 + 0.002*game.wave) - 1
+            self.beam_timer = game.scheduler.call_later(delay, self.on_beam_timer)
+
+    def cancel_timers(self):
+        """예약된 돌진/빔 타이머 취소 (남은 빔 쿨다운은 다음 진형 합류 때 이어서 사용)"""
+        if self.dive_timer is not None:
+            self.dive_timer.cancel()
+            self.dive_timer = None
+        if self.beam_timer is not None:
+            self.beam_timer.cancel()
+            self.beam_timer = None
+        if self.beam_ready_tick is not None:
+            self.tractor_beam_cooldown = max(0, self.beam_ready_tick - self.game.scheduler.tick)
+            self.beam_ready_tick = None
+
+    def on_dive_timer(self):
+        """돌진 타이머 만료: 진형에 자리 잡은 상태면 돌진 시작"""
+        self.dive_timer = None
+        if not self.in_formation or self.entrance or self.returning_to_formation:
+            return  # 진형에 다시 합류할 때 새로 예약됨
+        self.start_dive()
+
+    def on_beam_timer(self):
+        """트랙터 빔 타이머 만료: 보스가 진형에 있으면 빔 발사"""
+        self.beam_timer = None
+        if not self.in_formation or self.entrance or self.returning_to_formation or self.tractor_beam_active:
+            return
+        game = self.game
+        self.tractor_beam_active = True
+        self.tractor_beam = TractorBeam(self)
+        game.all_sprites.add(self.tractor_beam)
+        game.tractor_beams_group.add(self.tractor_beam)
+        # 빔은 돌진이 끝날 때까지 활성 상태이므로 다음 예약은 진형 재합류 때 함
+        self.tractor_beam_cooldown = game.rng.randint(900, 1800)
+        self.beam_ready_tick = game.scheduler.tick + self.tractor_beam_cooldown
+
+    def start_dive(self):
+        """진형을 떠나 돌진 패턴 시작"""
+        rng = self.game.rng
+        wave = self.game.wave
+        self.cancel_timers()
+        self.in_formation = False
+        self.dive_angle = math.pi/2
+        self.dive_radius = 0
+        self.dive_center = (self.rect.centerx, self.rect.centery)
+        self.dive_time = 0
+
+        # 돌진 시작 방향 결정 - 화면 좌/우측 선택
+        if rng.random() < 0.5:
+            # 좌측으로 시작
+            target_x = FORMATION_LEFT - 20
+        else:
+            # 우측으로 시작
+            target_x = FORMATION_RIGHT + 20
+
+        # 플레이어 영역 피하기 위한 목표 y값 설정
+        target_y = rng.randint(FORMATION_TOP, SCREEN_HEIGHT - 200)
+
+        # 목표 지점 향하는 벡터 설정
+        dx = target_x - self.rect.centerx
+        dy = target_y - self.rect.centery
+        self.dive_direction = (dx, dy)
+
+        # 스테이지가 높을수록 다양한 돌진 패턴 등장
+        patterns = ['curve', 'zigzag']
+        if wave >= 3:
+            patterns.append('spiral')
+        self.dive_pattern = rng.choice(patterns)
+
+    def kill(self):
+        """제거될 때 예약된 타이머 취소 및 진형 열 점유 해제 (O(1))"""
+        self.cancel_timers()
+        if self.alive():
+            self.formation.remove(self)
+        super().kill()
+
+    def is_diving(self):
+        """진형 밖에서 돌진 패턴으로 움직이는 중인지 여부 (등장/복귀 중 제외)"""
+        return not (self.entrance or self.in_formation or self.returning_to_formation)
+
     def hit(self):
         self.hp -= 1
         if self.hp <= 0:
@@ -388,26 +794,283 @@ class Enemy(pygame.sprite.Sprite):
             return True
         return False
 
-# 적 총알 클래스
-class EnemyBullet(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((4, 12), pygame.SRCALPHA)
-        pygame.draw.rect(self.image, (255,0,0), (0,0,4,12))
-        self.rect = self.image.get_rect()
-        self.rect.centerx = x
-        self.rect.top = y
-        self.speed_y = 3 + wave * 0.3  # 스테이지가 올라갈수록 조금씩 빨라짐 (최대 속도 제한)
-        if self.speed_y > 6:  # 최대 속도 제한
-            self.speed_y = 6
+# 적 총알 (NumPy 배열 기반)
+BULLET_MISSILE = 0  # 아래로 떨어지는 기본 총알 (4x12 빨간 막대)
+BULLET_ORB = 1      # 탄막 모드의 둥근 총알 (6x6)
+BULLET_SIZES = np.array([(4, 12), (6, 6)], dtype=np.float64)
+ENEMY_BULLET_LIFETIME = 10000  # ms, 화면 안을 맴도는 총알도 이 시간이 지나면 제거
+BULLET_IMAGES = []
+
+def get_bullet_images():
+    """총알 종류별 공용 이미지 (처음 호출 때 한 번만 생성)"""
+    if not BULLET_IMAGES:
+        missile = pygame.Surface((4, 12), pygame.SRCALPHA)
+        pygame.draw.rect(missile, (255, 0, 0), (0, 0, 4, 12))
+        orb = pygame.Surface((6, 6), pygame.SRCALPHA)
+        pygame.draw.circle(orb, (255, 90, 200), (3, 3), 3)
+        pygame.draw.circle(orb, (255, 230, 250), (3, 3), 1)
+        BULLET_IMAGES.extend([missile, orb])
+    return BULLET_IMAGES
+
+class EnemyBulletField:
+    """적 총알 전체를 위치/속도/남은 수명 배열로 관리
+
+    총알마다 스프라이트를 만들지 않고 배열 연산 한 번으로 전체를 이동,
+    화면 밖/수명 만료 제거, 플레이어 충돌 판정을 한다. 좌표는 총알 이미지의
+    왼쪽 위 모서리 기준이다. 살아 있는 총알은 항상 배열 앞쪽 count개에
+    생성 순서대로 모여 있다 (리플레이 결정성).
+    """
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+
+    def arrays(self):
+        """총알 속성 배열 전체 (같은 인덱스가 같은 총알)"""
+        return (self.x, self.y, self.vx, self.vy, self.life, self.kind)
+
+    def reserve(self, extra):
+        """extra개를 더 넣을 수 있도록 배열 크기를 두 배씩 늘림"""
+        needed = self.count + extra
+        capacity = len(self.x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('x', 'y', 'vx', 'vy', 'life', 'kind'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y, vx, vy, kind=BULLET_MISSILE, life=None):
+        """총알 추가 (x, y, vx, vy는 스칼라 또는 같은 길이의 배열, 중심 좌표/틱당 속도)"""
+        x, y, vx, vy = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (x, y, vx, vy)))
+        n = x.size
+        if n == 0:
+            return
+        self.reserve(n)
+        w, h = BULLET_SIZES[kind]
+        i, j = self.count, self.count + n
+        self.x[i:j] = x.ravel() - w / 2
+        self.y[i:j] = y.ravel() - h / 2
+        self.vx[i:j] = vx.ravel()
+        self.vy[i:j] = vy.ravel()
+        self.life[i:j] = life if life is not None else ms_to_ticks(ENEMY_BULLET_LIFETIME)
+        self.kind[i:j] = kind
+        self.count = j
+
+    def compact(self, keep):
+        """keep이 True인 총알만 순서를 유지한 채 앞으로 모음"""
+        index = np.flatnonzero(keep)
+        if len(index) == self.count:
+            return
+        n = len(index)
+        for arr in self.arrays():
+            arr[:n] = arr[index]
+        self.count = n
 
     def update(self):
-        self.rect.y += self.speed_y
-        if self.rect.top > SCREEN_HEIGHT:
-            self.kill()
+        """1틱 이동 후 화면 밖으로 나갔거나 수명이 끝난 총알 제거"""
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        life = self.life[:n]
+        life -= 1
+        size = BULLET_SIZES[self.kind[:n]]
+        keep = ((life > 0) & (y < SCREEN_HEIGHT) & (y + size[:, 1] > 0) &
+                (x < SCREEN_WIDTH) & (x + size[:, 0] > 0))
+        self.compact(keep)
+
+    def hit_mask_rect(self, rect):
+        """rect와 겹치는 총알 마스크"""
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        size = BULLET_SIZES[self.kind[:n]]
+        return ((x < rect.right) & (x + size[:, 0] > rect.left) &
+                (y < rect.bottom) & (y + size[:, 1] > rect.top))
+
+    def hit_mask_circle(self, center, radius):
+        """총알 사각형이 원(center, radius)과 겹치는지 마스크"""
+        n = self.count
+        cx, cy = center
+        size = BULLET_SIZES[self.kind[:n]]
+        x, y = self.x[:n], self.y[:n]
+        # 원 중심에서 가장 가까운 사각형 위의 점까지 거리
+        dx = np.clip(cx, x, x + size[:, 0]) - cx
+        dy = np.clip(cy, y, y + size[:, 1]) - cy
+        return dx * dx + dy * dy <= radius * radius
+
+    def collide_rect(self, rect):
+        """rect와 겹친 총알을 제거하고 개수 반환"""
+        if self.count == 0:
+            return 0
+        hit = self.hit_mask_rect(rect)
+        hits = int(np.count_nonzero(hit))
+        if hits:
+            self.compact(~hit)
+        return hits
+
+    def collide_circle(self, center, radius):
+        """원과 겹친 총알을 제거하고 개수 반환 (쉴드)"""
+        if self.count == 0:
+            return 0
+        hit = self.hit_mask_circle(center, radius)
+        hits = int(np.count_nonzero(hit))
+        if hits:
+            self.compact(~hit)
+        return hits
+
+    def clear(self):
+        """모든 총알 제거 (스테이지 시작/재시작)"""
+        self.count = 0
+
+    def blit_sequence(self, alpha=1.0):
+        """Surface.blits()에 넘길 (이미지, 위치) 목록 (alpha로 직전 틱 위치와 보간)"""
+        n = self.count
+        if n == 0:
+            return []
+        back = 1.0 - alpha
+        xs = (self.x[:n] - self.vx[:n] * back).round().astype(np.int32).tolist()
+        ys = (self.y[:n] - self.vy[:n] * back).round().astype(np.int32).tolist()
+        images = get_bullet_images()
+        return list(zip(map(images.__getitem__, self.kind[:n].tolist()), zip(xs, ys)))
+
+    def state_bytes(self):
+        """리플레이 해시용 총알 상태 (정수 좌표)"""
+        n = self.count
+        return (np.round(self.x[:n]).astype(np.int32).tobytes() +
+                np.round(self.y[:n]).astype(np.int32).tobytes() + self.kind[:n].tobytes())
+
+    def __len__(self):
+        """살아 있는 총알 수"""
+        return self.count
+
+# 적 총알 발사 스케줄러
+FIRE_RANDOM = 'random'  # 진형 밖의 모든 적: 틱마다 missile_base_chance
+FIRE_DIVE = 'dive'      # 돌진 중인 보스/중간 적: 틱마다 missile_base_chance + missile_per_wave*wave
+
+def sample_ticks_until(rng, chance):
+    """매 틱 확률 chance로 성공하는 시행에서 다음 성공까지의 틱 수 (기하분포, 1 이상)"""
+    if chance <= 0:
+        return math.inf
+    if chance >= 1:
+        return 1
+    return 1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - chance))
+
+class FireScheduler:
+    """적 총알 발사 시각을 미리 뽑아 두고 우선순위 큐(힙)로 관리
+
+    기존에는 매 틱 적마다 난수를 뽑아 확률 p로 발사했다. 매 틱 독립인 시행에서
+    다음 성공까지의 틱 수는 기하분포를 따르므로, 적마다 다음 발사 틱만 뽑아
+    힙에 넣어 두고 그 틱이 된 적만 꺼내 발사 조건(돌진 중, 총알 수 제한, 시작
+    직후 금지)을 확인한다. 조건이 맞지 않으면 그 발사만 버리고 다음 시각을 다시
+    뽑으므로, 조건을 만족하는 틱마다 확률 p로 쏘던 것과 분포가 같다.
+    """
+    def __init__(self, game):
+        self.game = game
+        self.queues = {FIRE_RANDOM: [], FIRE_DIVE: []}
+        self.seq = 0  # 같은 틱에 겹친 발사의 순서를 고정 (리플레이 결정성)
+
+    def reset(self):
+        """예약된 발사를 모두 취소 (스테이지 교체 시)"""
+        for queue in self.queues.values():
+            queue.clear()
+
+    def add(self, enemy):
+        """새로 배치된 적의 첫 발사 시각 예약"""
+        difficulty = self.game.config['difficulty']
+        scale = self.game.config['bullet_hell']['fire_chance_scale'] if self.game.bullet_hell else 1.0
+        self.schedule(FIRE_RANDOM, enemy, difficulty['missile_base_chance'] * scale)
+        if enemy.type in ('boss', 'mid'):
+            dive_chance = difficulty['missile_base_chance'] + difficulty['missile_per_wave'] * self.game.wave
+            self.schedule(FIRE_DIVE, enemy, dive_chance * scale)
+
+    def schedule(self, kind, enemy, chance):
+        ticks = sample_ticks_until(self.game.rng, chance)
+        if ticks == math.inf:
+            return
+        self.seq += 1
+        heapq.heappush(self.queues[kind], (self.game.clock.tick + ticks, self.seq, enemy, chance))
+
+    def due(self, kind):
+        """이번 틱에 발사 차례가 된 살아 있는 적 목록 (다음 발사 시각은 바로 다시 예약)"""
+        queue = self.queues[kind]
+        tick = self.game.clock.tick
+        enemies = []
+        while queue and queue[0][0] <= tick:
+            _, _, enemy, chance = heapq.heappop(queue)
+            if not enemy.alive():
+                continue  # 죽은 적의 예약은 여기서 버림
+            enemies.append(enemy)
+            self.schedule(kind, enemy, chance)
+        return enemies
+
+    def __len__(self):
+        return sum(len(queue) for queue in self.queues.values())
+
+# 중앙 틱 스케줄러
+class Timer:
+    """TickScheduler에 예약된 콜백 하나 (cancel()은 표시만 하므로 O(1))"""
+    __slots__ = ('due', 'callback', 'cancelled')
+
+    def __init__(self, due, callback):
+        self.due = due
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TickScheduler:
+    """틱 단위 타이머를 힙 하나로 관리하는 게임 공용 스케줄러
+
+    advance()를 부른 틱만 시간이 흐른다. 게임은 스테이지 시작 직후 금지
+    기간에는 advance()를 부르지 않으므로, 그 기간만큼 모든 타이머가 한꺼번에
+    뒤로 밀린다. 취소된 타이머는 만료 시각에 힙에서 꺼낼 때 버린다.
+    """
+    def __init__(self):
+        self.tick = 0
+        self.heap = []
+        self.seq = 0  # 같은 틱 타이머의 실행 순서 고정 (리플레이 결정성)
+        self.fired = 0
+
+    def call_later(self, ticks, callback):
+        """ticks 틱 뒤에 callback 실행 예약 후 Timer 반환"""
+        timer = Timer(self.tick + max(1, ticks), callback)
+        self.seq += 1
+        heapq.heappush(self.heap, (timer.due, self.seq, timer))
+        return timer
+
+    def advance(self):
+        """1틱 진행하고 만료된 타이머 실행"""
+        self.tick += 1
+        heap = self.heap
+        while heap and heap[0][0] <= self.tick:
+            timer = heapq.heappop(heap)[2]
+            if timer.cancelled:
+                continue
+            self.fired += 1
+            timer.callback()
+
+    def clear(self):
+        """예약된 타이머 모두 제거"""
+        self.heap.clear()
+
+    def __len__(self):
+        return len(self.heap)
 
 # 트랙터 빔 클래스
-class TractorBeam(pygame.sprite.Sprite):
+class TractorBeam(GameSprite):
+    _layer = LAYER_SHIPS
+
     def __init__(self, enemy):
         super().__init__()
         self.enemy = enemy
@@ -417,7 +1080,7 @@ class TractorBeam(pygame.sprite.Sprite):
         self.rect.centerx = enemy.rect.centerx
         self.rect.top = enemy.rect.bottom
         self.active = True
-        self.timer = 120  # 2초
+        self.timer = ms_to_ticks(TRACTOR_BEAM_DURATION)  # 남은 틱 수
 
     def update(self):
         self.rect.centerx = self.enemy.rect.centerx
@@ -427,112 +1090,286 @@ class TractorBeam(pygame.sprite.Sprite):
             self.active = False
             self.kill()
 
+# 그래픽 품질 단계 (0이 최고 품질, 숫자가 클수록 그리기 작업을 줄임)
+# 화면에 보이는 것만 바뀌고 게임 진행(리플레이 결과)에는 영향이 없다.
+QUALITY_LEVELS = (
+    {'stars': 1.0, 'explosion_frames': 3, 'bomb_layers': 3, 'hud_interval': 1},
+    {'stars': 0.5, 'explosion_frames': 3, 'bomb_layers': 2, 'hud_interval': 2},
+    {'stars': 0.25, 'explosion_frames': 2, 'bomb_layers': 1, 'hud_interval': 4},
+    {'stars': 0.0, 'explosion_frames': 1, 'bomb_layers': 1, 'hud_interval': 8},
+)
+# 현재 적용 중인 품질 설정 (QualityGovernor가 바꾸고 렌더러/이펙트가 읽음)
+GRAPHICS = dict(QUALITY_LEVELS[0], level=0)
+
+# 이펙트 애니메이션 프레임 캐시
+ANIMATION_FRAMES = {}
+# 서로 다른 폭발 이미지 수별 프레임 순서
+EXPLOSION_FRAME_ORDER = {3: (0, 1, 2, 2), 2: (0, 0, 2, 2), 1: (0, 0, 0, 0)}
+BOMB_RADII = (200, 150, 100)
+BOMB_TICKS = ms_to_ticks(BOMB_DURATION)
+BOMB_FRAME_INTERVAL = ms_to_ticks(BOMB_DURATION / BOMB_FRAME_COUNT)  # 폭탄 이펙트 프레임 교체 간격 (틱)
+
+def build_enemy_frames(kind):
+    """적 종류별 픽셀 아트 이미지 (한 프레임)"""
+    image = pygame.Surface((32, 32), pygame.SRCALPHA)
+    if kind == 'boss':
+        pygame.draw.rect(image, BLUE, (4,4,24,24))
+        pygame.draw.rect(image, (255,255,255), (10,10,12,12))
+        pygame.draw.rect(image, (255,0,0), (14,18,4,6))
+    elif kind == 'mid':
+        pygame.draw.rect(image, RED, (6,6,20,20))
+        pygame.draw.rect(image, (255,255,255), (12,12,8,8))
+    else:
+        pygame.draw.rect(image, YELLOW, (8,8,16,16))
+        pygame.draw.rect(image, (255,255,255), (14,14,4,4))
+    return [image]
+
+def build_explosion_frames(distinct=3):
+    """폭발 애니메이션 4프레임 (마지막 프레임은 3번째와 같은 이미지)
+
+    distinct가 3보다 작으면 서로 다른 이미지를 그 수만큼만 써서 프레임이
+    바뀌어도 다시 그리지 않는 구간을 늘린다 (프레임 수/길이는 같음).
+    """
+    images = []
+    for circles in ([((255,255,0), 16), ((255,0,0), 10)],
+                    [((255,255,0), 12)],
+                    [((255,0,0), 8)]):
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        for color, radius in circles:
+            pygame.draw.circle(image, color, (16,16), radius)
+        images.append(image)
+    return [images[i] for i in EXPLOSION_FRAME_ORDER[distinct]]
+
+def build_bomb_frames(layers=3):
+    """폭탄 이펙트 프레임 (처음 이미지 + 5프레임마다 옅어지는 알파 단계)
+
+    원이 그려지는 영역(지름 400)만 Surface로 만들어 전체 화면 크기 할당을 피한다.
+    layers를 줄이면 바깥쪽 원부터 빼고 Surface도 남은 원 크기로 줄인다.
+    """
+    radii = BOMB_RADII[-layers:]
+    size = radii[0] * 2
+    center = (size//2, size//2)
+    colors = ((255, 0, 255), (255, 0, 0), (255, 255, 0))[-layers:]
+    alpha_steps = [(100, 80, 60)]
+    elapsed = BOMB_FRAME_INTERVAL
+    while elapsed < BOMB_TICKS:
+        # 시간이 지날수록 옅어짐 (지속 시간 끝에서 최소 30)
+        alpha = max(30, round(100 - 90 * elapsed / BOMB_TICKS))
+        alpha_steps.append((alpha, alpha, alpha))
+        elapsed += BOMB_FRAME_INTERVAL
+    frames = []
+    for alphas in alpha_steps:
+        image = pygame.Surface((size, size), pygame.SRCALPHA)
+        for color, alpha, radius in zip(colors, alphas[-layers:], radii):
+            pygame.draw.circle(image, color + (alpha,), center, radius)
+        frames.append(image)
+    return frames
+
+ANIMATION_BUILDERS = {
+    'enemy': build_enemy_frames,
+    'explosion': build_explosion_frames,
+    'bomb': build_bomb_frames,
+}
+
+def get_animation_frames(name, *variant):
+    """이펙트 애니메이션 프레임 목록 (처음 요청할 때 한 번만 그려서 모든 스프라이트가 공유)
+
+    variant는 빌더에 넘기는 품질 인자 (예: 폭탄 원 개수)로, 조합마다 따로 캐시한다.
+    """
+    key = (name,) + variant
+    frames = ANIMATION_FRAMES.get(key)
+    if frames is None:
+        frames = ANIMATION_FRAMES[key] = ANIMATION_BUILDERS[name](*variant)
+    return frames
+
 # 폭발 애니메이션
-class Explosion(pygame.sprite.Sprite):
-    def __init__(self, center):
+class Explosion(GameSprite):
+    _layer = LAYER_EFFECTS
+
+    def __init__(self, center, game):
         super().__init__()
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
-        # 픽셀 아트 폭발
-        pygame.draw.circle(self.image, (255,255,0), (16,16), 16)
-        pygame.draw.circle(self.image, (255,0,0), (16,16), 10)
+        self.game = game
+        self.frames = get_animation_frames('explosion', GRAPHICS['explosion_frames'])
+        self.image = self.frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = center
+        self.dirty = 1  # 제자리 이펙트: 프레임이 바뀔 때만 다시 그림
         self.frame = 0
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = game.now()
         self.frame_rate = 40
 
     def update(self):
-        now = pygame.time.get_ticks()
+        now = self.game.now()
         if now - self.last_update > self.frame_rate:
             self.frame += 1
             self.last_update = now
-            if self.frame == 1:
-                self.image.fill((0,0,0,0))
-                pygame.draw.circle(self.image, (255,255,0), (16,16), 12)
-            elif self.frame == 2:
-                self.image.fill((0,0,0,0))
-                pygame.draw.circle(self.image, (255,0,0), (16,16), 8)
-            elif self.frame > 3:
+            if self.frame >= len(self.frames):
                 self.kill()
+            else:
+                # 품질 단계에 따라 같은 이미지가 이어지면 다시 그리지 않음
+                image = get_animation_frames('explosion', GRAPHICS['explosion_frames'])[self.frame]
+                if image is not self.image:
+                    self.image = image
+                    self.dirty = 1
 
 # 진형 전체 이동 로직
-def update_formation(formation, move_state):
-    # in_formation인 적이 없으면 이동 건너뜀
-    if not formation:  # 빈 리스트인 경우 처리
-        return
-    
-    in_formation_enemies = [e for e in formation if e.in_formation]
-    if not in_formation_enemies:
-        return
-    min_x = min(e.formation_x for e in in_formation_enemies)
-    max_x = max(e.formation_x for e in in_formation_enemies)
-    
-    # 좌우 이동만 수행 (아래로 내려가지 않음)
-    if (move_state['dir'] == 1 and max_x + FORMATION_MOVE_X > FORMATION_RIGHT) or (move_state['dir'] == -1 and min_x - FORMATION_MOVE_X < FORMATION_LEFT):
-        # 방향 전환
-        move_state['dir'] *= -1
-    else:
-        for e in in_formation_enemies:
-            e.formation_x += FORMATION_MOVE_X * move_state['dir']
+class Formation:
+    """적 진형: 움직이는 원점 하나와 적별 고정 슬롯 오프셋
+
+    진형 이동은 원점 좌표 하나만 바꾸고, 각 적은 원점 + 오프셋을 자기 자리로
+    본다. 좌우 경계 판정용으로 열마다 살아 있는 적 수를 세어 두고, 적이 죽을
+    때만 양 끝 열 범위를 줄이므로 매 틱 min/max를 다시 구하지 않는다.
+    """
+    def __init__(self, cols):
+        self.origin_x = FORMATION_START_X
+        self.origin_y = FORMATION_TOP
+        self.dir = 1
+        self.column_counts = [0] * cols
+        self.min_col = cols  # 적이 하나도 없으면 min_col > max_col
+        self.max_col = -1
+        self.count = 0
+
+    def add(self, enemy):
+        """적 슬롯 등록 (열 점유 수와 양 끝 열 갱신)"""
+        self.column_counts[enemy.col] += 1
+        self.min_col = min(self.min_col, enemy.col)
+        self.max_col = max(self.max_col, enemy.col)
+        self.count += 1
+
+    def remove(self, enemy):
+        """적이 죽었을 때 열 점유 해제 (끝 열이 비면 경계를 안쪽으로 당김)"""
+        counts = self.column_counts
+        counts[enemy.col] -= 1
+        self.count -= 1
+        # 경계는 한 방향으로만 줄어들므로 스테이지 전체에서 합쳐 O(열 수)
+        while self.min_col <= self.max_col and counts[self.min_col] == 0:
+            self.min_col += 1
+        while self.max_col >= self.min_col and counts[self.max_col] == 0:
+            self.max_col -= 1
 
-# 웨이브 생성 함수 (formation 리스트 반환)
-def create_wave(wave, all_sprites, enemies_group):
-    formation = []
+    def update(self):
+        """진형 전체 좌우 이동 (경계에 닿으면 방향 전환, 아래로는 내려가지 않음)"""
+        if self.count == 0:
+            return
+        move_x = per_tick(FORMATION_SPEED)
+        min_x = self.origin_x + self.min_col * FORMATION_COL_SPACING
+        max_x = self.origin_x + self.max_col * FORMATION_COL_SPACING
+        if (self.dir == 1 and max_x + move_x > FORMATION_RIGHT) or (self.dir == -1 and min_x - move_x < FORMATION_LEFT):
+            # 방향 전환
+            self.dir *= -1
+        else:
+            self.origin_x += move_x * self.dir
+
+    def __len__(self):
+        return self.count
+
+# 웨이브 생성 함수 (Formation 반환)
+class EnemySlot:
+    """웨이브 설계도의 적 한 마리: 진형 칸, 종류, 돌진 속도/패턴/쿨다운"""
+    __slots__ = ('col', 'row', 'enemy_type', 'dive_speed', 'dive_pattern',
+                 'dive_cooldown', 'tractor_beam_cooldown')
+
+    def __init__(self, col, row, enemy_type, dive_speed, dive_pattern, dive_cooldown, tractor_beam_cooldown):
+        self.col = col
+        self.row = row
+        self.enemy_type = enemy_type
+        self.dive_speed = dive_speed
+        self.dive_pattern = dive_pattern
+        self.dive_cooldown = dive_cooldown
+        self.tractor_beam_cooldown = tractor_beam_cooldown
+
+def plan_wave(wave, config, rng):
+    """웨이브 설계도(진형 열 수, 적 칸 목록) 계산 (스프라이트/Surface는 만들지 않음)
+
+    galaga.json 설정과 난수 생성기만 쓰므로 배열 기반 시뮬레이션(galaga_vec.py)도 같은 웨이브를 만든다.
+    """
+    enemy_config = config['enemy']
+    difficulty = config['difficulty']
     # config 기반 적 수/배치/종류 변화
-    base_cols = ENEMY_CONFIG['base_cols']
-    max_cols = ENEMY_CONFIG['max_cols']
-    base_rows = ENEMY_CONFIG['base_rows']
-    max_rows = ENEMY_CONFIG['max_rows']
+    base_cols = enemy_config['base_cols']
+    max_cols = enemy_config['max_cols']
+    base_rows = enemy_config['base_rows']
+    max_rows = enemy_config['max_rows']
     cols = min(base_cols + wave//2, max_cols)
     rows = min(base_rows + (wave % 3), max_rows)
+    # 종류별 속성은 웨이브마다 한 번만 만들어 같은 종류의 적이 공유
+    enemy_types = {
+        name: {
+            'name': name,
+            'color': color,
+            'score': enemy_config[f'{name}_score'] + wave*10,
+            'hp': enemy_config[f'{name}_hp'] + wave//3,
+        }
+        for name, color in (('boss', BLUE), ('mid', RED), ('basic', YELLOW))
+    }
+    # 적 속도/공격 빈도 조절 - 웨이브에 따라 서서히 증가 (상한선 적용)
+    base_speed = 0.03 + min(0.02, 0.005 * wave)
+    max_speed = min(0.08, difficulty['dive_speed'] + (wave * difficulty['dive_speed_per_wave']))
+    # 돌진 빈도 점진적 증가
+    dive_cooldown = max(300, difficulty['dive_cooldown'] - min(300, wave*difficulty['dive_cooldown_per_wave']))
+    beam_cooldown = max(600, difficulty['tractor_cooldown'] - min(400, wave*difficulty['tractor_cooldown_per_wave']))
+    slots = []
     for i in range(cols):
         for j in range(rows):
             # 보스/중간/일반 적 비율 변화
             if j == 0:
-                if i % (4 - min(wave//3, 2)) == 0:
-                    enemy_type = {
-                        'name': 'boss',
-                        'color': BLUE,
-                        'score': ENEMY_CONFIG['boss_score'] + wave*10,
-                        'hp': ENEMY_CONFIG['boss_hp'] + wave//3
-                    }
-                else:
-                    enemy_type = {
-                        'name': 'mid',
-                        'color': RED,
-                        'score': ENEMY_CONFIG['mid_score'] + wave*10,
-                        'hp': ENEMY_CONFIG['mid_hp'] + wave//3
-                    }
+                name = 'boss' if i % (4 - min(wave//3, 2)) == 0 else 'mid'
             else:
-                enemy_type = {
-                    'name': 'basic',
-                    'color': YELLOW,
-                    'score': ENEMY_CONFIG['basic_score'] + wave*10,
-                    'hp': ENEMY_CONFIG['basic_hp'] + wave//3
-                }
-            x = 30 + i*35
-            y = FORMATION_TOP + j*32
-            enemy = Enemy(x, y, enemy_type, (x, y))
-            # 적 속도/공격 빈도 조절 - 웨이브에 따라 서서히 증가 (상한선 적용)
-            base_speed = 0.03 + min(0.02, 0.005 * wave)
-            max_speed = min(0.08, DIFFICULTY_CONFIG['dive_speed'] + (wave * DIFFICULTY_CONFIG['dive_speed_per_wave']))
-            enemy.dive_speed = base_speed + random.random() * (max_speed - base_speed)
-            # 돌진 빈도 점진적 증가
-            enemy.dive_cooldown = max(300, DIFFICULTY_CONFIG['dive_cooldown'] - min(300, wave*DIFFICULTY_CONFIG['dive_cooldown_per_wave']))
-            enemy.tractor_beam_cooldown = max(600, DIFFICULTY_CONFIG['tractor_cooldown'] - min(400, wave*DIFFICULTY_CONFIG['tractor_cooldown_per_wave']))
-            all_sprites.add(enemy)
-            enemies_group.add(enemy)
-            formation.append(enemy)
+                name = 'basic'
+            dive_pattern = rng.choice(['curve', 'zigzag'])
+            dive_speed = base_speed + rng.random() * (max_speed - base_speed)
+            slots.append(EnemySlot(i, j, enemy_types[name], dive_speed, dive_pattern, dive_cooldown, beam_cooldown))
+    return cols, slots
+
+class WaveBuilder:
+    """설계도대로 적을 조금씩 미리 만들어 두는 다음 웨이브 준비 작업
+
+    스테이지 클리어 화면이 떠 있는 동안 틱마다 build()로 몇 마리씩 만들고,
+    다음 스테이지로 넘어갈 때 spawn_wave()가 남은 적만 마저 만들어 그룹에
+    넣는다. 미리 만든 적은 아직 어떤 그룹에도 속하지 않으므로 게임 상태
+    (충돌/그리기/상태 해시)에 영향이 없다.
+    """
+    def __init__(self, wave, game):
+        self.wave = wave
+        self.game = game
+        cols, self.slots = plan_wave(wave, game.config, game.rng)
+        self.formation = Formation(cols)
+        self.enemies = []
+
+    @property
+    def done(self):
+        return len(self.enemies) == len(self.slots)
+
+    def build(self, limit=None):
+        """아직 만들지 않은 적을 최대 limit마리 (None이면 전부) 생성"""
+        start = len(self.enemies)
+        end = len(self.slots) if limit is None else min(len(self.slots), start + limit)
+        for slot in self.slots[start:end]:
+            self.enemies.append(Enemy(slot, self.formation, self.game))
+
+def spawn_wave(builder, all_sprites, enemies_group, game):
+    """준비한 웨이브의 적을 모두 그룹에 넣고 발사 시각을 예약한 뒤 진형 반환"""
+    builder.build()
+    formation = builder.formation
+    for enemy in builder.enemies:
+        game.fire_scheduler.add(enemy)
+        all_sprites.add(enemy)
+        enemies_group.add(enemy)
+        formation.add(enemy)
     return formation
 
+def create_wave(wave, all_sprites, enemies_group, game):
+    """지정한 웨이브의 적 진형을 바로 만들어 배치"""
+    return spawn_wave(WaveBuilder(wave, game), all_sprites, enemies_group, game)
+
 # 플레이어 포획/구출/더블 파이어 상태 관리
 def handle_player_capture(player, tractor_beams_group, all_sprites, explosions_group):
     if player.captured:
         # 포획된 상태: 플레이어를 위로 이동(적 방향)
-        player.rect.y -= 3
+        player.rect.y -= per_tick(CAPTURE_RISE_SPEED)
         if player.rect.bottom < 0:
             # 완전히 사라지면 목숨 감소, 플레이어 재생성
-            exp = Explosion(player.rect.center)
+            exp = Explosion(player.rect.center, player.game)
             all_sprites.add(exp)
             explosions_group.add(exp)
             player.lives -= 1
@@ -549,7 +1386,9 @@ def handle_player_capture(player, tractor_beams_group, all_sprites, explosions_g
                 break
 
 # 아이템 클래스
-class Item(pygame.sprite.Sprite):
+class Item(GameSprite):
+    _layer = LAYER_BULLETS
+
     def __init__(self, x, y, item_type):
         super().__init__()
         self.type = item_type['name']
@@ -559,7 +1398,7 @@ class Item(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.centerx = x
         self.rect.centery = y
-        self.speed_y = 3
+        self.speed_y = per_tick(ITEM_SPEED)
 
     def update(self):
         self.rect.y += self.speed_y
@@ -567,14 +1406,16 @@ class Item(pygame.sprite.Sprite):
             self.kill()
 
 # 쉴드 이펙트
-class ShieldEffect(pygame.sprite.Sprite):
+class ShieldEffect(GameSprite):
+    _layer = LAYER_EFFECTS
+
     def __init__(self, player):
         super().__init__()
         self.player = player
-        self.image = pygame.Surface((48, 48), pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, (0, 255, 0, 80), [0, 0, 48, 48], 4)
+        self.image = pygame.Surface((SHIELD_RADIUS*2, SHIELD_RADIUS*2), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.image, (0, 255, 0, 80), [0, 0, SHIELD_RADIUS*2, SHIELD_RADIUS*2], 4)
         self.rect = self.image.get_rect()
-        self.timer = 240  # 4초
+        self.timer = ms_to_ticks(SHIELD_DURATION)  # 남은 틱 수
 
     def update(self):
         self.rect.center = self.player.rect.center
@@ -583,29 +1424,27 @@ class ShieldEffect(pygame.sprite.Sprite):
             self.kill()
 
 # 폭탄 이펙트
-class BombEffect(pygame.sprite.Sprite):
+class BombEffect(GameSprite):
+    _layer = LAYER_EFFECTS
+
     def __init__(self):
         super().__init__()
-        self.image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        # 더 강렬한 폭발 효과 - 여러 원 겹침
-        pygame.draw.circle(self.image, (255, 0, 255, 100), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 200)
-        pygame.draw.circle(self.image, (255, 0, 0, 80), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 150)
-        pygame.draw.circle(self.image, (255, 255, 0, 60), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 100)
-        self.rect = self.image.get_rect()
-        self.timer = 30
+        # 더 강렬한 폭발 효과 - 여러 원 겹침 (미리 그려 둔 프레임 사용, 원 개수는 품질 단계에 따름)
+        self.frames = get_animation_frames('bomb', GRAPHICS['bomb_layers'])
+        self.image = self.frames[0]
+        self.rect = self.image.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+        self.dirty = 1  # 제자리 이펙트: 프레임이 바뀔 때만 다시 그림
+        self.timer = BOMB_TICKS  # 남은 틱 수
         self.frame = 0
 
     def update(self):
         self.timer -= 1
         # 폭발 애니메이션 효과 (깜박임)
         self.frame += 1
-        if self.frame % 5 == 0:
-            self.image.fill((0,0,0,0))
-            alpha = max(30, 100 - (30 - self.timer) * 3)
-            pygame.draw.circle(self.image, (255, 0, 255, alpha), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 200)
-            pygame.draw.circle(self.image, (255, 0, 0, alpha), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 150)
-            pygame.draw.circle(self.image, (255, 255, 0, alpha), (SCREEN_WIDTH//2, SCREEN_HEIGHT//2), 100)
-            
+        if self.frame % BOMB_FRAME_INTERVAL == 0:
+            self.image = self.frames[min(self.frame // BOMB_FRAME_INTERVAL, len(self.frames) - 1)]
+            self.dirty = 1
+
         if self.timer <= 0:
             self.kill()
 
@@ -620,44 +1459,150 @@ def get_highscore_path():
     else:
         # 기본값으로 현재 폴더 사용
         documents_path = os.path.dirname(os.path.abspath(__file__))
-    
+
     # galaga 폴더 생성
     galaga_folder = os.path.join(documents_path, 'galaga')
     os.makedirs(galaga_folder, exist_ok=True)
-    
+
     # highscore.txt 파일 경로 반환
     return os.path.join(galaga_folder, 'highscore.txt')
 
-def load_highscore():
+def load_highscore(path=None):
     try:
-        with open(get_highscore_path(), 'r') as f:
+        with open(path or get_highscore_path(), 'r') as f:
             return int(f.read().strip())
-    except:
+    except (OSError, ValueError):
         return 0
 
-def save_highscore(score):
+def save_highscore(score, path=None):
+    """임시 파일에 쓴 뒤 교체하므로 쓰는 도중 중단돼도 기존 기록이 남는다
+
+    저장에 성공하면 True, 실패하면 남은 임시 파일을 지우고 False를 반환한다.
+    """
+    path = path or get_highscore_path()
+    tmp_path = path + '.tmp'
     try:
-        with open(get_highscore_path(), 'w') as f:
+        with open(tmp_path, 'w') as f:
             f.write(str(score))
-    except:
-        pass
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+class HighscoreStore:
+    """매 프레임 파일 I/O 없이 하이스코어를 모아서 저장하는 저장소
+
+    경로는 생성 시 한 번만 계산하고, 점수가 오르면 값만 바꿔 둔다.
+    백그라운드 스레드가 최대 FLUSH_INTERVAL초마다 한 번 저장하며,
+    flush_soon()(스테이지 클리어/게임 오버)과 close()(종료)는 바로 저장한다.
+    """
+    FLUSH_INTERVAL = 3.0
+
+    def __init__(self, path=None):
+        self.path = path or get_highscore_path()
+        self.value = load_highscore(self.path)
+        self.saved_value = self.value
+        self.write_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.thread = None
+
+    def submit(self, score):
+        """새 점수 반영 (파일은 백그라운드 스레드가 저장)"""
+        if score <= self.value:
+            return
+        self.value = score
+        if self.thread is None and not self.closed:
+            self.thread = threading.Thread(target=self.run, name='highscore-writer', daemon=True)
+            self.thread.start()
+
+    def flush_soon(self):
+        """다음 주기를 기다리지 않고 바로 저장하도록 요청"""
+        self.wakeup.set()
+
+    def run(self):
+        while not self.closed:
+            self.wakeup.wait(self.FLUSH_INTERVAL)
+            self.wakeup.clear()
+            self.write_if_dirty()
+
+    def write_if_dirty(self):
+        with self.write_lock:
+            value = self.value
+            # 저장에 실패하면 saved_value를 그대로 두어 다음 주기나 close()에서 다시 시도
+            if value != self.saved_value and save_highscore(value, self.path):
+                self.saved_value = value
+
+    def close(self):
+        """스레드를 멈추고 남은 기록을 저장"""
+        self.closed = True
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.write_if_dirty()
+
+def merge_rects(rects):
+    """서로 겹치는 Rect를 하나로 합쳐 겹침이 없는 목록으로 반환"""
+    merged = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+# 별 배경 패럴랙스 레이어: (개수, 최소 속도, 최대 속도(px/초), 반지름, 색)
+STAR_LAYERS = [
+    (30, 60, 96, 0, (110, 110, 170)),     # 먼 별: 작고 느림
+    (20, 96, 138, 1, (200, 200, 255)),
+    (10, 138, 180, 2, (235, 235, 255)),   # 가까운 별: 크고 빠름
+]
+DIRTY_BULLET_LIMIT = 200  # 적 총알이 이보다 많으면 영역별 대신 전체 화면을 다시 그림
+DIRTY_STAR_LIMIT = 150  # 이보다 별이 많으면 별 영역 대신 전체 화면을 다시 그림
 
 # 별 배경 애니메이션
-class Star:
-    def __init__(self):
-        self.x = random.randint(0, SCREEN_WIDTH)
-        self.y = random.randint(0, SCREEN_HEIGHT)
-        self.speed = random.uniform(1, 3)
-        self.size = random.randint(1, 2)
+class StarField:
+    """NumPy 배열로 관리하는 패럴랙스 별 배경
+
+    모든 별의 위치/속도를 배열로 두고 한 번의 벡터 연산으로 이동시킨다.
+    density는 레이어별 별 개수 배율 (1.0 = 기본 60개).
+    """
+    def __init__(self, seed, density=1.0):
+        self.rng = np.random.default_rng(seed)
+        self.density = density
+        counts = [max(1, int(round(spec[0] * density))) for spec in STAR_LAYERS]
+        self.layer = np.repeat(np.arange(len(STAR_LAYERS)), counts)
+        self.min_speed = np.array([spec[1] for spec in STAR_LAYERS])[self.layer]
+        self.max_speed = np.array([spec[2] for spec in STAR_LAYERS])[self.layer]
+        n = len(self.layer)
+        self.x = self.rng.integers(0, SCREEN_WIDTH + 1, n).astype(np.float64)
+        self.y = self.rng.uniform(0, SCREEN_HEIGHT, n)
+        self.speed = self.rng.uniform(self.min_speed, self.max_speed)  # px/초
+        self.version = 0  # update()마다 증가 (렌더러가 변경 여부 확인용)
+
+    def __len__(self):
+        return len(self.layer)
+
     def update(self):
-        self.y += self.speed
-        if self.y > SCREEN_HEIGHT:
-            self.x = random.randint(0, SCREEN_WIDTH)
-            self.y = 0
-            self.speed = random.uniform(1, 3)
-            self.size = random.randint(1, 2)
-    def draw(self, surface):
-        pygame.draw.circle(surface, (200,200,255), (int(self.x), int(self.y)), self.size)
+        self.y += self.speed / TICK_RATE
+        wrapped = np.flatnonzero(self.y > SCREEN_HEIGHT)
+        if wrapped.size:
+            # 화면 아래로 나간 별은 맨 위 임의의 x 위치에서 다시 시작
+            self.x[wrapped] = self.rng.integers(0, SCREEN_WIDTH + 1, wrapped.size)
+            self.y[wrapped] = 0
+            self.speed[wrapped] = self.rng.uniform(self.min_speed[wrapped], self.max_speed[wrapped])
+        self.version += 1
+
+    def positions(self):
+        """별 중심의 정수 픽셀 좌표 배열 (N, 2)"""
+        return np.column_stack((self.x, self.y)).astype(np.int32)
 
 # 튜토리얼 텍스트
 TUTORIAL_TEXT = [
@@ -677,62 +1622,10 @@ TUTORIAL_TEXT = [
     "스페이스바로 게임 시작"
 ]
 
-# 게임 초기화
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Galaga (Python Edition)")
-clock = pygame.time.Clock()
-
-# 스프라이트 그룹
-all_sprites = pygame.sprite.Group()
-player_group = pygame.sprite.Group()
-enemies_group = pygame.sprite.Group()
-bullets_group = pygame.sprite.Group()
-enemy_bullets_group = pygame.sprite.Group()
-explosions_group = pygame.sprite.Group()
-tractor_beams_group = pygame.sprite.Group()
-items_group = pygame.sprite.Group()
-shield_effects_group = pygame.sprite.Group()
-bomb_effects_group = pygame.sprite.Group()
-
-# 플레이어 생성
-player = Player()
-all_sprites.add(player)
-player_group.add(player)
-
-# 웨이브/스테이지
-wave = 1
-formation = create_wave(wave, all_sprites, enemies_group)
-score = 0
-font = get_korean_font(24)
-game_over = False
-stage_clear = False
-paused = False
-
-# 진형 전체 이동 로직
-move_state = {'dir': 1}
-
-highscore = load_highscore()
-stars = [Star() for _ in range(60)]
-show_tutorial = True
-start_screen = True
-
-# 스테이지 시작 시간 - 미사일 발사 금지 기간 계산용
-stage_start_time = pygame.time.get_ticks()
-missile_cooldown_duration = 3000  # 3초
-
-def draw_stars(surface):
-    for star in stars:
-        star.draw(surface)
-
-def update_stars():
-    for star in stars:
-        star.update()
-
 def reset_player(player):
     player.lives = 3
     player.invincible = True
-    player.invincible_timer = pygame.time.get_ticks()
+    player.invincible_timer = player.game.now()
     player.invincible_duration = 5000  # 게임 시작/재시작 시 5초 무적
     player.captured = False
     player.double_fire = False
@@ -740,269 +1633,1270 @@ def reset_player(player):
     player.rect.centerx = SCREEN_WIDTH // 2
     player.rect.bottom = SCREEN_HEIGHT - 10
 
-running = True
-while running:
-    clock.tick(FPS)
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_F1:
-                show_tutorial = not show_tutorial
-            if start_screen and event.key == pygame.K_SPACE:
-                start_screen = False
-                show_tutorial = False
-                reset_player(player)
-                stage_start_time = pygame.time.get_ticks()  # 게임 시작 시간 저장
-            if event.key == pygame.K_SPACE and not game_over and not stage_clear and not paused:
-                # 스테이지 시작 후 3초 동안은 미사일 발사 불가
-                current_time = pygame.time.get_ticks()
-                if current_time - stage_start_time > missile_cooldown_duration:
-                    player.shoot(bullets_group, all_sprites)
-            if event.key == pygame.K_r and (game_over or stage_clear):
-                # 게임/스테이지 리셋
-                for s in all_sprites:
-                    s.kill()
-                player = Player()
-                all_sprites.add(player)
-                player_group.add(player)
-                wave = 1
-                formation = create_wave(wave, all_sprites, enemies_group)
-                score = 0
-                game_over = False
-                stage_clear = False
-                paused = False
-                move_state = {'dir': 1}
-                reset_player(player)
-                stage_start_time = pygame.time.get_ticks()  # 게임 재시작 시 시간 저장
-            if event.key == pygame.K_n and stage_clear:
-                # 다음 스테이지
-                for s in all_sprites:
-                    if not isinstance(s, Player):
-                        s.kill()
-                wave += 1
-                formation = create_wave(wave, all_sprites, enemies_group)
-                stage_clear = False
-                paused = False
-                move_state = {'dir': 1}  # 진형 이동 방향 초기화
-                reset_player(player)
-                stage_start_time = pygame.time.get_ticks()  # 다음 스테이지 시작 시간 저장
-            if event.key == pygame.K_p:
-                paused = not paused
-
-    if paused:
-        screen.fill((20, 20, 40))
-        all_sprites.draw(screen)
-        score_text = font.render(f"점수: {score}", True, WHITE)
-        screen.blit(score_text, (10, 10))
-        lives_text = font.render(f"목숨: {player.lives}", True, WHITE)
-        screen.blit(lives_text, (SCREEN_WIDTH-110, 10))
-        wave_text = font.render(f"스테이지: {wave}", True, WHITE)
-        screen.blit(wave_text, (SCREEN_WIDTH//2-60, 10))
-        pause_text = font.render("일시정지 (P키로 해제)", True, YELLOW)
-        screen.blit(pause_text, (SCREEN_WIDTH//2-120, SCREEN_HEIGHT//2-20))
-        pygame.display.flip()
-        continue
-
-    if not game_over and not stage_clear and not paused:
-        # 진형 전체 이동
-        update_formation(formation, move_state)
-        # 플레이어 포획/구출 처리
-        handle_player_capture(player, tractor_beams_group, all_sprites, explosions_group)
-        # 아이템/이펙트 업데이트
-        items_group.update()
-        shield_effects_group.update()
-        bomb_effects_group.update()
-        
-        # 현재 시간 체크
-        current_time = pygame.time.get_ticks()
-        is_startup_period = current_time - stage_start_time < missile_cooldown_duration
-        
-        # 적이 랜덤하게 총알 발사 (스테이지 시작 3초 후부터)
-        if not is_startup_period:
+# 게임 상태/진행 로직
+class GalagaGame:
+    """갤러그 한 판의 상태와 프레임 진행 로직
+
+    모든 난수는 seed로 초기화한 self.rng 하나에서만 뽑고, 시간은 step()마다
+    1틱씩 가는 시뮬레이션 시계만 사용한다. 따라서 같은 seed와 같은 입력
+    비트 열에 대해 항상 같은 결과가 나오고, 화면 없이 실제 시간보다 빨리
+    돌릴 수도 있다.
+
+    한 틱은 입력 -> 생성 -> 이동 -> 충돌 -> 이펙트 -> 정리 단계를 순서대로
+    실행하고, 모든 스프라이트는 자기 그룹의 단계에서 정확히 한 번만
+    update()된다. 단계별 소요 시간은 phase_time/phase_calls에 누적된다.
+    """
+    def __init__(self, seed=None, config=None, persist_highscore=True, star_density=1.0,
+                 bullet_hell=False):
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.clock = SimClock()
+        self.config = config if config is not None else CONFIG
+        self.input_bits = 0
+
+        # 스프라이트 그룹
+        self.all_sprites = pygame.sprite.Group()
+        self.player_group = pygame.sprite.Group()
+        self.enemies_group = pygame.sprite.Group()
+        self.bullets_group = pygame.sprite.Group()
+        self.enemy_bullets = EnemyBulletField()
+        self.bullet_hell = bullet_hell  # 탄막 모드: 적이 원형/부채꼴로 총알을 대량 발사
+        self.explosions_group = pygame.sprite.Group()
+        self.tractor_beams_group = pygame.sprite.Group()
+        self.items_group = pygame.sprite.Group()
+        self.shield_effects_group = pygame.sprite.Group()
+        self.bomb_effects_group = pygame.sprite.Group()
+
+        # 플레이어 생성
+        self.player = Player(self)
+        self.all_sprites.add(self.player)
+        self.player_group.add(self.player)
+
+        # 웨이브/스테이지
+        self.wave = 1
+        self.fire_scheduler = FireScheduler(self)
+        self.scheduler = TickScheduler()  # 적 돌진/트랙터 빔 타이머 (시작 직후 금지 기간에는 멈춤)
+        self.formation = create_wave(self.wave, self.all_sprites, self.enemies_group, self)
+        self.next_wave = None  # 스테이지 클리어 화면에서 미리 만드는 다음 웨이브 (WaveBuilder)
+        self.score = 0
+        self.game_over = False
+        self.stage_clear = False
+        self.paused = False
+
+        self.highscore_store = HighscoreStore() if persist_highscore else None
+        self.highscore = self.highscore_store.value if self.highscore_store else 0
+        self.starfield = StarField(self.rng.getrandbits(64), star_density)
+        self.show_tutorial = True
+        self.start_screen = True
+
+        # 스테이지 시작 시간 - 미사일 발사 금지 기간 계산용
+        self.stage_start_time = self.now()
+        self.missile_cooldown_duration = 3000  # 3초
+
+        # 게임 진행 중 틱마다 순서대로 실행하는 단계 (입력 단계는 step()에서 먼저 실행)
+        self.play_phases = (
+            (PHASE_SPAWN, self.spawn_entities),
+            (PHASE_MOVEMENT, self.move_entities),
+            (PHASE_COLLISION, self.handle_collisions),
+            (PHASE_EFFECTS, self.update_effects),
+            (PHASE_CLEANUP, self.cleanup),
+        )
+        # 단계별 누적 실행 시간(초)/횟수 (그리기 단계는 화면 쪽에서 run_phase로 기록)
+        self.phase_time = dict.fromkeys(PHASES, 0.0)
+        self.phase_calls = dict.fromkeys(PHASES, 0)
+
+    def now(self):
+        """게임 시계 기준 현재 시각(ms)"""
+        return self.clock.now()
+
+    def is_startup_period(self):
+        """스테이지 시작 직후 미사일/돌진 금지 기간인지 여부"""
+        return self.now() - self.stage_start_time < self.missile_cooldown_duration
+
+    def run_phase(self, name, func, *args):
+        """단계 하나를 실행하고 단계별 누적 시간/횟수에 더함"""
+        start = time.perf_counter()
+        result = func(*args)
+        self.phase_time[name] += time.perf_counter() - start
+        self.phase_calls[name] += 1
+        return result
+
+    def step(self, bits):
+        """입력 비트 하나로 로직 1틱 진행 (화면 출력 없음)"""
+        # 그리기 보간용으로 이번 틱 시작 위치 기억
+        for sprite in self.all_sprites:
+            sprite.prev_topleft = sprite.rect.topleft
+        self.clock.advance()
+        self.input_bits = bits
+        self.run_phase(PHASE_INPUT, self.handle_keys, bits)
+        if self.paused:
+            return
+        stage_ended = False
+        if not self.game_over and not self.stage_clear:
+            for name, phase in self.play_phases:
+                self.run_phase(name, phase)
+            stage_ended = self.game_over or self.stage_clear
+        elif self.stage_clear and not self.game_over:
+            # 클리어 화면이 떠 있는 동안 다음 웨이브 적을 조금씩 미리 만듦
+            self.run_phase(PHASE_SPAWN, self.prepare_next_wave)
+        # 배경/별 애니메이션
+        self.starfield.update()
+        # 하이스코어 갱신 (파일 저장은 HighscoreStore가 모아서 처리)
+        if self.score > self.highscore:
+            self.highscore = self.score
+            if self.highscore_store:
+                self.highscore_store.submit(self.highscore)
+        if stage_ended and self.highscore_store:
+            self.highscore_store.flush_soon()
+
+    def handle_keys(self, bits):
+        """이번 프레임에 눌린 키 처리 (기존 KEYDOWN 이벤트 처리와 동일)"""
+        if bits & INPUT_TUTORIAL:
+            self.show_tutorial = not self.show_tutorial
+        if self.start_screen and bits & INPUT_SPACE:
+            self.start_screen = False
+            self.show_tutorial = False
+            reset_player(self.player)
+            self.stage_start_time = self.now()  # 게임 시작 시간 저장
+        if bits & INPUT_SPACE and not self.game_over and not self.stage_clear and not self.paused:
+            # 스테이지 시작 후 3초 동안은 미사일 발사 불가
+            if self.now() - self.stage_start_time > self.missile_cooldown_duration:
+                self.player.shoot(self.bullets_group, self.all_sprites)
+        if bits & INPUT_RESTART and (self.game_over or self.stage_clear):
+            # 게임/스테이지 리셋
+            for s in self.all_sprites:
+                s.kill()
+            self.player = Player(self)
+            self.all_sprites.add(self.player)
+            self.player_group.add(self.player)
+            self.wave = 1
+            self.fire_scheduler.reset()
+            self.scheduler.clear()
+            self.enemy_bullets.clear()
+            self.formation = create_wave(self.wave, self.all_sprites, self.enemies_group, self)
+            self.next_wave = None
+            self.score = 0
+            self.game_over = False
+            self.stage_clear = False
+            self.paused = False
+            reset_player(self.player)
+            self.stage_start_time = self.now()  # 게임 재시작 시 시간 저장
+        if bits & INPUT_NEXT and self.stage_clear:
+            # 다음 스테이지
+            self.load_stage(self.wave + 1)
+        if bits & INPUT_PAUSE:
+            self.paused = not self.paused
+
+    def load_stage(self, wave):
+        """플레이어만 남기고 지정한 스테이지의 적 진형을 새로 배치"""
+        for s in self.all_sprites:
+            if not isinstance(s, Player):
+                s.kill()
+        self.wave = wave
+        self.fire_scheduler.reset()
+        self.scheduler.clear()
+        self.enemy_bullets.clear()
+        builder = self.next_wave
+        self.next_wave = None
+        if builder is None or builder.wave != wave:
+            builder = WaveBuilder(wave, self)
+        self.formation = spawn_wave(builder, self.all_sprites, self.enemies_group, self)
+        self.stage_clear = False
+        self.paused = False
+        reset_player(self.player)
+        self.stage_start_time = self.now()  # 다음 스테이지 시작 시간 저장
+
+    def prepare_next_wave(self):
+        """다음 웨이브 설계도를 만들고 틱마다 WAVE_PREBUILD_PER_TICK마리씩 적 생성"""
+        if self.next_wave is None:
+            self.next_wave = WaveBuilder(self.wave + 1, self)
+        elif not self.next_wave.done:
+            self.next_wave.build(WAVE_PREBUILD_PER_TICK)
+
+    def fire_enemy_bullet(self, enemy):
+        """적 위치에서 아래로 총알 발사"""
+        # 스테이지가 올라갈수록 조금씩 빨라짐 (최대 속도 제한)
+        speed = per_tick(min(ENEMY_BULLET_SPEED + self.wave * ENEMY_BULLET_SPEED_PER_WAVE,
+                             ENEMY_BULLET_MAX_SPEED))
+        self.enemy_bullets.spawn(enemy.rect.centerx, enemy.rect.bottom + 6, 0, speed)
+
+    def bullet_hell_room(self, wanted):
+        """탄막 모드 총알 수 상한 안에서 더 만들 수 있는 개수"""
+        return max(0, min(wanted, self.config['bullet_hell']['max_bullets'] - len(self.enemy_bullets)))
+
+    def fire_ring(self, enemy):
+        """탄막 모드: 적 중심에서 사방으로 퍼지는 원형 탄막"""
+        settings = self.config['bullet_hell']
+        count = self.bullet_hell_room(settings['ring_count'])
+        if count == 0:
+            return
+        speed = per_tick(settings['ring_speed'] + settings['speed_per_wave'] * self.wave)
+        angles = self.rng.random() * 2 * math.pi + np.arange(count) * (2 * math.pi / settings['ring_count'])
+        self.enemy_bullets.spawn(enemy.rect.centerx, enemy.rect.centery,
+                                 np.cos(angles) * speed, np.sin(angles) * speed, BULLET_ORB,
+                                 ms_to_ticks(settings['lifetime_ms']))
+
+    def fire_fan(self, enemy):
+        """탄막 모드: 플레이어를 겨냥한 부채꼴 탄막 (돌진 중인 보스/중간 적)"""
+        settings = self.config['bullet_hell']
+        count = self.bullet_hell_room(settings['fan_count'])
+        if count == 0:
+            return
+        speed = per_tick(settings['fan_speed'] + settings['speed_per_wave'] * self.wave)
+        aim = math.atan2(self.player.rect.centery - enemy.rect.centery,
+                         self.player.rect.centerx - enemy.rect.centerx)
+        angles = aim + np.linspace(-0.5, 0.5, settings['fan_count'])[:count] * settings['fan_spread']
+        self.enemy_bullets.spawn(enemy.rect.centerx, enemy.rect.centery,
+                                 np.cos(angles) * speed, np.sin(angles) * speed, BULLET_ORB,
+                                 ms_to_ticks(settings['lifetime_ms']))
+
+    def player_hitbox(self):
+        """적 총알 충돌용 플레이어 판정 영역 (탄막 모드는 작게)"""
+        if self.bullet_hell:
+            shrink = self.config['bullet_hell']['hitbox_shrink']
+            return self.player.rect.inflate(-shrink, -shrink)
+        return self.player.rect
+
+    def add_explosion(self, center):
+        exp = Explosion(center, self)
+        self.all_sprites.add(exp)
+        self.explosions_group.add(exp)
+
+    def spawn_entities(self):
+        """생성 단계: 적 총알 발사, 돌진/트랙터 빔 타이머 진행, 시작 직후 진형 복귀"""
+        difficulty = self.config['difficulty']
+        is_startup_period = self.is_startup_period()
+
+        # 적이 랜덤하게 총알 발사 (스테이지 시작 3초 후부터, 예약된 발사 시각이 된 적만)
+        shooters = self.fire_scheduler.due(FIRE_RANDOM)
+        if shooters and not is_startup_period:
+            if self.bullet_hell:
+                for enemy in shooters:
+                    if not enemy.in_formation:
+                        self.fire_ring(enemy)
             # 화면에 표시된 적 총알 개수 제한
-            max_missiles = DIFFICULTY_CONFIG['max_missiles'] + wave
-            if len(enemy_bullets_group) < max_missiles:
-                for enemy in enemies_group:
-                    if not enemy.in_formation and random.random() < DIFFICULTY_CONFIG['missile_base_chance']:
-                        bullet = EnemyBullet(enemy.rect.centerx, enemy.rect.bottom)
-                        all_sprites.add(bullet)
-                        enemy_bullets_group.add(bullet)
-
-        # 업데이트
-        all_sprites.update()
-        explosions_group.update()
-        
-        # 적들의 돌진 시작도 스테이지 시작 3초 후부터 가능하도록 설정
-        if is_startup_period:
-            for enemy in enemies_group:
+            elif len(self.enemy_bullets) < difficulty['max_missiles'] + self.wave:
+                for enemy in shooters:
+                    if not enemy.in_formation:
+                        self.fire_enemy_bullet(enemy)
+
+        # 돌진 중인 보스/중간 적의 총알 발사
+        for enemy in self.fire_scheduler.due(FIRE_DIVE):
+            if enemy.is_diving():
+                if self.bullet_hell:
+                    self.fire_fan(enemy)
+                else:
+                    self.fire_enemy_bullet(enemy)
+
+        # 진형 적의 돌진/트랙터 빔 타이머 진행 (시작 직후 금지 기간에는 시계를 멈춤)
+        if not is_startup_period:
+            self.scheduler.advance()
+        else:
+            # 적들의 돌진 시작도 스테이지 시작 3초 후부터 가능하도록 설정
+            for enemy in self.enemies_group:
                 if not enemy.in_formation:
-                    enemy.in_formation = True
+                    enemy.join_formation()
 
-        # 충돌 판정: 플레이어 총알 vs 적
-        hits = pygame.sprite.groupcollide(enemies_group, bullets_group, False, True)
-        for enemy, bullets in hits.items():
-            for bullet in bullets:
+    def move_entities(self):
+        """이동 단계: 진형, 플레이어, 적, 트랙터 빔, 총알, 아이템을 한 번씩 이동"""
+        self.formation.update()
+        # 플레이어 포획/구출 처리
+        handle_player_capture(self.player, self.tractor_beams_group, self.all_sprites, self.explosions_group)
+        self.player_group.update()
+        self.enemies_group.update()
+        self.tractor_beams_group.update()  # 빔은 이미 움직인 적을 따라감
+        self.bullets_group.update()
+        self.items_group.update()
+        self.enemy_bullets.update()
+
+    def update_effects(self):
+        """이펙트 단계: 폭발/쉴드/폭탄 애니메이션 (충돌 단계에서 새로 생긴 것 포함)"""
+        self.explosions_group.update()
+        self.shield_effects_group.update()
+        self.bomb_effects_group.update()
+
+    def cleanup(self):
+        """정리 단계: 웨이브 클리어/게임 오버 판정 마무리"""
+        # 웨이브 클리어 (죽은 적은 kill()에서 이미 모든 그룹에서 빠짐)
+        if len(self.enemies_group) == 0:
+            self.stage_clear = True
+        # 게임 오버 효과음
+        if self.game_over:
+            ASSETS.play('gameover')
+
+    def handle_collisions(self):
+        """총알/적/아이템/플레이어 충돌 판정과 그 결과(점수, 아이템 효과, 피격) 처리"""
+        rng = self.rng
+        player = self.player
+        # 충돌 판정: 플레이어 총알 vs 적 (보통 총알이 적보다 훨씬 적으므로 총알 쪽에서 검사)
+        hits = pygame.sprite.groupcollide(self.bullets_group, self.enemies_group, True, False)
+        for bullet, enemies in hits.items():
+            # 총알 하나는 겹친 적 중 아직 살아 있는 첫 적(그룹 순서) 하나만 맞힘.
+            # 같은 틱에 다른 총알로 이미 격추된 적은 건너뜀
+            for enemy in enemies:
+                if not enemy.alive():
+                    continue
                 if enemy.hit():
-                    score += enemy.score
-                    exp = Explosion(enemy.rect.center)
-                    all_sprites.add(exp)
-                    explosions_group.add(exp)
-                    if explosion_sound:
-                        explosion_sound.play()
+                    self.score += enemy.score
+                    self.add_explosion(enemy.rect.center)
+                    ASSETS.play('explosion')
                     # 아이템 드랍
-                    if random.random() < ITEM_CONFIG['drop_rate']:
-                        item_type = random.choice(ITEM_TYPES)
+                    if rng.random() < self.config['item']['drop_rate']:
+                        item_type = rng.choice(ITEM_TYPES)
                         item = Item(enemy.rect.centerx, enemy.rect.centery, item_type)
-                        all_sprites.add(item)
-                        items_group.add(item)
+                        self.all_sprites.add(item)
+                        self.items_group.add(item)
+                break
 
         # 아이템 획득 처리
-        item_hits = pygame.sprite.spritecollide(player, items_group, True)
+        item_hits = pygame.sprite.spritecollide(player, self.items_group, True)
         for item in item_hits:
-            if item_sound:
-                item_sound.play()
+            ASSETS.play('item')
             if item.type == 'double':
                 player.double_fire = True
             elif item.type == 'shield':
                 shield = ShieldEffect(player)
-                all_sprites.add(shield)
-                shield_effects_group.add(shield)
+                self.all_sprites.add(shield)
+                self.shield_effects_group.add(shield)
                 player.shield = True
             elif item.type == 'bomb':
                 bomb = BombEffect()
-                all_sprites.add(bomb)
-                bomb_effects_group.add(bomb)
+                self.all_sprites.add(bomb)
+                self.bomb_effects_group.add(bomb)
+                ASSETS.play('bomb')
                 # 화면 내 적 전체가 아닌 일부 피해
                 damage_count = 0
-                for enemy in list(enemies_group):
+                for enemy in list(self.enemies_group):
                     # 화면 안에 있는 적만 피해
-                    if (0 <= enemy.rect.centerx <= SCREEN_WIDTH and 
+                    if (0 <= enemy.rect.centerx <= SCREEN_WIDTH and
                         0 <= enemy.rect.centery <= SCREEN_HEIGHT):
                         # 일정 확률로 처치 또는 HP 감소
-                        if random.random() < 0.7:  # 70% 확률로 피해
+                        if rng.random() < 0.7:  # 70% 확률로 피해
                             if enemy.hit():  # hit()은 이미 HP 감소 및 HP가 0이면 kill 처리
-                                exp = Explosion(enemy.rect.center)
-                                all_sprites.add(exp)
-                                explosions_group.add(exp)
+                                self.add_explosion(enemy.rect.center)
                                 damage_count += 1
-                                score += enemy.score // 2  # 일반 처치보다 적은 점수
-                score += 200 + damage_count * 50  # 기본 점수 + 처치한 적 수에 따른 추가 점수
+                                self.score += enemy.score // 2  # 일반 처치보다 적은 점수
+                self.score += 200 + damage_count * 50  # 기본 점수 + 처치한 적 수에 따른 추가 점수
             elif item.type == 'score':
-                score += 300
+                self.score += 300
 
         # 쉴드 효과 적용: 적 총알/적과 충돌 시 무적
         if hasattr(player, 'shield') and player.shield:
-            if pygame.sprite.spritecollide(player, enemy_bullets_group, True):
-                pass  # 무적
-            if pygame.sprite.spritecollide(player, enemies_group, False):
+            # 쉴드 원 안에 들어온 적 총알은 제거 (무적)
+            self.enemy_bullets.collide_circle(player.rect.center, SHIELD_RADIUS)
+            if pygame.sprite.spritecollide(player, self.enemies_group, False):
                 pass  # 무적
             # 쉴드 지속시간 끝나면 해제
-            if len(shield_effects_group) == 0:
+            if len(self.shield_effects_group) == 0:
                 player.shield = False
         else:
             # 무적 상태일 때는 충돌 무시
             if player.invincible:
                 # 무적 상태 시각적 표시 (깜빡임)
-                if pygame.time.get_ticks() % 200 < 100:
+                if self.now() % 200 < 100:
                     player.image.set_alpha(100)
                 else:
                     player.image.set_alpha(255)
                 # 무적 상태에서도 적 총알은 제거
-                pygame.sprite.spritecollide(player, enemy_bullets_group, True)
+                self.enemy_bullets.collide_rect(self.player_hitbox())
             else:
                 player.image.set_alpha(255)
                 # 기존 충돌 판정
-                if pygame.sprite.spritecollide(player, enemy_bullets_group, True):
-                    player.lives -= 1
-                    exp = Explosion(player.rect.center)
-                    all_sprites.add(exp)
-                    explosions_group.add(exp)
-                    if player.lives > 0:
-                        # 목숨이 남아있으면 잠시 무적 상태로 설정
-                        player.invincible = True
-                        player.invincible_timer = pygame.time.get_ticks()
-                        player.invincible_duration = 3000  # 충돌 후 3초 무적
-                    else:
-                        game_over = True
-                if pygame.sprite.spritecollide(player, enemies_group, True):
-                    player.lives -= 1
-                    exp = Explosion(player.rect.center)
-                    all_sprites.add(exp)
-                    explosions_group.add(exp)
-                    if player.lives > 0:
-                        # 목숨이 남아있으면 잠시 무적 상태로 설정
-                        player.invincible = True
-                        player.invincible_timer = pygame.time.get_ticks()
-                        player.invincible_duration = 3000  # 충돌 후 3초 무적
-                    else:
-                        game_over = True
-
-        # 적 제거
-        for enemy in enemies_group:
-            if not enemy.alive():
-                enemies_group.remove(enemy)
-
-        # 웨이브 클리어
-        if len(enemies_group) == 0:
-            stage_clear = True
+                if self.enemy_bullets.collide_rect(self.player_hitbox()):
+                    self.player_hit()
+                if pygame.sprite.spritecollide(player, self.enemies_group, True):
+                    self.player_hit()
+
+    def player_hit(self):
+        """적/적 총알에 맞았을 때 목숨 감소 및 무적/게임 오버 처리"""
+        player = self.player
+        player.lives -= 1
+        self.add_explosion(player.rect.center)
+        if player.lives > 0:
+            # 목숨이 남아있으면 잠시 무적 상태로 설정
+            player.invincible = True
+            player.invincible_timer = self.now()
+            player.invincible_duration = 3000  # 충돌 후 3초 무적
+        else:
+            self.game_over = True
+
+    def state_hash(self):
+        """리플레이 검증용 상태 해시 (점수/스프라이트 위치/난수 상태)"""
+        h = hashlib.sha1()
+        h.update(repr((self.clock.now(), self.score, self.wave, self.player.lives,
+                       self.game_over, self.stage_clear, self.paused)).encode())
+        # 그룹 내부 순서와 무관하도록 정렬해서 해시 (크기는 품질 단계에 따라 달라지는
+        # 이펙트 이미지를 따르므로 중심 좌표만 사용)
+        for entry in sorted((type(s).__name__, s.rect.center) for s in self.all_sprites):
+            h.update(repr(entry).encode())
+        h.update(self.enemy_bullets.state_bytes())
+        h.update(repr(self.rng.getstate()).encode())
+        return h.hexdigest()
+
+# HUD 텍스트
+class TextSprite(pygame.sprite.DirtySprite):
+    """내용/색/위치가 바뀔 때만 다시 렌더링하는 HUD 텍스트"""
+    _layer = LAYER_HUD
+
+    def __init__(self, font, pos):
+        super().__init__()
+        self.font = font
+        self.key = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.visible = 0
+
+    def set_text(self, text, color=WHITE, pos=None):
+        pos = pos or self.rect.topleft
+        if (text, color, pos) == self.key:
+            return
+        self.key = (text, color, pos)
+        self.image = self.font.render(text, True, color)
+        self.rect = self.image.get_rect(topleft=pos)
+        self.dirty = 1
 
-        # 폭탄 효과음
-        for bomb in bomb_effects_group:
-            if bomb_sound and bomb.timer == 30:
-                bomb_sound.play()
+    def show(self, flag):
+        if bool(self.visible) != flag:
+            self.visible = int(flag)
 
-        # 게임 오버 효과음
-        if game_over and gameover_sound:
-            gameover_sound.play()
+class TextPanel(pygame.sprite.DirtySprite):
+    """반투명 배경 위에 여러 줄을 그리는 HUD 패널 (프로파일러 요약 표시용)"""
+    _layer = LAYER_HUD
 
-    # 배경/별 애니메이션
-    bg_color = (20, 20, 40 + min(wave*10, 100))
-    screen.fill(bg_color)
-    update_stars()
-    draw_stars(screen)
-
-    if start_screen or show_tutorial:
+    def __init__(self, font, pos):
+        super().__init__()
+        self.font = font
+        self.pos = pos
+        self.image = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(pos, (0, 0))
+        self.visible = 0
+
+    def set_lines(self, lines):
+        """줄 목록으로 패널 이미지를 새로 그림"""
+        rendered = [self.font.render(line, True, WHITE) for line in lines]
+        width = max((line.get_width() for line in rendered), default=0) + 12
+        height = sum(line.get_height() for line in rendered) + 8
+        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.image.fill((0, 0, 0, 170))
+        y = 4
+        for line in rendered:
+            self.image.blit(line, (6, y))
+            y += line.get_height()
+        self.rect = self.image.get_rect(topleft=self.pos)
+        self.dirty = 1
+
+# 레이어 렌더러
+class GalagaRenderer:
+    """배경 < 별 < 기체 < 총알/아이템 < 이펙트 < HUD 순서로 그리는 렌더러
+
+    LayeredDirty 그룹이 모든 스프라이트를 한 번씩만 그리고 바뀐 영역만
+    돌려주므로, display.update(rects)로 필요한 부분만 화면에 보낸다.
+    그리기 시간이 길어지면 LayeredDirty가 알아서 전체 화면 모드로 전환한다.
+
+    별은 스프라이트 대신 배경 Surface에 surfarray로 직접 그리고, 별이 적으면
+    별 영역만, 많으면 전체 화면을 다시 그리도록 LayeredDirty에 알려준다.
+    """
+    def __init__(self, screen, font):
+        self.screen = screen
+        self.font = font
+        self.layers = pygame.sprite.LayeredDirty()
+        # 배경색 + 별 (LayeredDirty가 지울 때 쓰는 배경)
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.bg_color = None
+        self.starfield = None
+        self.star_version = None
+        self.star_centers = None
+        self.tutorial_shown = False
+        self.tutorial_lines = [
+            font.render(line, True, YELLOW if "<" in line else WHITE) for line in TUTORIAL_TEXT
+        ]
+        # 점수/목숨/스테이지/하이스코어/중앙 메시지
+        self.score_text = TextSprite(font, (10, 10))
+        self.lives_text = TextSprite(font, (SCREEN_WIDTH-110, 10))
+        self.wave_text = TextSprite(font, (SCREEN_WIDTH//2-60, 10))
+        self.highscore_text = TextSprite(font, (SCREEN_WIDTH//2-80, 40))
+        self.message_text = TextSprite(font, (0, SCREEN_HEIGHT//2-20))
+        self.layers.add(self.score_text, self.lives_text, self.wave_text,
+                        self.highscore_text, self.message_text)
+        self.bullet_rects = []  # 직전 프레임에 적 총알을 그린 영역
+        self.star_fraction = None  # 그리는 별 비율 (품질 단계)
+        self.frame_count = 0
+
+    def sync_sprites(self, game):
+        """게임에 새로 생긴 스프라이트를 레이어 그룹에 등록 (kill된 것은 자동 제거)"""
+        layers = self.layers
+        for sprite in game.all_sprites:
+            if sprite not in layers:
+                layers.add(sprite)
+
+    def reset_stars(self, starfield):
+        """레이어별 별 모양(픽셀 오프셋)을 한 번만 계산하고 배경을 새로 그림"""
+        self.starfield = starfield
+        self.star_shapes = []
+        for _, _, _, radius, color in STAR_LAYERS:
+            size = radius*2 + 1
+            image = pygame.Surface((size, size), pygame.SRCALPHA)
+            if radius:
+                pygame.draw.circle(image, WHITE, (radius, radius), radius)
+            else:
+                image.fill(WHITE)
+            dx, dy = np.nonzero(pygame.surfarray.array_alpha(image))
+            self.star_shapes.append((dx - radius, dy - radius, self.background.map_rgb(color)))
+        # 품질 단계에 따라 레이어마다 앞쪽 일부 별만 그림
+        self.star_fraction = GRAPHICS['stars']
+        self.star_members = []
+        for i in range(len(STAR_LAYERS)):
+            members = np.flatnonzero(starfield.layer == i)
+            self.star_members.append(members[:math.ceil(len(members) * self.star_fraction)])
+        self.star_visible = np.sort(np.concatenate(self.star_members))
+        radii = np.array([spec[3] for spec in STAR_LAYERS], dtype=np.int32)[starfield.layer[self.star_visible]]
+        self.star_radii = radii[:, None]
+        self.star_sizes = radii*2 + 1
+        self.bg_mapped = self.background.map_rgb(self.bg_color)
+        self.background.fill(self.bg_color)
+        self.star_centers = None
+        self.star_version = None
+
+    def star_pixels(self, centers, layer):
+        """한 레이어 별들이 덮는 화면 픽셀 좌표 (화면 밖은 제외)"""
+        dx, dy, _ = self.star_shapes[layer]
+        members = centers[self.star_members[layer]]
+        xs = (members[:, 0:1] + dx).ravel()
+        ys = (members[:, 1:2] + dy).ravel()
+        inside = (xs >= 0) & (xs < SCREEN_WIDTH) & (ys >= 0) & (ys < SCREEN_HEIGHT)
+        return xs[inside], ys[inside]
+
+    def draw_stars(self, starfield):
+        """배경 Surface의 별을 현재 위치로 옮기고 다시 그려야 할 영역 목록 반환 (전체 화면이면 None)
+
+        이전 위치는 배경색으로, 새 위치는 별 색으로 surfarray에 한 번에 써서
+        별 개수와 상관없이 레이어당 NumPy 대입 두 번으로 끝난다.
+        """
+        if starfield.version == self.star_version:
+            return []
+        self.star_version = starfield.version
+        centers = starfield.positions()
+        old_centers = self.star_centers
+        pixels = pygame.surfarray.pixels2d(self.background)
+        try:
+            if old_centers is not None:
+                for layer in range(len(STAR_LAYERS)):
+                    pixels[self.star_pixels(old_centers, layer)] = self.bg_mapped
+            for layer in range(len(STAR_LAYERS)):
+                pixels[self.star_pixels(centers, layer)] = self.star_shapes[layer][2]
+        finally:
+            del pixels  # Surface 잠금 해제
+        self.star_centers = centers
+        if old_centers is None or len(self.star_visible) > DIRTY_STAR_LIMIT:
+            return None
+        if len(self.star_visible) == 0:
+            return []
+        old_centers = old_centers[self.star_visible]
+        centers = centers[self.star_visible]
+        sizes = self.star_sizes.tolist()
+        old_corners = (old_centers - self.star_radii).tolist()
+        corners = (centers - self.star_radii).tolist()
+        return [pygame.Rect(x0, y0, size, size).union((x1, y1, size, size))
+                for (x0, y0), (x1, y1), size in zip(old_corners, corners, sizes)]
+
+    def repaint(self, rects):
+        """다시 그릴 영역을 LayeredDirty에 등록 (None이면 전체 화면)"""
+        if rects is None:
+            self.layers.repaint_rect(self.screen.get_rect())
+            return
+        for rect in rects:
+            self.layers.repaint_rect(rect)
+
+    def merge_lost_rects(self):
+        """LayeredDirty가 지울 영역(사라진 스프라이트 + repaint 영역)의 겹침을 합침
+
+        LayeredDirty는 이 영역들끼리 합치지 않으므로, 겹친 채로 두면 그 위의
+        반투명 글자/폭탄 이펙트가 겹친 부분에서 두 번 그려져 진해진다.
+        """
+        lost = self.layers.lostsprites
+        if len(lost) > 1:
+            lost[:] = merge_rects(lost)
+
+    def update_hud(self, game):
+        self.score_text.set_text(f"점수: {game.score}")
+        self.lives_text.set_text(f"목숨: {game.player.lives}")
+        self.wave_text.set_text(f"스테이지: {game.wave}")
+        self.highscore_text.set_text(f"하이스코어: {game.highscore}", YELLOW)
+        self.score_text.show(True)
+        self.lives_text.show(True)
+        self.wave_text.show(True)
+        self.highscore_text.show(not game.paused)
+        # 중앙 메시지 (일시정지 > 게임 오버 > 스테이지 클리어 > 시작 준비)
+        message = None
+        if game.paused:
+            message = ("일시정지 (P키로 해제)", YELLOW, SCREEN_WIDTH//2-120)
+        elif game.game_over:
+            message = ("게임 오버! R키로 재시작", YELLOW, SCREEN_WIDTH//2-120)
+        elif game.stage_clear:
+            message = ("스테이지 클리어! N키로 다음 스테이지", GREEN, SCREEN_WIDTH//2-150)
+        elif game.is_startup_period():
+            message = ("준비하세요!", YELLOW, SCREEN_WIDTH//2-80)
+        if message:
+            text, color, x = message
+            self.message_text.set_text(text, color, (x, SCREEN_HEIGHT//2-20))
+        self.message_text.show(message is not None)
+
+    def draw_tutorial(self):
+        """시작/도움말 화면 (배경, 별, 튜토리얼 텍스트만 전체 화면으로 그림)"""
+        self.screen.blit(self.background, (0, 0))
         y = 120
-        for line in TUTORIAL_TEXT:
-            t = font.render(line, True, YELLOW if "<" in line else WHITE)
-            screen.blit(t, (SCREEN_WIDTH//2-150, y))
+        for line in self.tutorial_lines:
+            self.screen.blit(line, (SCREEN_WIDTH//2-150, y))
             y += 32
-        pygame.display.flip()
-        continue
-
-    # 그리기
-    screen.fill((20, 20, 40))
-    all_sprites.draw(screen)
-    # 쉴드/폭탄 이펙트는 맨 위에 그리기
-    shield_effects_group.draw(screen)
-    bomb_effects_group.draw(screen)
-    # 점수/목숨/스테이지 표시
-    score_text = font.render(f"점수: {score}", True, WHITE)
-    screen.blit(score_text, (10, 10))
-    lives_text = font.render(f"목숨: {player.lives}", True, WHITE)
-    screen.blit(lives_text, (SCREEN_WIDTH-110, 10))
-    wave_text = font.render(f"스테이지: {wave}", True, WHITE)
-    screen.blit(wave_text, (SCREEN_WIDTH//2-60, 10))
-    
-    # 스테이지 시작 3초 동안 메시지 표시
-    current_time = pygame.time.get_ticks()
-    if current_time - stage_start_time < missile_cooldown_duration and not game_over and not stage_clear:
-        ready_text = font.render("준비하세요!", True, YELLOW)
-        screen.blit(ready_text, (SCREEN_WIDTH//2-80, SCREEN_HEIGHT//2-20))
-    if game_over:
-        over_text = font.render("게임 오버! R키로 재시작", True, YELLOW)
-        screen.blit(over_text, (SCREEN_WIDTH//2-120, SCREEN_HEIGHT//2-20))
-    if stage_clear:
-        clear_text = font.render("스테이지 클리어! N키로 다음 스테이지", True, GREEN)
-        screen.blit(clear_text, (SCREEN_WIDTH//2-150, SCREEN_HEIGHT//2-20))
-    pygame.display.flip()
-
-    # 하이스코어 갱신/표시
-    if score > highscore:
-        highscore = score
-        save_highscore(highscore)
-    highscore_text = font.render(f"하이스코어: {highscore}", True, (255,255,0))
-    screen.blit(highscore_text, (SCREEN_WIDTH//2-80, 40))
-
-pygame.quit() 
\ No newline at end of file
+
+    def draw(self, game, alpha=1.0):
+        """현재 상태를 그리고 화면에 반영해야 할 영역 목록 반환 (게임 상태는 변경하지 않음)
+
+        alpha는 직전 틱에서 현재 틱까지 진행 비율로, 1.0 미만이면 스프라이트를
+        두 틱 사이 위치에 그린다.
+        """
+        screen_rect = self.screen.get_rect()
+        repaint = False
+        bg_color = (20, 20, 40 + min(game.wave*10, 100))
+        if (bg_color != self.bg_color or game.starfield is not self.starfield or
+                GRAPHICS['stars'] != self.star_fraction):
+            self.bg_color = bg_color
+            self.reset_stars(game.starfield)
+            self.layers.clear(self.screen, self.background)
+            repaint = True
+        dirty = self.draw_stars(game.starfield)
+
+        if (game.start_screen or game.show_tutorial) and not game.paused:
+            self.draw_tutorial()
+            self.tutorial_shown = True
+            return [screen_rect]
+        if self.tutorial_shown:
+            self.tutorial_shown = False
+            repaint = True
+
+        self.sync_sprites(game)
+        # 품질 단계가 낮으면 점수 등 HUD 글자를 몇 프레임에 한 번만 다시 렌더링
+        self.frame_count += 1
+        if repaint or self.frame_count % GRAPHICS['hud_interval'] == 0:
+            self.update_hud(game)
+        # 별이 움직인 영역과 직전 프레임 적 총알 영역을 함께 다시 그림
+        if repaint or dirty is None or len(self.bullet_rects) > DIRTY_BULLET_LIMIT:
+            self.repaint(None)
+        else:
+            self.repaint(dirty + self.bullet_rects)
+        self.merge_lost_rects()
+        moved = self.interpolate(alpha)
+        rects = self.layers.draw(self.screen)
+        # 그리기용으로 옮긴 위치를 시뮬레이션 위치로 되돌림
+        for sprite, topleft in moved:
+            sprite.rect.topleft = topleft
+        rects.extend(self.draw_bullets(game.enemy_bullets, alpha))
+        return rects
+
+    def draw_bullets(self, bullets, alpha):
+        """적 총알을 blits() 한 번으로 그리고 화면에 반영할 영역 반환
+
+        총알은 스프라이트가 아니므로 LayeredDirty 위에 따로 그리고, 다음
+        프레임에 그 영역을 다시 그려 지운다. 그래서 점수 글자보다 위에 그려진다.
+        """
+        sequence = bullets.blit_sequence(alpha)
+        if not sequence:
+            self.bullet_rects = []
+            return []
+        self.bullet_rects = self.screen.blits(sequence)
+        if len(self.bullet_rects) > DIRTY_BULLET_LIMIT:
+            return [self.screen.get_rect()]
+        return self.bullet_rects
+
+    def interpolate(self, alpha):
+        """스프라이트를 직전 틱과 현재 틱 위치 사이(alpha)로 옮기고 (스프라이트, 원래 위치) 목록 반환"""
+        moved = []
+        if alpha >= 1.0:
+            return moved
+        for sprite in self.layers:
+            prev = getattr(sprite, 'prev_topleft', None)
+            if prev is None:
+                continue
+            x, y = sprite.rect.topleft
+            dx, dy = x - prev[0], y - prev[1]
+            # 정지했거나 순간 이동(리스폰, 진형 배치 등)한 경우는 보간하지 않음
+            if (dx == 0 and dy == 0) or abs(dx) + abs(dy) > INTERPOLATION_MAX_JUMP:
+                continue
+            moved.append((sprite, (x, y)))
+            sprite.rect.topleft = (prev[0] + dx * alpha, prev[1] + dy * alpha)
+        return moved
+
+# 화면 출력: 논리 해상도(SCREEN_WIDTH x SCREEN_HEIGHT)로 그린 화면을 창 크기에 맞게 표시
+DISPLAY_MODES = ('scaled', 'integer')
+
+class Presenter:
+    """논리 해상도 화면을 실제 창/전체 화면에 표시
+
+    - scaled: pygame SCALED 모드. 게임은 논리 해상도 화면에 그대로 그리고,
+      확대는 SDL이 GPU에서 한 번에 처리하므로 4K 전체 화면도 CPU 비용이 같다.
+    - integer: 화면 밖 논리 Surface에 그린 뒤 바뀐 영역만 정수 배율로
+      확대해 창에 복사한다 (남는 부분은 검은 여백). GPU 확대를 쓸 수 없는
+      환경용이며, 확대 비용은 바뀐 영역 넓이에 비례한다.
+    """
+    def __init__(self, mode='scaled', fullscreen=False, scale=None):
+        self.mode = mode
+        self.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if mode == 'scaled':
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else pygame.RESIZABLE)
+            self.window = pygame.display.set_mode(self.logical_size, flags)
+            self.surface = self.window
+            self.factor = 1
+            self.offset = (0, 0)
+            return
+        if fullscreen:
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            if scale is None:
+                scale = self.fit_scale(*pygame.display.get_desktop_sizes()[0])
+            scale = max(1, scale)
+            size = (SCREEN_WIDTH * scale, SCREEN_HEIGHT * scale)
+            self.window = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.surface = pygame.Surface(self.logical_size).convert()
+        self.layout()
+
+    def fit_scale(self, width, height):
+        """주어진 크기 안에 들어가는 가장 큰 정수 배율 (최소 1)"""
+        return max(1, min(width // SCREEN_WIDTH, height // SCREEN_HEIGHT))
+
+    def layout(self):
+        """창 크기에 맞춰 정수 배율과 가운데 정렬 위치를 다시 계산"""
+        width, height = self.window.get_size()
+        self.factor = self.fit_scale(width, height)
+        self.offset = ((width - SCREEN_WIDTH * self.factor) // 2,
+                       (height - SCREEN_HEIGHT * self.factor) // 2)
+        self.window.fill((0, 0, 0))
+
+    def handle_events(self, events):
+        """창 크기 변경 시 배치를 다시 계산하고 다음 표시 때 전체를 그리도록 True 반환"""
+        if self.mode == 'scaled':
+            return False
+        resized = False
+        for event in events:
+            if event.type in (pygame.VIDEORESIZE, pygame.WINDOWSIZECHANGED):
+                self.window = pygame.display.get_surface()
+                resized = True
+        if resized:
+            self.layout()
+        return resized
+
+    def present(self, rects, full=False):
+        """논리 화면에서 바뀐 영역(rects)을 창에 반영"""
+        if self.mode == 'scaled':
+            pygame.display.update(rects)
+            return
+        if full:
+            rects = [self.surface.get_rect()]
+        factor = self.factor
+        ox, oy = self.offset
+        updated = []
+        for rect in rects:
+            rect = rect.clip(self.surface.get_rect())
+            if not rect:
+                continue
+            dest = pygame.Rect(ox + rect.x * factor, oy + rect.y * factor,
+                               rect.w * factor, rect.h * factor)
+            if factor == 1:
+                self.window.blit(self.surface, dest, rect)
+            else:
+                # 새 Surface를 만들지 않고 창의 해당 영역에 바로 확대
+                pygame.transform.scale(self.surface.subsurface(rect), dest.size,
+                                       self.window.subsurface(dest))
+            updated.append(dest)
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(updated)
+
+# 입력 기록/재생
+def read_input_bits(events):
+    """pygame 이벤트와 현재 키 상태를 프레임 입력 비트로 변환 (종료 요청 시 None)"""
+    bits = 0
+    for event in events:
+        if event.type == pygame.QUIT:
+            return None
+        if event.type == pygame.KEYDOWN:
+            bits |= KEYDOWN_BITS.get(event.key, 0)
+    keys = pygame.key.get_pressed()
+    if keys[pygame.K_LEFT]:
+        bits |= INPUT_LEFT
+    if keys[pygame.K_RIGHT]:
+        bits |= INPUT_RIGHT
+    return bits
+
+def bot_input(game):
+    """스크립트 자동 플레이어의 이번 프레임 입력 비트
+
+    적 총알/트랙터 빔이 머리 위에 있으면 피하고, 아니면 가장 가까운 적
+    아래로 이동하면서 계속 발사한다. 헤드리스 시뮬레이션 도구에서 사용.
+    """
+    player = game.player
+    px = player.rect.centerx
+    bits = INPUT_SPACE
+    # 회피 대상: 플레이어 바로 위로 내려오는 적 총알 또는 활성 트랙터 빔
+    threat_x = None
+    bullets = game.enemy_bullets
+    if bullets.count:
+        n = bullets.count
+        size = BULLET_SIZES[bullets.kind[:n]]
+        centers_x = bullets.x[:n] + size[:, 0] / 2
+        bottoms = bullets.y[:n] + size[:, 1]
+        danger = np.flatnonzero((np.abs(centers_x - px) < 28) &
+                                (bottoms > player.rect.top - 140) & (bottoms < player.rect.bottom))
+        if len(danger):
+            threat_x = centers_x[danger[0]]
+    if threat_x is None:
+        for beam in game.tractor_beams_group:
+            if beam.active and abs(beam.rect.centerx - px) < 40:
+                threat_x = beam.rect.centerx
+                break
+    if threat_x is not None:
+        # 위협 반대쪽으로 이동 (벽에 붙었으면 반대 방향)
+        go_left = threat_x >= px
+        if go_left and player.rect.left <= 0:
+            go_left = False
+        elif not go_left and player.rect.right >= SCREEN_WIDTH:
+            go_left = True
+        return bits | (INPUT_LEFT if go_left else INPUT_RIGHT)
+    target = min(game.enemies_group, key=lambda e: abs(e.rect.centerx - px), default=None)
+    if target is not None:
+        dx = target.rect.centerx - px
+        if dx < -4:
+            bits |= INPUT_LEFT
+        elif dx > 4:
+            bits |= INPUT_RIGHT
+    return bits
+
+class InputRecorder:
+    """틱별 입력 비트를 [비트, 반복 횟수] 런렝스 형식으로 기록"""
+    def __init__(self, game):
+        self.game = game
+        self.runs = []
+        self.frames = 0
+
+    def append(self, bits):
+        if self.runs and self.runs[-1][0] == bits:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([bits, 1])
+        self.frames += 1
+
+    def save(self, path):
+        data = {
+            'version': REPLAY_VERSION,
+            'seed': self.game.seed,
+            'tick_rate': TICK_RATE,
+            'config': self.game.config,
+            'star_density': self.game.starfield.density,
+            'bullet_hell': self.game.bullet_hell,
+            'frames': self.frames,
+            'final_hash': self.game.state_hash(),
+            'inputs': self.runs,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+def load_recording(path):
+    """기록 파일 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        recording = json.load(f)
+    if recording.get('version') != REPLAY_VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전: {recording.get('version')}")
+    return recording
+
+def iter_recorded_inputs(recording):
+    """기록된 런렝스 입력을 틱 단위 비트로 풀어서 반환"""
+    for bits, count in recording['inputs']:
+        for _ in range(count):
+            yield bits
+
+def game_from_recording(recording):
+    """기록과 같은 seed/설정으로 결정적 게임 생성 (하이스코어 파일은 건드리지 않음)"""
+    return GalagaGame(seed=recording['seed'], config=recording['config'], persist_highscore=False,
+                      star_density=recording.get('star_density', 1.0),
+                      bullet_hell=recording.get('bullet_hell', False))
+
+def replay_headless(recording, profile_path=None, trace_memory=False):
+    """화면 없이 최대 속도로 리플레이를 재실행하고 결과 해시를 검증 (profile_path가 있으면 틱마다 계측)"""
+    game = game_from_recording(recording)
+    profiler = FrameProfiler(profile_path, game, trace_memory) if profile_path else None
+    start = time.perf_counter()
+    try:
+        for bits in iter_recorded_inputs(recording):
+            game.step(bits)
+            if profiler:
+                profiler.sample(game)
+    finally:
+        if profiler:
+            profiler.close()
+    elapsed = time.perf_counter() - start
+    frames = recording['frames']
+    matched = game.state_hash() == recording['final_hash']
+    print(f"틱: {frames}, 소요 시간: {elapsed:.3f}초, "
+          f"평균 틱 시간: {elapsed * 1000 / max(frames, 1):.3f}ms")
+    print(f"점수: {game.score}, 스테이지: {game.wave}, 리플레이 일치: {'예' if matched else '아니오'}")
+    return matched
+
+# 그래픽 품질 자동 조절
+QUALITY_WINDOW = 30  # 이동 평균에 쓰는 최근 프레임 수
+QUALITY_COOLDOWN = 60  # 단계를 바꾼 뒤 다시 바꾸기까지 최소 프레임 수
+QUALITY_DEGRADE_RATIO = 0.9  # 평균 작업 시간이 예산의 이 비율을 넘으면 품질을 낮춤
+QUALITY_RESTORE_RATIO = 0.5  # 이 비율 아래로 내려가면 품질을 한 단계 올림
+
+class QualityGovernor:
+    """프레임 작업 시간의 이동 평균으로 그래픽 품질 단계를 조절
+
+    clock.tick()이 기다린 시간을 뺀 실제 작업 시간(get_rawtime)을 프레임마다
+    받아, 프레임 예산(1000/FPS ms)을 넘을 것 같으면 별 개수/폭발 프레임/폭탄
+    원 개수/HUD 갱신 주기를 한 단계씩 줄이고, 여유가 생기면 다시 올린다.
+    단계를 바꾼 직후에는 QUALITY_COOLDOWN 프레임 동안 유지해 오르내림을 막는다.
+    pinned를 주면 그 단계로 고정한다.
+    """
+    def __init__(self, budget_ms=1000 / FPS, pinned=None):
+        self.budget_ms = budget_ms
+        self.pinned = pinned is not None
+        self.samples = collections.deque(maxlen=QUALITY_WINDOW)
+        self.cooldown = QUALITY_COOLDOWN
+        self.changes = 0
+        self.frames_at_level = [0] * len(QUALITY_LEVELS)
+        self.set_level(pinned or 0)
+
+    @property
+    def level(self):
+        """현재 품질 단계"""
+        return GRAPHICS['level']
+
+    def set_level(self, level):
+        """품질 단계 적용 (GRAPHICS 갱신)"""
+        GRAPHICS.update(QUALITY_LEVELS[level], level=level)
+
+    def record(self, work_ms):
+        """프레임 하나의 작업 시간(ms) 반영, 단계가 바뀌었으면 True"""
+        self.frames_at_level[self.level] += 1
+        if self.pinned:
+            return False
+        self.samples.append(work_ms)
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+        average = sum(self.samples) / len(self.samples)
+        level = self.level
+        if average > self.budget_ms * QUALITY_DEGRADE_RATIO and level < len(QUALITY_LEVELS) - 1:
+            level += 1
+        elif average < self.budget_ms * QUALITY_RESTORE_RATIO and level > 0:
+            level -= 1
+        else:
+            return False
+        self.set_level(level)
+        self.changes += 1
+        self.cooldown = QUALITY_COOLDOWN
+        self.samples.clear()
+        return True
+
+    def describe(self):
+        """창 제목 등에 표시할 현재 단계"""
+        mode = "고정" if self.pinned else "자동"
+        return f"품질 {self.level}/{len(QUALITY_LEVELS) - 1} ({mode})"
+
+    def report(self):
+        """단계별 프레임 수 요약"""
+        total = max(sum(self.frames_at_level), 1)
+        parts = [f"{level}단계 {count / total:.0%}" for level, count in enumerate(self.frames_at_level) if count]
+        return f"품질 단계 변경 {self.changes}회: " + ", ".join(parts)
+
+# 프레임 프로파일러
+PROFILE_VERSION = 1
+PROFILE_TOGGLE_KEY = pygame.K_F3
+PROFILE_GROUPS = ('all_sprites', 'enemies_group', 'bullets_group', 'explosions_group',
+                  'items_group', 'tractor_beams_group', 'shield_effects_group', 'bomb_effects_group')
+PROFILE_WINDOW = 120  # 실시간 요약에 쓰는 최근 프레임 수
+PROFILE_PANEL_INTERVAL = 30  # 요약 패널을 다시 그리는 프레임 간격
+
+class FrameProfiler:
+    """프레임마다 엔티티 수/할당/GC를 기록하는 선택형 계측 (--profile)
+
+    한 프레임에 한 줄씩 JSON Lines로 쓴다. 첫 줄은 헤더(그룹 이름 순서 등)이고,
+    이후 줄의 키는 짧게 줄이고 0인 값은 생략한다.
+        f: 프레임 번호, t: 게임 시각(ms), ms: 프레임 시간, g: 그룹별 크기(헤더 순서, 마지막은 적 총알)
+        new: 이번 프레임에 생성된 스프라이트 종류별 수
+        blk: 파이썬 메모리 블록 증감, gc: 세대별 GC 횟수, gc_ms: GC 멈춤 시간
+        ph: 단계별 소요 시간(ms, 헤더의 phases 순서), q: 그래픽 품질 단계, mem: tracemalloc 현재 사용량
+        (KB, --profile-tracemalloc일 때만), ev: 게임 이벤트
+    """
+    def __init__(self, path, game, trace_memory=False):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.frame = 0
+        self.last_time = time.perf_counter()
+        self.blocks = sys.getallocatedblocks()
+        self.created = SPRITES_CREATED.copy()
+        self.phase_time = dict(game.phase_time)
+        self.gc_started = None
+        self.gc_pause = 0.0
+        self.gc_counts = [0, 0, 0]
+        self.trace_memory = trace_memory
+        self.recent = collections.deque(maxlen=PROFILE_WINDOW)
+        self.panel = None
+        self.state = self.snapshot(game)
+        if trace_memory:
+            tracemalloc.start()
+        gc.callbacks.append(self.on_gc)
+        self.write({'version': PROFILE_VERSION, 'seed': game.seed,
+                    'groups': list(PROFILE_GROUPS) + ['enemy_bullets'], 'phases': list(PHASES),
+                    'tracemalloc': trace_memory})
+
+    def write(self, record):
+        """기록 한 줄 (공백 없는 JSON)"""
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def on_gc(self, phase, info):
+        """gc.callbacks: 수집 시작/끝 시각으로 멈춤 시간과 세대별 횟수 집계"""
+        if phase == 'start':
+            self.gc_started = time.perf_counter()
+        elif self.gc_started is not None:
+            self.gc_pause += time.perf_counter() - self.gc_started
+            self.gc_counts[info['generation']] += 1
+            self.gc_started = None
+
+    def snapshot(self, game):
+        """이벤트 감지용 게임 상태"""
+        return (game.formation, game.stage_clear, game.player.lives, game.game_over,
+                len(game.bomb_effects_group), game.paused)
+
+    def events(self, game):
+        """직전 프레임과 비교해 일어난 게임 이벤트 이름 목록"""
+        formation, clear, lives, over, bombs, paused = self.state
+        state = self.snapshot(game)
+        self.state = state
+        events = []
+        if state[0] is not formation:
+            events.append('stage')
+        if state[1] and not clear:
+            events.append('clear')
+        if state[2] < lives:
+            events.append('hit')
+        if state[3] and not over:
+            events.append('gameover')
+        if state[4] > bombs:
+            events.append('bomb')
+        if state[5] != paused:
+            events.append('pause' if state[5] else 'resume')
+        return events
+
+    def sample(self, game):
+        """프레임 하나가 끝날 때 호출: 한 줄 기록하고 요약 패널 갱신"""
+        now = time.perf_counter()
+        frame_ms = (now - self.last_time) * 1000
+        self.last_time = now
+        blocks = sys.getallocatedblocks()
+        created = {name: count - self.created[name] for name, count in SPRITES_CREATED.items()
+                   if count != self.created[name]}
+        self.created = SPRITES_CREATED.copy()
+        groups = [len(getattr(game, name)) for name in PROFILE_GROUPS]
+        groups.append(len(game.enemy_bullets))
+        phases = [round((game.phase_time[name] - self.phase_time[name]) * 1000, 3) for name in PHASES]
+        self.phase_time = dict(game.phase_time)
+        record = {'f': self.frame, 't': game.now(), 'ms': round(frame_ms, 2), 'g': groups, 'ph': phases}
+        if created:
+            record['new'] = created
+        if blocks != self.blocks:
+            record['blk'] = blocks - self.blocks
+        if any(self.gc_counts):
+            record['gc'] = self.gc_counts
+            record['gc_ms'] = round(self.gc_pause * 1000, 3)
+        if GRAPHICS['level']:
+            record['q'] = GRAPHICS['level']
+        if self.trace_memory:
+            record['mem'] = tracemalloc.get_traced_memory()[0] // 1024
+        events = self.events(game)
+        if events:
+            record['ev'] = events
+        self.write(record)
+        self.recent.append((frame_ms, sum(created.values()), blocks - self.blocks,
+                            self.gc_pause * 1000, tuple(self.gc_counts), groups, phases))
+        self.blocks = blocks
+        self.gc_pause = 0.0
+        self.gc_counts = [0, 0, 0]
+        self.frame += 1
+        if self.panel is not None and self.panel.visible and self.frame % PROFILE_PANEL_INTERVAL == 0:
+            self.panel.set_lines(self.summary_lines())
+
+    def summary_lines(self):
+        """최근 PROFILE_WINDOW 프레임 요약 (실시간 패널 내용)"""
+        if not self.recent:
+            return ["프로파일: 데이터 없음"]
+        frame_ms = sorted(r[0] for r in self.recent)
+        n = len(self.recent)
+        seconds = max(sum(frame_ms) / 1000, 1e-9)
+        gc_counts = [sum(r[4][i] for r in self.recent) for i in range(3)]
+        groups = self.recent[-1][5]
+        lines = [
+            f"프레임 {frame_ms[n // 2]:.1f}ms (최대 {frame_ms[-1]:.1f}ms, 최근 {n}프레임)",
+            f"스프라이트 {groups[0]} 적 {groups[1]} 총알 {groups[2]} 적총알 {groups[-1]} 폭발 {groups[3]}",
+            f"생성/초: 스프라이트 {sum(r[1] for r in self.recent) / seconds:.0f}",
+            f"메모리 블록 {sum(r[2] for r in self.recent) / seconds:+.0f}/초",
+            f"GC {gc_counts[0]}/{gc_counts[1]}/{gc_counts[2]}회, 최대 멈춤 {max(r[3] for r in self.recent):.2f}ms, "
+            f"품질 {GRAPHICS['level']}단계",
+            "단계(ms): " + " ".join(f"{name} {sum(r[6][i] for r in self.recent) / n:.2f}"
+                                   for i, name in enumerate(PHASES)),
+        ]
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"tracemalloc {current / 1024 / 1024:.1f}MB (최대 {peak / 1024 / 1024:.1f}MB)")
+        return lines
+
+    def attach_panel(self, renderer):
+        """F3으로 켜고 끄는 실시간 요약 패널을 렌더러에 추가"""
+        self.panel = TextPanel(get_korean_font(16), (10, 70))
+        renderer.layers.add(self.panel)
+
+    def toggle_panel(self):
+        """실시간 요약 패널 표시 전환"""
+        if self.panel is None:
+            return
+        self.panel.visible = 0 if self.panel.visible else 1
+        if self.panel.visible:
+            self.panel.set_lines(self.summary_lines())
+
+    def close(self):
+        """계측 해제 및 로그 파일 닫기"""
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+        if self.trace_memory:
+            tracemalloc.stop()
+        self.file.close()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Galaga (Python Edition)")
+    parser.add_argument('--seed', type=int, help="난수 seed (지정 시 결정적 모드)")
+    parser.add_argument('--record', metavar='PATH', help="입력을 기록할 리플레이 파일 (결정적 모드)")
+    parser.add_argument('--replay', metavar='PATH', help="재생할 리플레이 파일")
+    parser.add_argument('--headless', action='store_true', help="화면 없이 최대 속도로 리플레이 (--replay 필요)")
+    parser.add_argument('--star-density', type=float, default=1.0, help="별 개수 배율 (1.0 = 60개)")
+    parser.add_argument('--bullet-hell', action='store_true', help="탄막 모드 (적이 원형/부채꼴 탄막을 대량 발사)")
+    parser.add_argument('--quality', default='auto', choices=['auto'] + [str(i) for i in range(len(QUALITY_LEVELS))],
+                        help="그래픽 품질 단계 (0 = 최고, auto = 프레임 시간에 따라 자동 조절)")
+    parser.add_argument('--display', default='scaled', choices=DISPLAY_MODES,
+                        help="화면 확대 방식 (scaled = GPU 확대, integer = 정수 배율 소프트웨어 확대)")
+    parser.add_argument('--fullscreen', action='store_true', help="전체 화면으로 실행")
+    parser.add_argument('--scale', type=int, help="--display integer 창 배율 (기본: 모니터에 맞는 최대 정수 배율)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="프레임마다 엔티티 수/할당/GC를 JSON Lines로 기록 (F3: 실시간 요약)")
+    parser.add_argument('--profile-tracemalloc', action='store_true',
+                        help="--profile에 tracemalloc 메모리 사용량도 기록 (느려짐)")
+    parser.add_argument('--asset-report', action='store_true', help="종료 시 첫 화면까지 걸린 시간, 리소스별 로딩 시간, 효과음 재생 통계 출력")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    launch_time = time.perf_counter()
+    args = parse_args(argv)
+    if args.headless:
+        if not args.replay:
+            print("--headless는 --replay와 함께 사용해야 합니다.")
+            return 2
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+    # 게임 초기화
+    pygame.init()
+
+    recording = load_recording(args.replay) if args.replay else None
+    if args.headless:
+        matched = replay_headless(recording, args.profile, args.profile_tracemalloc)
+        pygame.quit()
+        return 0 if matched else 1
+
+    presenter = Presenter(args.display, args.fullscreen, args.scale)
+    governor = QualityGovernor(pinned=None if args.quality == 'auto' else int(args.quality))
+    pygame.display.set_caption(f"Galaga (Python Edition) - {governor.describe()}")
+    clock = pygame.time.Clock()
+    renderer = GalagaRenderer(presenter.surface, get_korean_font(24))
+
+    if recording is not None:
+        game = game_from_recording(recording)
+        replay_inputs = iter_recorded_inputs(recording)
+    else:
+        game = GalagaGame(seed=args.seed, star_density=args.star_density, bullet_hell=args.bullet_hell)
+        replay_inputs = None
+    recorder = InputRecorder(game) if args.record else None
+    profiler = None
+    if args.profile:
+        profiler = FrameProfiler(args.profile, game, args.profile_tracemalloc)
+        profiler.attach_panel(renderer)
+
+    # 고정 틱 루프: 실제 경과 시간을 누적해 TICK_MS마다 로직 1틱을 진행하고,
+    # 그리기는 남은 누적 시간 비율로 두 틱 사이를 보간한다.
+    accumulator = 0.0
+    pending_bits = 0  # 아직 어떤 틱에도 전달되지 않은 키 누름
+    first_frame_ms = None
+    running = True
+    try:
+        while running:
+            accumulator += min(clock.tick(FPS), MAX_FRAME_MS)
+            # 직전 프레임의 실제 작업 시간(대기 제외)으로 그래픽 품질 조절
+            if governor.record(clock.get_rawtime()):
+                pygame.display.set_caption(f"Galaga (Python Edition) - {governor.describe()}")
+            events = pygame.event.get()
+            resized = presenter.handle_events(events)
+            bits = read_input_bits(events)
+            if bits is None:
+                break
+            if profiler and any(event.type == pygame.KEYDOWN and event.key == PROFILE_TOGGLE_KEY
+                                for event in events):
+                profiler.toggle_panel()
+            pending_bits |= bits & ~HELD_BITS
+            ticks = 0
+            while accumulator >= TICK_MS and ticks < MAX_TICKS_PER_FRAME:
+                if replay_inputs is not None:
+                    tick_bits = next(replay_inputs, None)
+                    if tick_bits is None:
+                        running = False
+                        break
+                else:
+                    tick_bits = (bits & HELD_BITS) | pending_bits
+                    pending_bits = 0
+                game.step(tick_bits)
+                if recorder:
+                    recorder.append(tick_bits)
+                accumulator -= TICK_MS
+                ticks += 1
+            # 따라잡지 못한 시간은 버림 (느린 기기에서는 게임이 느려지되 순간 이동은 없음)
+            accumulator = min(accumulator, TICK_MS)
+            # 이번 프레임 틱들에서 요청된 효과음을 합쳐 한 번에 재생
+            ASSETS.flush_sounds()
+            # 바뀐 영역만 화면에 반영 (창 크기가 바뀌면 전체)
+            presenter.present(game.run_phase(PHASE_RENDER, renderer.draw, game, accumulator / TICK_MS),
+                              full=resized)
+            if profiler:
+                profiler.sample(game)
+            if first_frame_ms is None:
+                # 첫 화면을 띄운 뒤 시작 화면이 떠 있는 동안 효과음을 백그라운드에서 로딩
+                first_frame_ms = (time.perf_counter() - launch_time) * 1000
+                ASSETS.preload()
+    finally:
+        # 비정상 종료 시에도 기록을 남겨 재현에 사용
+        if recorder:
+            recorder.save(args.record)
+            print(f"리플레이 저장: {args.record} (seed={game.seed}, 틱={recorder.frames})")
+        if profiler:
+            profiler.close()
+            print(f"프로파일 저장: {args.profile} ({profiler.frame}프레임)")
+        if governor.changes:
+            print(governor.report())
+        if game.highscore_store:
+            game.highscore_store.close()
+        if args.asset_report:
+            if first_frame_ms is not None:
+                print(f"첫 화면까지: {first_frame_ms:.1f}ms")
+            print(ASSETS.report())
+            print(ASSETS.voices.report())
+        pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+갤러그 프레임 시간 벤치마크
+
+정해진 장면(시나리오)을 화면 없이(SDL dummy 드라이버) 만들어 놓고 같은 수의
+프레임을 돌리면서, 프레임마다 로직(update), 충돌 판정(collision), 그리기(draw)
+시간을 따로 잽니다.
+- 시나리오별 p50/p95/p99/최대 프레임 시간(ms) 표 출력
+- --save-baseline으로 결과를 저장해 두고, 이후 --baseline으로 비교해
+  지정한 비율 이상 느려진 시나리오가 있으면 종료 코드 1로 실패
+
+사용 예:
+    python galaga_bench.py --save-baseline bench_baseline.json
+    python galaga_bench.py --baseline bench_baseline.json --threshold 0.2
+    python galaga_bench.py --scenario formation --scenario bullets --frames 1200
+"""
+
+import os
+
+# pygame import 전에 화면/오디오 없는 드라이버 지정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import numpy as np
+import pygame
+
+import galaga
+
+BASELINE_VERSION = 1
+PARTS = ('update', 'collision', 'draw', 'total')
+METRICS = ('p50', 'p95', 'p99', 'max')
+FULL_FORMATION_WAVE = 8  # 기본 설정에서 12열 x 5줄 진형이 나오는 스테이지
+DIVERS = 30
+BULLET_HELL_DIVERS = 12
+PLAYER_BULLETS = 200
+TRANSITION_INTERVAL = 30  # 프레임마다 한 번씩 스테이지 전환
+MIN_REGRESSION_MS = 0.1  # 이보다 작은 차이는 측정 잡음으로 보고 회귀로 치지 않음
+
+def new_game(seed, wave=FULL_FORMATION_WAVE, bullet_hell=False):
+    """시작 화면을 넘기고 진형이 모두 자리 잡은 상태의 게임 생성
+
+    벤치마크 도중 게임 오버가 되지 않도록 목숨은 충분히 늘려 둔다.
+    """
+    game = galaga.GalagaGame(seed=seed, persist_highscore=False, bullet_hell=bullet_hell)
+    game.step(galaga.INPUT_SPACE)
+    if game.wave != wave:
+        game.load_stage(wave)
+    # 시작 직후 금지 기간에는 적이 모두 진형으로 모이므로 등장이 끝날 때까지 진행
+    while any(enemy.entrance for enemy in game.enemies_group):
+        game.stage_start_time = game.now()
+        game.step(0)
+    # 금지 기간을 끝내 발사/돌진이 바로 시작되게 함
+    game.stage_start_time = game.now() - game.missile_cooldown_duration - 1
+    game.player.lives = 10**6
+    return game
+
+def make_tough(game):
+    """적이 총알에 맞아도 죽지 않게 해서 진형 크기를 유지"""
+    for enemy in game.enemies_group:
+        enemy.hp = 10**9
+
+def keep_diving(game, count):
+    """돌진 중인 적이 count마리가 되도록 진형의 적을 돌진시킴"""
+    diving = sum(1 for enemy in game.enemies_group if not enemy.in_formation)
+    for enemy in game.enemies_group:
+        if diving >= count:
+            break
+        if enemy.in_formation and not enemy.entrance and not enemy.returning_to_formation:
+            enemy.start_dive()
+            diving += 1
+
+def scenario_formation(seed):
+    """12x5 진형이 제자리에서 좌우로만 움직임 (돌진/빔 타이머 제거)"""
+    game = new_game(seed)
+    game.scheduler.clear()
+
+    def before_frame(game, frame):
+        return 0
+    return game, before_frame
+
+def scenario_dive(seed):
+    """적 30마리가 계속 돌진 중 (진형으로 돌아온 적은 다시 돌진시킴)"""
+    game = new_game(seed)
+    game.scheduler.clear()
+    make_tough(game)
+
+    def before_frame(game, frame):
+        keep_diving(game, DIVERS)
+        return galaga.bot_input(game) & galaga.HELD_BITS
+    return game, before_frame
+
+def scenario_bullets(seed):
+    """더블샷 연사 + 화면 위 플레이어 총알 200발 유지"""
+    game = new_game(seed)
+    make_tough(game)
+    game.player.double_fire = True
+    rng = random.Random(seed)
+
+    def before_frame(game, frame):
+        for _ in range(PLAYER_BULLETS - len(game.bullets_group)):
+            bullet = galaga.Bullet(rng.randrange(galaga.SCREEN_WIDTH), rng.randrange(60, galaga.SCREEN_HEIGHT))
+            game.all_sprites.add(bullet)
+            game.bullets_group.add(bullet)
+        return (galaga.bot_input(game) & galaga.HELD_BITS) | galaga.INPUT_SPACE
+    return game, before_frame
+
+def scenario_bomb(seed):
+    """폭탄 아이템을 폭발 효과가 끝날 때마다 플레이어 위치에 떨어뜨림"""
+    game = new_game(seed)
+    bomb_type = next(item for item in galaga.ITEM_TYPES if item['name'] == 'bomb')
+
+    def before_frame(game, frame):
+        if len(game.enemies_group) < 20:
+            game.load_stage(FULL_FORMATION_WAVE)
+            game.stage_start_time = game.now() - game.missile_cooldown_duration - 1
+        if frame % galaga.BOMB_TICKS == 0:
+            item = galaga.Item(game.player.rect.centerx, game.player.rect.centery, bomb_type)
+            game.all_sprites.add(item)
+            game.items_group.add(item)
+        return galaga.bot_input(game)
+    return game, before_frame
+
+def scenario_transition(seed):
+    """일정 프레임마다 적을 모두 없애고 다음 스테이지로 넘어감 (진형 생성 + 전체 다시 그리기)"""
+    game = new_game(seed)
+
+    def before_frame(game, frame):
+        if game.stage_clear:
+            return galaga.INPUT_NEXT
+        if frame % TRANSITION_INTERVAL == 0:
+            for enemy in list(game.enemies_group):
+                enemy.kill()
+        return galaga.bot_input(game)
+    return game, before_frame
+
+def scenario_bullet_hell(seed):
+    """탄막 모드로 돌진 중인 적들이 원형/부채꼴 탄막 발사 (적 총알 수백 발)"""
+    game = new_game(seed, bullet_hell=True)
+    make_tough(game)
+
+    def before_frame(game, frame):
+        keep_diving(game, BULLET_HELL_DIVERS)
+        return galaga.bot_input(game)
+    return game, before_frame
+
+SCENARIOS = {
+    'formation': scenario_formation,
+    'dive': scenario_dive,
+    'bullets': scenario_bullets,
+    'bomb': scenario_bomb,
+    'transition': scenario_transition,
+    'bullet_hell': scenario_bullet_hell,
+}
+
+def run_scenario(name, renderer, frames, warmup, seed):
+    """시나리오 하나를 실행하고 부분별 프레임 시간 배열(ms) 반환"""
+    game, before_frame = SCENARIOS[name](seed)
+    phase_time = game.phase_time
+    samples = np.zeros((frames, 3))
+    for frame in range(warmup + frames):
+        bits = before_frame(game, frame)
+        collision = phase_time[galaga.PHASE_COLLISION]
+        start = time.perf_counter()
+        game.step(bits)
+        stepped = time.perf_counter()
+        game.run_phase(galaga.PHASE_RENDER, renderer.draw, game)
+        drawn = time.perf_counter()
+        if frame >= warmup:
+            collision = phase_time[galaga.PHASE_COLLISION] - collision
+            samples[frame - warmup] = (stepped - start - collision, collision, drawn - stepped)
+    samples *= 1000
+    return {'update': samples[:, 0], 'collision': samples[:, 1], 'draw': samples[:, 2],
+            'total': samples.sum(axis=1)}
+
+def summarize(samples):
+    """부분별 p50/p95/p99/최대값(ms)"""
+    result = {}
+    for part in PARTS:
+        values = samples[part]
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        result[part] = {'p50': round(float(p50), 4), 'p95': round(float(p95), 4),
+                        'p99': round(float(p99), 4), 'max': round(float(values.max()), 4)}
+    return result
+
+def print_results(results):
+    """시나리오/부분별 결과 표 출력"""
+    print(f"{'시나리오':<12} {'부분':<10} {'p50':>8} {'p95':>8} {'p99':>8} {'최대':>8}  (ms)")
+    for name, parts in results.items():
+        for part in PARTS:
+            stats = parts[part]
+            label = name if part == PARTS[0] else ''
+            print(f"{label:<12} {part:<10} {stats['p50']:>8.3f} {stats['p95']:>8.3f} "
+                  f"{stats['p99']:>8.3f} {stats['max']:>8.3f}")
+
+def compare(results, baseline, metric, threshold):
+    """기준 결과보다 threshold 비율 넘게 느려진 (시나리오, 부분) 목록
+
+    충돌 판정처럼 원래 아주 짧은 부분은 비율만 보면 잡음에도 실패하므로
+    MIN_REGRESSION_MS 이상 늘어난 경우만 센다.
+    """
+    regressions = []
+    for name, parts in results.items():
+        base = baseline['scenarios'].get(name)
+        if base is None:
+            continue
+        for part in PARTS:
+            old = base[part][metric]
+            new = parts[part][metric]
+            if new > old * (1 + threshold) and new - old > MIN_REGRESSION_MS:
+                regressions.append((name, part, old, new))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러그 시나리오별 프레임 시간 벤치마크 (헤드리스)")
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS),
+                        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument('--frames', type=int, default=600, help="시나리오당 측정 프레임 수")
+    parser.add_argument('--warmup', type=int, default=60, help="측정 전에 버리는 프레임 수")
+    parser.add_argument('--seed', type=int, default=1, help="시나리오 seed")
+    parser.add_argument('--quality', type=int, default=0, choices=range(len(galaga.QUALITY_LEVELS)),
+                        help="고정할 그래픽 품질 단계 (0 = 최고)")
+    parser.add_argument('--out', metavar='PATH', help="결과를 JSON으로 저장할 경로")
+    parser.add_argument('--save-baseline', metavar='PATH', help="결과를 기준값으로 저장")
+    parser.add_argument('--baseline', metavar='PATH', help="비교할 기준값 파일")
+    parser.add_argument('--metric', choices=METRICS, default='p95', help="기준값 비교에 쓸 지표")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="기준값보다 이 비율 넘게 느려지면 실패 (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+    if args.frames <= 0:
+        parser.error("--frames는 1 이상이어야 합니다.")
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"오류: 기준값 파일을 읽을 수 없습니다: {e}")
+            return 2
+        if baseline.get('version') != BASELINE_VERSION:
+            print(f"오류: 지원하지 않는 기준값 버전: {baseline.get('version')}")
+            return 2
+
+    pygame.init()
+    screen = pygame.display.set_mode((galaga.SCREEN_WIDTH, galaga.SCREEN_HEIGHT))
+    renderer = galaga.GalagaRenderer(screen, galaga.get_korean_font(24))
+    galaga.QualityGovernor(pinned=args.quality)
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = summarize(run_scenario(name, renderer, args.frames, args.warmup, args.seed))
+    pygame.quit()
+    print_results(results)
+
+    report = {'version': BASELINE_VERSION, 'frames': args.frames, 'seed': args.seed, 'quality': args.quality,
+              'python': sys.version.split()[0], 'pygame': pygame.version.ver, 'scenarios': results}
+    for path in (args.out, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.metric, args.threshold)
+        if regressions:
+            print(f"\n기준값 대비 {args.metric} {args.threshold:.0%} 넘게 느려짐:")
+            for name, part, old, new in regressions:
+                print(f"  {name} {part}: {old:.3f}ms -> {new:.3f}ms ({new / old - 1:+.0%})")
+            return 1
+        print(f"\n기준값 대비 {args.metric} 회귀 없음 (허용 {args.threshold:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
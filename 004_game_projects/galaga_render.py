@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+갤러그 리플레이 오프라인 프레임 렌더러
+
+galaga.py --record로 저장한 리플레이(seed + 입력)를 화면 없이(SDL dummy
+드라이버) 다시 실행하면서 틱마다 한 장씩 PNG로 저장합니다.
+- 먼저 전체 리플레이를 한 번 시뮬레이션해 구간(chunk) 시작마다 상태 해시를 기록
+- 연속한 구간들을 작업자 수만큼 묶어(span) 나눠 주고, 작업자는 묶음의 첫 구간
+  시작까지 한 번만 그리기 없이 빠르게 진행한 뒤 구간마다 기록한 해시와 같은지
+  확인하면서 화면 밖 Surface에 그려 PNG로 저장
+- 구간별 프레임 범위/해시/파일명을 manifest.json에 기록해 나중에 이어 붙일 수 있음
+
+화면 녹화 프로그램과 달리 부하가 걸려도 프레임이 빠지지 않고, 코어 수만큼 빨라집니다.
+
+사용 예:
+    python galaga_render.py session.json --out frames --workers 8
+    ffmpeg -framerate 60 -i frames/frame_%06d.png -pix_fmt yuv420p session.mp4
+"""
+
+import os
+
+# pygame import 전에 화면/오디오 없는 드라이버 지정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+# SDL이 SIGTERM을 가로채면 프로세스 풀이 작업자를 종료하지 못하므로 끔
+os.environ.setdefault('SDL_NO_SIGNAL_HANDLERS', '1')
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+
+import pygame
+
+import galaga
+
+FRAME_PATTERN = 'frame_{:06d}.png'
+MANIFEST_VERSION = 1
+
+# 작업자 프로세스마다 한 번만 읽는 리플레이
+worker_recording = None
+
+def init_worker(recording_path):
+    """작업자 프로세스 초기화: 리플레이 읽기, 그리기용 pygame 준비"""
+    global worker_recording
+    worker_recording = galaga.load_recording(recording_path)
+    pygame.init()
+    # Surface.convert()에 필요한 최소 크기 화면 (dummy 드라이버라 실제로 뜨지 않음)
+    pygame.display.set_mode((1, 1))
+
+def build_checkpoints(recording, chunk_size):
+    """리플레이를 한 번 실행해 구간 시작마다 상태 해시 기록
+
+    게임 상태에는 pickle할 수 없는 pygame Surface가 들어 있으므로 상태 자체
+    대신 해시를 스냅샷으로 남긴다. 작업자는 결정적 시뮬레이션으로 같은
+    지점까지 진행한 뒤 해시가 같은지 확인한다.
+    """
+    game = galaga.game_from_recording(recording)
+    total = recording['frames']
+    chunks = []
+    tick = 0
+    start_hash = game.state_hash()
+    for bits in galaga.iter_recorded_inputs(recording):
+        game.step(bits)
+        tick += 1
+        if tick % chunk_size == 0 or tick == total:
+            start = (len(chunks)) * chunk_size
+            end_hash = game.state_hash()
+            chunks.append({'index': len(chunks), 'start': start, 'end': tick,
+                           'start_hash': start_hash, 'end_hash': end_hash})
+            start_hash = end_hash
+    return chunks, game.state_hash()
+
+def split_spans(chunks, workers):
+    """구간 목록을 작업자 수 이하의 연속한 묶음으로 나눔 (앞쪽 묶음이 하나씩 더 많음)"""
+    count = min(workers, len(chunks))
+    size, extra = divmod(len(chunks), count)
+    spans = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        spans.append(chunks[start:end])
+        start = end
+    return spans
+
+def check_hash(game, chunk, key, tick):
+    if game.state_hash() != chunk[key + '_hash']:
+        label = '시작' if key == 'start' else '끝'
+        raise RuntimeError(f"구간 {chunk['index']}: {label} 상태가 기록과 다릅니다 (틱 {tick})")
+
+def render_span(task):
+    """연속한 구간 묶음을 렌더링해 PNG로 저장하고 구간 정보(dict) 목록 반환
+
+    묶음의 첫 구간 시작까지만 그리기 없이 진행하고, 이후 구간은 같은 게임을
+    이어서 사용하므로 작업자마다 빨리 감기는 한 번뿐이다.
+    """
+    span, out_dir = task
+    recording = worker_recording
+    game = galaga.game_from_recording(recording)
+    inputs = galaga.iter_recorded_inputs(recording)
+    screen = pygame.Surface((galaga.SCREEN_WIDTH, galaga.SCREEN_HEIGHT))
+    renderer = galaga.GalagaRenderer(screen, galaga.get_korean_font(24))
+    results = []
+    tick = 0
+    for chunk in span:
+        started = time.perf_counter()
+        # 구간 시작까지 그리기 없이 진행 후 스냅샷 해시 확인 (첫 구간에서만 실제로 진행)
+        while tick < chunk['start']:
+            game.step(next(inputs))
+            tick += 1
+        check_hash(game, chunk, 'start', tick)
+        fast_forward = time.perf_counter() - started
+
+        for frame in range(chunk['start'], chunk['end']):
+            game.step(next(inputs))
+            renderer.draw(game)
+            pygame.image.save(screen, os.path.join(out_dir, FRAME_PATTERN.format(frame)))
+        tick = chunk['end']
+        check_hash(game, chunk, 'end', tick)
+        results.append(dict(chunk, fast_forward=round(fast_forward, 3),
+                            elapsed=round(time.perf_counter() - started, 3)))
+    return results
+
+def write_manifest(path, recording_path, recording, chunks, final_hash):
+    """프레임을 이어 붙일 때 쓰는 manifest.json 저장"""
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'recording': os.path.abspath(recording_path),
+        'replay_version': recording['version'],
+        'seed': recording['seed'],
+        'fps': recording['tick_rate'],
+        'size': [galaga.SCREEN_WIDTH, galaga.SCREEN_HEIGHT],
+        'frames': recording['frames'],
+        'frame_pattern': FRAME_PATTERN,
+        'final_hash': final_hash,
+        'chunks': sorted(chunks, key=lambda c: c['index']),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러그 리플레이를 PNG 프레임으로 병렬 렌더링 (헤드리스)")
+    parser.add_argument('recording', help="galaga.py --record로 저장한 리플레이 파일")
+    parser.add_argument('--out', default='frames', help="PNG와 manifest.json을 저장할 폴더")
+    parser.add_argument('--chunk-size', type=int, default=600, help="구간당 프레임 수")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0:
+        parser.error("--chunk-size는 1 이상이어야 합니다.")
+    if args.workers <= 0:
+        parser.error("--workers는 1 이상이어야 합니다.")
+
+    try:
+        recording = galaga.load_recording(args.recording)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}")
+        return 2
+    os.makedirs(args.out, exist_ok=True)
+
+    # 부모 프로세스는 pygame을 초기화하지 않음 (SDL 초기화 후 fork하면 작업자가 멈출 수 있음)
+    start = time.perf_counter()
+    chunks, final_hash = build_checkpoints(recording, args.chunk_size)
+    if final_hash != recording['final_hash']:
+        print("오류: 리플레이를 다시 실행한 결과가 기록과 다릅니다.")
+        return 1
+    spans = split_spans(chunks, args.workers)
+    print(f"프레임 {recording['frames']}개, 구간 {len(chunks)}개, 프로세스 {len(spans)}개 "
+          f"(스냅샷 {time.perf_counter() - start:.2f}초)")
+
+    done = []
+    tasks = [(span, args.out) for span in spans]
+    with multiprocessing.Pool(len(tasks), initializer=init_worker, initargs=(args.recording,)) as pool:
+        for results in pool.imap_unordered(render_span, tasks):
+            for chunk in results:
+                done.append(chunk)
+                print(f"  구간 {chunk['index']} 완료: 프레임 {chunk['start']}-{chunk['end'] - 1} "
+                      f"({chunk['elapsed']:.1f}초) [{len(done)}/{len(chunks)}]", flush=True)
+        pool.close()
+        pool.join()
+
+    write_manifest(os.path.join(args.out, 'manifest.json'), args.recording, recording, done, final_hash)
+    elapsed = time.perf_counter() - start
+    print(f"총 {recording['frames']}프레임, {elapsed:.1f}초 "
+          f"({recording['frames'] / max(elapsed, 1e-9):.1f}프레임/초), 결과: {args.out}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+갤러그 장시간 내구(soak) 테스트
+
+화면 없이(SDL dummy 드라이버) 자동 플레이어로 프레임 제한 없이 몇 시간 분량의
+게임을 돌리면서, 메모리 누수와 점점 심해지는 끊김을 찾습니다.
+- 스테이지를 깨면 N키(다음 스테이지), 게임 오버나 --restart-waves 웨이브마다
+  R키(재시작) 경로로 넘어가 스프라이트를 계속 없애고 다시 만듦
+- 시뮬레이션 시간 --sample-seconds마다 RSS, 클래스별 살아 있는 객체 수,
+  스프라이트 그룹 크기, 구간 프레임 시간(로직 + 그리기) p50/p99/최대를 기록
+- 끝나면 추세 표를 출력하고, 앞 1/4 구간보다 뒤 1/4 구간의 메모리나 p99가
+  허용치 넘게 늘었으면 종료 코드 1로 실패
+
+사용 예:
+    python galaga_soak.py --hours 2 --out soak.jsonl
+    python galaga_soak.py --hours 0.5 --bullet-hell --max-rss-growth 10 --max-p99-drift 0.3
+"""
+
+import os
+
+# pygame import 전에 화면/오디오 없는 드라이버 지정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import collections
+import gc
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+import pygame
+
+import galaga
+
+GROUPS = galaga.PROFILE_GROUPS + ('enemy_bullets',)
+TOP_CLASSES = 8  # 추세 보고에 표시할 증가 객체 클래스 수
+MIN_OBJECT_GROWTH = 200  # 이보다 적게 늘어난 클래스는 잡음으로 보고 누수로 치지 않음
+MIN_P99_DRIFT_MS = 0.5  # 이보다 작은 p99 증가는 측정 잡음으로 보고 실패로 치지 않음
+
+def current_rss_mb():
+    """현재 프로세스의 상주 메모리(RSS, MB)
+
+    Linux는 /proc에서 현재 값을 읽고, 그 외 환경은 resource 모듈의 최대값으로 대신한다.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def count_objects():
+    """GC가 추적하는 살아 있는 객체 수를 클래스 이름별로 집계
+
+    pygame Surface/Rect는 GC 추적 대상이 아니므로 RSS로만 드러난다.
+    """
+    counts = collections.Counter(type(obj).__name__ for obj in gc.get_objects())
+    return dict(counts)
+
+class SoakRunner:
+    """자동 플레이어로 게임을 진행하며 스테이지 전환/재시작을 반복"""
+    def __init__(self, seed, renderer, restart_waves, stage_seconds, bullet_hell=False):
+        self.game = galaga.GalagaGame(seed=seed, persist_highscore=False, bullet_hell=bullet_hell)
+        self.renderer = renderer
+        self.restart_waves = restart_waves
+        self.stage_frames_limit = int(stage_seconds * galaga.TICK_RATE)
+        self.frames = 0
+        self.stage_frames = 0
+        self.waves_since_restart = 0
+        self.events = collections.Counter()
+        self.game.step(galaga.INPUT_SPACE)
+
+    def next_input(self):
+        """이번 프레임 입력 비트 (스테이지 클리어/게임 오버면 N키 또는 R키)"""
+        game = self.game
+        if game.game_over:
+            self.events['restart'] += 1
+            self.waves_since_restart = 0
+            return galaga.INPUT_RESTART
+        if game.stage_clear:
+            self.waves_since_restart += 1
+            if self.waves_since_restart >= self.restart_waves:
+                self.events['restart'] += 1
+                self.waves_since_restart = 0
+                return galaga.INPUT_RESTART
+            self.events['next'] += 1
+            return galaga.INPUT_NEXT
+        return galaga.bot_input(game)
+
+    def run_frame(self):
+        """한 프레임(로직 + 그리기)을 실행하고 걸린 시간(ms) 반환"""
+        game = self.game
+        bits = self.next_input()
+        if bits & (galaga.INPUT_RESTART | galaga.INPUT_NEXT):
+            self.stage_frames = 0
+        elif self.stage_frames >= self.stage_frames_limit:
+            # 자동 플레이어가 끝내지 못하는 스테이지는 다음 스테이지로 넘김
+            self.events['skip'] += 1
+            self.stage_frames = 0
+            game.load_stage(game.wave + 1)
+        start = time.perf_counter()
+        game.step(bits)
+        if self.renderer:
+            self.renderer.draw(game)
+        elapsed = time.perf_counter() - start
+        self.frames += 1
+        self.stage_frames += 1
+        return elapsed * 1000
+
+def take_sample(runner, frame_ms, started):
+    """현재 메모리/객체/그룹 크기와 구간 프레임 시간 통계 한 줄(dict)"""
+    game = runner.game
+    p50, p99 = np.percentile(frame_ms, [50, 99])
+    gc.collect()
+    return {
+        'frame': runner.frames,
+        'sim_seconds': round(runner.frames / galaga.TICK_RATE, 1),
+        'real_seconds': round(time.perf_counter() - started, 1),
+        'wave': game.wave,
+        'events': dict(runner.events),
+        'rss_mb': round(current_rss_mb(), 2),
+        'groups': {name: len(getattr(game, name)) for name in GROUPS},
+        'p50_ms': round(float(p50), 3),
+        'p99_ms': round(float(p99), 3),
+        'max_ms': round(float(frame_ms.max()), 3),
+        'objects': count_objects(),
+    }
+
+def slope_per_hour(samples, key):
+    """시뮬레이션 시간 1시간당 증가량 (최소제곱 직선 기울기)"""
+    if len(samples) < 2:
+        return 0.0
+    x = np.array([s['sim_seconds'] for s in samples]) / 3600
+    y = np.array([s[key] for s in samples])
+    return float(np.polyfit(x, y, 1)[0])
+
+def quarters(samples):
+    """예열 구간을 뺀 표본의 앞 1/4과 뒤 1/4"""
+    size = max(1, len(samples) // 4)
+    return samples[:size], samples[-size:]
+
+def analyze(samples, max_rss_growth, max_p99_drift):
+    """추세를 계산하고 (요약 dict, 실패 사유 목록) 반환
+
+    웨이브마다 적 수가 달라 순간값은 출렁이므로 앞/뒤 1/4 구간의 중앙값끼리 비교한다.
+    """
+    first, last = quarters(samples)
+    rss_growth = statistics.median(s['rss_mb'] for s in last) - statistics.median(s['rss_mb'] for s in first)
+    p99_first = statistics.median(s['p99_ms'] for s in first)
+    p99_last = statistics.median(s['p99_ms'] for s in last)
+    growing = []
+    for name in last[-1]['objects']:
+        before = statistics.median(s['objects'].get(name, 0) for s in first)
+        after = statistics.median(s['objects'].get(name, 0) for s in last)
+        if after - before >= MIN_OBJECT_GROWTH:
+            growing.append((name, int(before), int(after)))
+    growing.sort(key=lambda item: item[2] - item[1], reverse=True)
+    summary = {
+        'samples': len(samples),
+        'rss_growth_mb': round(rss_growth, 2),
+        'rss_slope_mb_per_hour': round(slope_per_hour(samples, 'rss_mb'), 2),
+        'p99_first_ms': round(p99_first, 3),
+        'p99_last_ms': round(p99_last, 3),
+        'p99_slope_ms_per_hour': round(slope_per_hour(samples, 'p99_ms'), 3),
+        'growing_objects': growing[:TOP_CLASSES],
+    }
+    failures = []
+    if rss_growth > max_rss_growth:
+        failures.append(f"RSS가 {rss_growth:.1f}MB 증가 (허용 {max_rss_growth:.1f}MB)")
+    if p99_last > p99_first * (1 + max_p99_drift) and p99_last - p99_first > MIN_P99_DRIFT_MS:
+        failures.append(f"p99 프레임 시간이 {p99_first:.2f}ms -> {p99_last:.2f}ms로 증가 "
+                        f"(허용 {max_p99_drift:.0%})")
+    if growing:
+        names = ', '.join(f"{name} {before}->{after}" for name, before, after in growing[:TOP_CLASSES])
+        failures.append(f"계속 늘어나는 객체: {names}")
+    return summary, failures
+
+def print_sample(sample):
+    """표본 한 줄 출력"""
+    groups = sample['groups']
+    print(f"{sample['sim_seconds'] / 60:>8.1f} {sample['real_seconds']:>8.1f} {sample['wave']:>6} "
+          f"{sample['rss_mb']:>8.1f} {sum(sample['objects'].values()):>9} "
+          f"{groups['all_sprites']:>6} {groups['enemy_bullets']:>6} "
+          f"{sample['p50_ms']:>7.2f} {sample['p99_ms']:>7.2f} {sample['max_ms']:>7.2f}", flush=True)
+
+def print_summary(summary, events):
+    """추세 요약 출력"""
+    print(f"\n표본 {summary['samples']}개, 스테이지 전환 {events.get('next', 0)}회, "
+          f"재시작 {events.get('restart', 0)}회, 건너뜀 {events.get('skip', 0)}회")
+    print(f"RSS: 앞/뒤 1/4 중앙값 차이 {summary['rss_growth_mb']:+.2f}MB, "
+          f"기울기 {summary['rss_slope_mb_per_hour']:+.2f}MB/시간")
+    print(f"p99: {summary['p99_first_ms']:.2f}ms -> {summary['p99_last_ms']:.2f}ms, "
+          f"기울기 {summary['p99_slope_ms_per_hour']:+.3f}ms/시간")
+    for name, before, after in summary['growing_objects']:
+        print(f"  증가 객체 {name}: {before} -> {after}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러그 장시간 누수/끊김 내구 테스트 (헤드리스)")
+    parser.add_argument('--hours', type=float, default=1.0, help="실행할 시뮬레이션 시간(시간)")
+    parser.add_argument('--sample-seconds', type=float, default=60, help="표본을 기록할 시뮬레이션 시간 간격(초)")
+    parser.add_argument('--warmup-samples', type=int, default=2,
+                        help="캐시가 채워지는 동안이라 추세 판정에서 뺄 처음 표본 수")
+    parser.add_argument('--restart-waves', type=int, default=5, help="이 웨이브 수를 깰 때마다 R키로 재시작")
+    parser.add_argument('--stage-seconds', type=float, default=180,
+                        help="자동 플레이어가 이 시간 안에 못 깨는 스테이지는 건너뜀")
+    parser.add_argument('--seed', type=int, default=1, help="게임 seed")
+    parser.add_argument('--bullet-hell', action='store_true', help="탄막 모드로 실행")
+    parser.add_argument('--no-render', action='store_true', help="그리기 없이 로직만 실행")
+    parser.add_argument('--max-rss-growth', type=float, default=20.0, help="허용할 RSS 증가량(MB)")
+    parser.add_argument('--max-p99-drift', type=float, default=0.5,
+                        help="허용할 p99 프레임 시간 증가 비율 (0.5 = 50%%)")
+    parser.add_argument('--out', metavar='PATH', help="표본을 JSON Lines로 저장할 경로")
+    args = parser.parse_args(argv)
+    sample_frames = int(args.sample_seconds * galaga.TICK_RATE)
+    total_frames = int(args.hours * 3600 * galaga.TICK_RATE)
+    if sample_frames <= 0 or total_frames < sample_frames:
+        parser.error("--hours는 --sample-seconds보다 길어야 합니다.")
+    if total_frames // sample_frames - args.warmup_samples < 4:
+        parser.error("추세 판정에는 예열 후 표본이 4개 이상 필요합니다 (--hours를 늘리거나 --sample-seconds를 줄이세요).")
+
+    pygame.init()
+    renderer = None
+    if not args.no_render:
+        screen = pygame.display.set_mode((galaga.SCREEN_WIDTH, galaga.SCREEN_HEIGHT))
+        renderer = galaga.GalagaRenderer(screen, galaga.get_korean_font(24))
+    # 자동 품질 조절이 없으므로 최고 품질로 고정
+    galaga.QualityGovernor(pinned=0)
+    runner = SoakRunner(args.seed, renderer, max(1, args.restart_waves), args.stage_seconds, args.bullet_hell)
+
+    out = open(args.out, 'w', encoding='utf-8') if args.out else None
+    samples = []
+    frame_ms = np.zeros(sample_frames)
+    started = time.perf_counter()
+    print(f"{'분(sim)':>8} {'초(실제)':>8} {'웨이브':>6} {'RSS(MB)':>8} {'객체':>9} "
+          f"{'스프라이트':>6} {'적총알':>6} {'p50':>7} {'p99':>7} {'최대':>7}")
+    try:
+        while runner.frames < total_frames:
+            for i in range(sample_frames):
+                frame_ms[i] = runner.run_frame()
+            sample = take_sample(runner, frame_ms, started)
+            print_sample(sample)
+            if out:
+                out.write(json.dumps(sample, ensure_ascii=False) + '\n')
+                out.flush()
+            samples.append(sample)
+    except KeyboardInterrupt:
+        print("중단됨: 지금까지의 표본으로 판정합니다.")
+    finally:
+        if out:
+            out.close()
+        pygame.quit()
+
+    measured = samples[args.warmup_samples:]
+    if len(measured) < 4:
+        print("표본이 부족해 추세를 판정할 수 없습니다.")
+        return 2
+    summary, failures = analyze(measured, args.max_rss_growth, args.max_p99_drift)
+    print_summary(summary, runner.events)
+    if failures:
+        print("\n실패:")
+        for reason in failures:
+            print(f"  {reason}")
+        return 1
+    print("\n누수/끊김 증가 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
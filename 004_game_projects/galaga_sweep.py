@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+갤러그 난이도 스윕 도구
+
+galaga.json의 난이도 값을 격자로 조합해 화면 없이(SDL dummy 드라이버)
+자동 플레이어로 웨이브를 반복 실행하고, 결과를 비교합니다.
+- 조합 x 웨이브 x 반복(seed)마다 한 판씩 프로세스 풀에서 병렬 실행
+- 끝난 결과는 즉시 CSV 또는 JSON Lines 파일에 한 줄씩 기록
+- 마지막에 조합/웨이브별 생존율, 클리어 시간, 화면 내 총알 수, 점수 요약 출력
+
+사용 예:
+    python galaga_sweep.py --param difficulty.max_missiles=6,8,10 \\
+        --param item.drop_rate=0.1,0.2 --waves 1-5 --repeats 20 --out sweep.csv
+"""
+
+import os
+
+# pygame import 전에 화면/오디오 없는 드라이버 지정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import statistics
+import sys
+import time
+
+import galaga
+
+RESULT_FIELDS = [
+    'combo', 'params', 'wave', 'seed', 'survived', 'cleared', 'frames',
+    'time_to_clear', 'score', 'lives_lost', 'enemies_left',
+    'bullets_mean', 'bullets_max',
+]
+
+def parse_param(text):
+    """'section.key=v1,v2,...' 형식을 (키, 값 목록)으로 변환"""
+    key, sep, values = text.partition('=')
+    if not sep or '.' not in key:
+        raise argparse.ArgumentTypeError(f"잘못된 파라미터 형식: {text} (예: difficulty.max_missiles=6,8)")
+    try:
+        parsed = [json.loads(v) for v in values.split(',') if v.strip()]
+    except json.JSONDecodeError:
+        raise argparse.ArgumentTypeError(f"숫자 값만 사용할 수 있습니다: {text}")
+    if not parsed:
+        raise argparse.ArgumentTypeError(f"값이 없습니다: {text}")
+    return key.strip(), parsed
+
+def parse_waves(text):
+    """'1-5' 또는 '1,3,7' 형식을 웨이브 번호 목록으로 변환"""
+    waves = []
+    for part in text.split(','):
+        start, sep, end = part.partition('-')
+        if sep:
+            waves.extend(range(int(start), int(end) + 1))
+        else:
+            waves.append(int(part))
+    return waves
+
+def apply_overrides(base_config, overrides):
+    """기본 설정을 복사해 'section.key' 값들을 덮어쓴 설정 반환"""
+    config = copy.deepcopy(base_config)
+    for key, value in overrides.items():
+        section, name = key.split('.', 1)
+        if name not in config.get(section, {}):
+            raise KeyError(f"galaga.json에 없는 설정: {key}")
+        config[section][name] = value
+    return config
+
+def build_tasks(params, waves, repeats, base_seed, max_frames):
+    """파라미터 격자 x 웨이브 x 반복 조합으로 작업 목록 생성"""
+    keys = [key for key, _ in params]
+    combos = list(itertools.product(*(values for _, values in params))) or [()]
+    tasks = []
+    for combo_index, values in enumerate(combos):
+        overrides = dict(zip(keys, values))
+        apply_overrides(galaga.CONFIG, overrides)  # 잘못된 설정 키는 작업 시작 전에 확인
+        for wave in waves:
+            for repeat in range(repeats):
+                seed = base_seed + combo_index * 1_000_003 + wave * 10_007 + repeat
+                tasks.append((combo_index, overrides, wave, seed, max_frames))
+    return tasks, len(combos)
+
+def run_wave_trial(task):
+    """자동 플레이어로 한 웨이브를 실행하고 결과 한 줄(dict) 반환"""
+    combo_index, overrides, wave, seed, max_frames = task
+    config = apply_overrides(galaga.CONFIG, overrides)
+    game = galaga.GalagaGame(seed=seed, config=config, persist_highscore=False)
+    # 시작 화면 통과 후 원하는 웨이브 배치
+    game.step(galaga.INPUT_SPACE)
+    if wave != game.wave:
+        game.load_stage(wave)
+    start_score = game.score
+    start_lives = game.player.lives
+    bullet_total = 0
+    bullet_max = 0
+    frames = 0
+    while frames < max_frames and not game.stage_clear and not game.game_over:
+        game.step(galaga.bot_input(game))
+        frames += 1
+        on_screen = len(game.enemy_bullets)
+        bullet_total += on_screen
+        if on_screen > bullet_max:
+            bullet_max = on_screen
+    cleared = game.stage_clear
+    return {
+        'combo': combo_index,
+        'params': ';'.join(f"{k}={v}" for k, v in overrides.items()),
+        'wave': wave,
+        'seed': seed,
+        'survived': int(not game.game_over),
+        'cleared': int(cleared),
+        'frames': frames,
+        'time_to_clear': round(frames / galaga.TICK_RATE, 3) if cleared else '',
+        'score': game.score - start_score,
+        'lives_lost': start_lives - max(game.player.lives, 0),
+        'enemies_left': len(game.enemies_group),
+        'bullets_mean': round(bullet_total / max(frames, 1), 3),
+        'bullets_max': bullet_max,
+    }
+
+class ResultWriter:
+    """결과를 끝나는 즉시 한 줄씩 기록 (.csv이면 CSV, 그 외는 JSON Lines)"""
+    def __init__(self, path):
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.csv = None
+        if path.lower().endswith('.csv'):
+            self.csv = csv.DictWriter(self.file, fieldnames=RESULT_FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(row, ensure_ascii=False) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+def summarize(rows):
+    """조합/웨이브별 생존율, 클리어율, 평균 클리어 시간, 총알 수, 점수 집계"""
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['combo'], row['params'], row['wave']), []).append(row)
+    summary = []
+    for (combo, params, wave), items in sorted(groups.items()):
+        clear_times = [r['time_to_clear'] for r in items if r['cleared']]
+        summary.append({
+            'combo': combo,
+            'params': params,
+            'wave': wave,
+            'runs': len(items),
+            'survival_rate': round(sum(r['survived'] for r in items) / len(items), 3),
+            'clear_rate': round(sum(r['cleared'] for r in items) / len(items), 3),
+            'time_to_clear_mean': round(statistics.mean(clear_times), 2) if clear_times else None,
+            'bullets_mean': round(statistics.mean(r['bullets_mean'] for r in items), 2),
+            'bullets_max': max(r['bullets_max'] for r in items),
+            'score_mean': round(statistics.mean(r['score'] for r in items), 1),
+        })
+    return summary
+
+def print_summary(summary):
+    print(f"{'조합':>4} {'웨이브':>6} {'판수':>5} {'생존율':>7} {'클리어율':>8} "
+          f"{'클리어(초)':>10} {'총알평균':>8} {'총알최대':>8} {'점수평균':>9}  파라미터")
+    for s in summary:
+        clear_time = f"{s['time_to_clear_mean']:.2f}" if s['time_to_clear_mean'] is not None else '-'
+        print(f"{s['combo']:>4} {s['wave']:>6} {s['runs']:>5} {s['survival_rate']:>7.3f} "
+              f"{s['clear_rate']:>8.3f} {clear_time:>10} {s['bullets_mean']:>8.2f} "
+              f"{s['bullets_max']:>8} {s['score_mean']:>9.1f}  {s['params'] or '(기본값)'}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러그 난이도 설정 병렬 스윕 (헤드리스)")
+    parser.add_argument('--param', action='append', type=parse_param, default=[],
+                        metavar='SECTION.KEY=V1,V2', help="스윕할 설정 값 (여러 번 지정 가능)")
+    parser.add_argument('--waves', type=parse_waves, default=[1, 2, 3], help="실행할 웨이브 (예: 1-5, 1,3,7)")
+    parser.add_argument('--repeats', type=int, default=10, help="조합/웨이브당 반복 횟수")
+    parser.add_argument('--seed', type=int, default=0, help="기준 seed")
+    parser.add_argument('--max-seconds', type=float, default=120, help="웨이브당 최대 시뮬레이션 시간(초)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="프로세스 수")
+    parser.add_argument('--out', default='galaga_sweep.csv', help="결과 파일 (.csv 또는 .jsonl)")
+    parser.add_argument('--summary', metavar='PATH', help="요약을 JSON으로 저장할 경로")
+    args = parser.parse_args(argv)
+
+    max_frames = int(args.max_seconds * galaga.TICK_RATE)
+    try:
+        tasks, combo_count = build_tasks(args.param, args.waves, args.repeats, args.seed, max_frames)
+    except KeyError as e:
+        print(f"오류: {e.args[0]}")
+        return 2
+
+    print(f"조합 {combo_count}개 x 웨이브 {len(args.waves)}개 x 반복 {args.repeats}회 = "
+          f"{len(tasks)}판, 프로세스 {args.workers}개")
+    writer = ResultWriter(args.out)
+    rows = []
+    start = time.perf_counter()
+    try:
+        with multiprocessing.Pool(args.workers) as pool:
+            chunksize = max(1, len(tasks) // (args.workers * 8))
+            for row in pool.imap_unordered(run_wave_trial, tasks, chunksize=chunksize):
+                writer.write(row)
+                rows.append(row)
+                if len(rows) % 100 == 0:
+                    print(f"  {len(rows)}/{len(tasks)}판 완료 ({time.perf_counter() - start:.1f}초)")
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    summary = summarize(rows)
+    print_summary(summary)
+    print(f"총 {len(rows)}판, {elapsed:.1f}초 ({len(rows) / max(elapsed, 1e-9):.1f}판/초), 결과: {args.out}")
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,574 @@
+#!/usr/bin/env python3
+"""
+갤러그 배열 기반 다중 게임 환경 (배치 에이전트용)
+
+게임 N판의 상태를 판 x 적/총알 배열로 들고 NumPy 연산 한 번에 N판을 같이
+한 틱씩 진행합니다. 스프라이트/Surface를 쓰지 않으므로 한 프로세스에서
+수백 판을 돌려도 galaga.py 한 판보다 훨씬 많은 프레임을 시뮬레이션합니다.
+- reset(seeds)로 판마다 seed를 주고 시작, step(actions)는 N판의 입력 비트를
+  받아 관측(observation), 보상(점수 증가), 종료 여부를 배열로 반환
+- 웨이브 구성은 galaga.plan_wave, 난이도/점수는 galaga.json 설정을 그대로 사용
+- 판마다 seed와 틱으로 난수를 만들어, 같은 seed면 함께 도는 판 수와 관계없이
+  같은 게임이 나옴
+
+galaga.py와 같은 규칙(진형 이동, 등장/돌진/복귀, 적 총알, 충돌, 목숨/무적,
+점수, 스테이지 전환)을 따르지만 트랙터 빔/포획, 아이템, 탄막 모드는 없고,
+스테이지를 깨면 N키를 기다리지 않고 바로 다음 웨이브로 넘어갑니다.
+
+사용 예:
+    python galaga_vec.py --envs 512 --frames 3600
+    python galaga_vec.py --envs 256 --frames 7200 --policy random --compare
+"""
+
+import os
+
+# pygame import 전에 화면/오디오 없는 드라이버 지정 (galaga import 시 pygame을 불러옴)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+import galaga
+from galaga import (SCREEN_WIDTH, SCREEN_HEIGHT, TICK_RATE, INPUT_LEFT, INPUT_RIGHT, INPUT_SPACE,
+                    FORMATION_LEFT, FORMATION_RIGHT, FORMATION_TOP, FORMATION_START_X,
+                    FORMATION_COL_SPACING, FORMATION_ROW_SPACING, per_tick)
+
+ENEMY_SIZE = 32
+PLAYER_SIZE = 40
+PLAYER_TOP = SCREEN_HEIGHT - 10 - PLAYER_SIZE
+BULLET_W, BULLET_H = 4, 12  # 플레이어 총알과 적 총알 크기가 같음
+PLAYER_BULLETS = 8  # 판마다 화면에 있을 수 있는 플레이어 총알 수 (발사 간격상 5발을 넘지 않음)
+ENEMY_BULLETS = 32  # 판마다 화면에 있을 수 있는 적 총알 수
+STARTUP_MS = 3000  # 스테이지 시작 후 발사/돌진 금지 기간
+SHOOT_DELAY_MS = 250
+START_INVINCIBLE_MS = 5000
+HIT_INVINCIBLE_MS = 3000
+NO_TIMER = np.iinfo(np.int64).max
+
+KIND_IDS = {'boss': 0, 'mid': 1, 'basic': 2}
+PATTERN_IDS = {'curve': 0, 'zigzag': 1, 'spiral': 2}
+
+# 난수 스트림 번호 (같은 틱의 서로 다른 용도가 같은 난수를 쓰지 않도록 구분)
+STREAM_FIRE_RANDOM = 1
+STREAM_FIRE_DIVE = 2
+STREAM_DIVE_DELAY = 3
+STREAM_DIVE_PATTERN = 4
+STREAM_RETURN_COOLDOWN = 5
+
+U64 = np.uint64
+
+def to_pixel(v):
+    """pygame Rect 좌표처럼 실수를 가장 가까운 정수로 반올림 (0.5는 0에서 먼 쪽)"""
+    return np.copysign(np.floor(np.abs(v) + 0.5), v)
+
+def splitmix64(x):
+    """uint64 배열 해시 (splitmix64 마무리 함수, 2^64로 나머지 연산)"""
+    x = x + U64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> U64(30))) * U64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> U64(27))) * U64(0x94D049BB133111EB)
+    return x ^ (x >> U64(31))
+
+class GalagaVecEnv:
+    """갤러그 N판을 배열로 함께 진행하는 환경
+
+    배열 이름의 첫 축은 판, 적/총알 배열의 둘째 축은 판 안의 칸이다.
+    좌표는 galaga.py의 rect와 같이 왼쪽 위 모서리 기준 픽셀이다.
+    """
+    def __init__(self, num_envs, config=None):
+        self.num_envs = n = num_envs
+        self.config = config or galaga.CONFIG
+        enemy_config = self.config['enemy']
+        self.max_enemies = e = enemy_config['max_cols'] * enemy_config['max_rows']
+        self.rows = np.arange(n)
+        self.seeds = np.zeros(n, dtype=np.int64)
+        self.seed_keys = np.zeros(n, dtype=U64)
+        # 판 상태
+        self.tick = np.zeros(n, dtype=np.int64)
+        self.sched = np.zeros(n, dtype=np.int64)  # 돌진 타이머 시계 (금지 기간에는 멈춤)
+        self.stage_start = np.zeros(n, dtype=np.int64)
+        self.wave = np.ones(n, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.zeros(n, dtype=np.int64)
+        self.done = np.ones(n, dtype=bool)
+        self.player_x = np.zeros(n)
+        self.last_shot = np.zeros(n, dtype=np.int64)
+        self.invincible_end = np.zeros(n, dtype=np.int64)
+        self.origin_x = np.zeros(n)
+        self.formation_dir = np.ones(n)
+        # 적 (판 x 칸)
+        self.alive = np.zeros((n, e), dtype=bool)
+        self.kind = np.zeros((n, e), dtype=np.int8)
+        self.hp = np.zeros((n, e), dtype=np.int64)
+        self.points = np.zeros((n, e), dtype=np.int64)
+        self.col = np.zeros((n, e), dtype=np.int64)
+        self.slot_x = np.zeros((n, e))
+        self.slot_y = np.zeros((n, e))
+        self.x = np.zeros((n, e))
+        self.y = np.zeros((n, e))
+        self.entrance = np.zeros((n, e), dtype=bool)
+        self.in_formation = np.zeros((n, e), dtype=bool)
+        self.returning = np.zeros((n, e), dtype=bool)
+        self.pattern = np.zeros((n, e), dtype=np.int8)
+        self.dive_speed = np.zeros((n, e))
+        self.dive_time = np.zeros((n, e))
+        self.dive_cx = np.zeros((n, e))
+        self.dive_cy = np.zeros((n, e))
+        self.dive_cooldown = np.zeros((n, e), dtype=np.int64)
+        self.dive_due = np.full((n, e), NO_TIMER, dtype=np.int64)  # 돌진 타이머 만료 시각 (sched 기준)
+        self.fire_random_due = np.full((n, e), NO_TIMER, dtype=np.int64)  # 다음 발사 시각 (tick 기준)
+        self.fire_dive_due = np.full((n, e), NO_TIMER, dtype=np.int64)
+        # 총알 (판 x 칸)
+        self.pb_alive = np.zeros((n, PLAYER_BULLETS), dtype=bool)
+        self.pb_x = np.zeros((n, PLAYER_BULLETS))
+        self.pb_y = np.zeros((n, PLAYER_BULLETS))
+        self.eb_alive = np.zeros((n, ENEMY_BULLETS), dtype=bool)
+        self.eb_x = np.zeros((n, ENEMY_BULLETS))
+        self.eb_y = np.zeros((n, ENEMY_BULLETS))
+        self.eb_vy = np.zeros((n, ENEMY_BULLETS))
+        self.obs = np.zeros((n, 3 + 3 * e + 3 * ENEMY_BULLETS), dtype=np.float32)
+
+    # 난수
+    def uniform(self, stream, rows, cols):
+        """(판, 칸) 목록마다 [0, 1) 난수 (seed, 틱, 스트림, 칸으로 정해지므로 판끼리 독립)"""
+        base = splitmix64(self.seed_keys[rows] ^ splitmix64(self.tick[rows].astype(U64) * U64(16) + U64(stream)))
+        keys = splitmix64(base + cols.astype(U64))
+        return (keys >> U64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+    def schedule(self, due, rows, cols, clock, chance, stream):
+        """(판, 칸)마다 매 틱 확률 chance로 성공하는 시행의 다음 성공 시각을 due에 기록
+
+        galaga.sample_ticks_until과 같은 기하분포이며, chance가 0 이하면 예약하지 않는다.
+        """
+        chance = np.broadcast_to(chance, rows.shape)
+        u = self.uniform(stream, rows, cols)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            wait = 1 + np.floor(np.log1p(-u) / np.log1p(-np.clip(chance, 1e-12, 1 - 1e-12)))
+        wait = np.where(chance >= 1, 1, wait)
+        due[rows, cols] = np.where(chance > 0, clock[rows] + wait.astype(np.int64), NO_TIMER)
+
+    def now(self):
+        """판별 시뮬레이션 시각(ms)"""
+        return self.tick * 1000 // TICK_RATE
+
+    # 판 시작/웨이브 배치
+    def reset(self, seeds, indices=None):
+        """지정한 판(기본: 전체)을 seed로 새 게임 시작하고 관측 반환"""
+        indices = self.rows if indices is None else np.asarray(indices)
+        seeds = np.broadcast_to(np.asarray(seeds, dtype=np.int64), indices.shape)
+        for i, seed in zip(indices, seeds):
+            self.seeds[i] = seed
+            self.seed_keys[i] = splitmix64(np.array([int(seed) & 0xFFFFFFFFFFFFFFFF], dtype=U64))[0]
+            self.tick[i] = 0
+            self.sched[i] = 0
+            self.score[i] = 0
+            self.last_shot[i] = 0
+            self.done[i] = False
+            self.load_wave(i, 1)
+        return self.observe()
+
+    def load_wave(self, i, wave):
+        """판 i에 웨이브 배치 (galaga.py load_stage와 같이 목숨/무적/플레이어 위치도 초기화)"""
+        rng = random.Random(int(self.seeds[i]) * 1_000_003 + wave)
+        _, slots = galaga.plan_wave(wave, self.config, rng)
+        self.wave[i] = wave
+        self.origin_x[i] = FORMATION_START_X
+        self.formation_dir[i] = 1
+        for arr in (self.alive, self.entrance, self.in_formation, self.returning, self.pb_alive, self.eb_alive):
+            arr[i] = False
+        for arr in (self.dive_due, self.fire_random_due, self.fire_dive_due):
+            arr[i] = NO_TIMER
+        for k, slot in enumerate(slots):
+            self.alive[i, k] = True
+            self.entrance[i, k] = True
+            self.kind[i, k] = KIND_IDS[slot.enemy_type['name']]
+            self.hp[i, k] = slot.enemy_type['hp']
+            self.points[i, k] = slot.enemy_type['score']
+            self.col[i, k] = slot.col
+            self.slot_x[i, k] = slot.col * FORMATION_COL_SPACING
+            self.slot_y[i, k] = slot.row * FORMATION_ROW_SPACING
+            self.x[i, k] = FORMATION_START_X + self.slot_x[i, k]
+            self.y[i, k] = -40
+            self.pattern[i, k] = PATTERN_IDS[slot.dive_pattern]
+            self.dive_speed[i, k] = slot.dive_speed
+            self.dive_cooldown[i, k] = slot.dive_cooldown
+        # 첫 발사 시각 예약 (FireScheduler.add와 같음: 랜덤 발사는 모두, 돌진 발사는 보스/중간 적만)
+        difficulty = self.config['difficulty']
+        cols = np.arange(len(slots))
+        self.schedule(self.fire_random_due, np.full(len(cols), i), cols, self.tick,
+                      difficulty['missile_base_chance'], STREAM_FIRE_RANDOM)
+        cols = cols[self.kind[i, cols] < KIND_IDS['basic']]
+        self.schedule(self.fire_dive_due, np.full(len(cols), i), cols, self.tick,
+                      difficulty['missile_base_chance'] + difficulty['missile_per_wave'] * wave, STREAM_FIRE_DIVE)
+        # galaga.py는 스테이지를 연 틱에 바로 한 틱을 진행하므로, 시작 시각은 다음 step()의 틱 시각
+        now = (int(self.tick[i]) + 1) * 1000 // TICK_RATE
+        self.stage_start[i] = now
+        self.lives[i] = 3
+        self.invincible_end[i] = now + START_INVINCIBLE_MS
+        self.player_x[i] = SCREEN_WIDTH // 2 - PLAYER_SIZE // 2
+
+    def join_formation(self, mask):
+        """mask의 적을 진형 대기로 바꾸고 돌진 타이머가 없으면 예약 (기하분포 대기)"""
+        self.in_formation |= mask
+        rows, cols = np.nonzero(mask & (self.dive_due == NO_TIMER))
+        if not len(rows):
+            return
+        # 남은 쿨다운 + 기하분포 대기 (Enemy.join_formation과 같음)
+        self.schedule(self.dive_due, rows, cols, self.sched, 0.01 + 0.003 * self.wave[rows], STREAM_DIVE_DELAY)
+        self.dive_due[rows, cols] += np.maximum(self.dive_cooldown[rows, cols], 1) - 1
+
+    # 한 틱 진행
+    def step(self, actions):
+        """N판에 입력 비트를 주고 한 틱 진행 후 (관측, 보상, 종료 여부) 반환
+
+        이미 끝난 판은 reset()할 때까지 멈춰 있고 보상은 0이다.
+        관측 배열은 다음 step()에서 덮어쓰므로 보관하려면 복사해야 한다.
+        """
+        actions = np.asarray(actions)
+        live = ~self.done
+        previous_score = self.score.copy()
+        self.tick += live
+        now = self.now()
+        startup = now - self.stage_start < STARTUP_MS
+        active = live & ~startup
+        alive = self.alive & live[:, None]
+
+        # 입력: 발사 (galaga.py와 같이 금지 기간이 완전히 지난 뒤부터)
+        shoot = (live & (actions & INPUT_SPACE != 0) & (now - self.stage_start > STARTUP_MS) &
+                 (now - self.last_shot > SHOOT_DELAY_MS))
+        free = ~self.pb_alive
+        shoot &= free.any(axis=1)
+        if shoot.any():
+            rows = np.flatnonzero(shoot)
+            slots = free[rows].argmax(axis=1)
+            self.pb_alive[rows, slots] = True
+            self.pb_x[rows, slots] = self.player_x[rows] + PLAYER_SIZE // 2 - BULLET_W // 2
+            self.pb_y[rows, slots] = PLAYER_TOP - BULLET_H
+            self.last_shot[shoot] = now[shoot]
+
+        # 생성: 적 총알, 돌진 타이머
+        self.fire(alive, active)
+        self.sched += active
+        expired = (self.dive_due <= self.sched[:, None]) & active[:, None]
+        start = expired & alive & self.in_formation & ~self.entrance & ~self.returning
+        self.dive_due[expired] = NO_TIMER
+        if start.any():
+            self.start_dive(start)
+        joining = alive & ~self.in_formation & startup[:, None]
+        if joining.any():
+            self.join_formation(joining)
+
+        # 이동: 진형, 플레이어, 적, 총알
+        self.move_formation(alive, live)
+        speed = per_tick(galaga.PLAYER_SPEED)
+        dx = np.where(actions & INPUT_RIGHT != 0, speed, np.where(actions & INPUT_LEFT != 0, -speed, 0.0))
+        self.player_x = np.clip(self.player_x + dx * live, 0, SCREEN_WIDTH - PLAYER_SIZE)
+        self.move_enemies(alive)
+        self.pb_y -= per_tick(galaga.BULLET_SPEED) * self.pb_alive
+        self.pb_alive &= self.pb_y + BULLET_H >= 0
+        self.eb_y += self.eb_vy * self.eb_alive
+        self.eb_alive &= self.eb_y < SCREEN_HEIGHT
+
+        # 충돌
+        self.collide(live, now)
+
+        # 정리: 스테이지 클리어는 바로 다음 웨이브, 게임 오버는 종료
+        for i in np.flatnonzero(live & ~self.alive.any(axis=1) & ~self.done):
+            self.load_wave(i, int(self.wave[i]) + 1)
+        rewards = np.where(live, self.score - previous_score, 0).astype(np.float32)
+        return self.observe(), rewards, self.done.copy()
+
+    def fire(self, alive, active):
+        """예약 시각이 된 적의 발사 (FireScheduler와 같이 조건이 안 맞는 발사는 버리고 다시 예약)
+
+        진형 밖의 적은 랜덤 발사, 돌진 중인 보스/중간 적은 돌진 발사를 한다.
+        """
+        difficulty = self.config['difficulty']
+        tick = self.tick[:, None]
+        random_due = alive & (self.fire_random_due <= tick)
+        dive_due = alive & (self.fire_dive_due <= tick)
+        if not (random_due.any() or dive_due.any()):
+            return
+        count = self.eb_alive.sum(axis=1)
+        room = active & (count < difficulty['max_missiles'] + self.wave)
+        outside = ~self.in_formation
+        shooters = random_due & outside & room[:, None]
+        shooters |= dive_due & outside & ~self.entrance & ~self.returning & active[:, None]
+        rows, cols = np.nonzero(random_due)
+        self.schedule(self.fire_random_due, rows, cols, self.tick, difficulty['missile_base_chance'],
+                      STREAM_FIRE_RANDOM)
+        rows, cols = np.nonzero(dive_due)
+        self.schedule(self.fire_dive_due, rows, cols, self.tick,
+                      difficulty['missile_base_chance'] + difficulty['missile_per_wave'] * self.wave[rows],
+                      STREAM_FIRE_DIVE)
+        if not shooters.any():
+            return
+        # 판마다 빈 총알 칸을 앞에서부터 발사 순서대로 배정 (칸이 모자라면 버림)
+        order = np.argsort(self.eb_alive, axis=1, kind='stable')
+        free_count = ENEMY_BULLETS - count
+        rank = np.cumsum(shooters, axis=1) - 1
+        shooters &= rank < free_count[:, None]
+        rows, cols = np.nonzero(shooters)
+        slots = order[rows, rank[rows, cols]]
+        speed = per_tick(np.minimum(galaga.ENEMY_BULLET_SPEED + self.wave * galaga.ENEMY_BULLET_SPEED_PER_WAVE,
+                                    galaga.ENEMY_BULLET_MAX_SPEED))
+        self.eb_alive[rows, slots] = True
+        self.eb_x[rows, slots] = self.x[rows, cols] + ENEMY_SIZE // 2 - BULLET_W / 2
+        self.eb_y[rows, slots] = self.y[rows, cols] + ENEMY_SIZE
+        self.eb_vy[rows, slots] = speed[rows]
+
+    def start_dive(self, mask):
+        """mask의 적이 진형을 떠나 돌진 시작 (3스테이지부터 나선형 패턴 추가)"""
+        self.in_formation &= ~mask
+        self.dive_cx = np.where(mask, self.x + ENEMY_SIZE // 2, self.dive_cx)
+        self.dive_cy = np.where(mask, self.y + ENEMY_SIZE // 2, self.dive_cy)
+        self.dive_time[mask] = 0
+        rows, cols = np.nonzero(mask)
+        choices = np.where(self.wave[rows] >= 3, 3, 2)
+        self.pattern[rows, cols] = (self.uniform(STREAM_DIVE_PATTERN, rows, cols) * choices).astype(np.int8)
+
+    def move_formation(self, alive, live):
+        """진형 원점 좌우 이동 (살아 있는 양 끝 열이 경계에 닿으면 방향 전환)"""
+        has = alive.any(axis=1)
+        big = np.iinfo(np.int64).max
+        min_col = np.where(alive, self.col, big).min(axis=1)
+        max_col = np.where(alive, self.col, -1).max(axis=1)
+        move = per_tick(galaga.FORMATION_SPEED)
+        min_x = self.origin_x + min_col * FORMATION_COL_SPACING
+        max_x = self.origin_x + max_col * FORMATION_COL_SPACING
+        flip = ((self.formation_dir == 1) & (max_x + move > FORMATION_RIGHT)) | \
+               ((self.formation_dir == -1) & (min_x - move < FORMATION_LEFT))
+        flip &= has & live
+        self.formation_dir[flip] *= -1
+        self.origin_x += move * self.formation_dir * (has & live & ~flip)
+
+    def move_enemies(self, alive):
+        """등장/진형 대기/돌진/복귀 상태별 적 이동 (Enemy.update와 같은 규칙)
+
+        등장/대기는 전체 배열에 마스크로, 돌진/복귀는 해당하는 적만 골라 계산한다.
+        """
+        fx = self.origin_x[:, None] + self.slot_x
+        fy = FORMATION_TOP + self.slot_y
+        entering = alive & self.entrance
+        returning = alive & ~self.entrance & self.returning
+        waiting = alive & ~self.entrance & ~self.returning & self.in_formation
+        diving = alive & ~self.entrance & ~self.returning & ~self.in_formation
+        x, y = self.x, self.y
+
+        # 등장: 진형과 함께 좌우 이동하며 자기 자리까지 내려옴
+        np.copyto(x, fx, where=entering)
+        y += per_tick(galaga.ENEMY_ENTRANCE_SPEED) * entering
+        arrived = entering & (y >= fy)
+        np.copyto(y, fy, where=arrived)
+        self.entrance &= ~arrived
+        joined = arrived
+
+        # 복귀: 자리까지 직선 이동, 플레이어 영역에서는 가장자리 위로 먼저 빠져나옴 (좌표는 정수 픽셀)
+        rows, cols = np.nonzero(returning)
+        if len(rows):
+            speed = per_tick(galaga.ENEMY_RETURN_SPEED)
+            rx, ry, tx, ty = x[rows, cols], y[rows, cols], fx[rows, cols], fy[rows, cols]
+            dx, dy = tx - rx, ty - ry
+            dist = np.hypot(dx, dy)
+            snap = dist < speed
+            low = ~snap & (ry > SCREEN_HEIGHT - 120)
+            edge_x = np.where(rx + ENEMY_SIZE / 2 < SCREEN_WIDTH / 2, 20, SCREEN_WIDTH - 20) - rx
+            scale = speed / np.maximum(dist, speed)
+            new_x = to_pixel(np.where(low, rx + edge_x * speed / np.hypot(edge_x, 50), rx + dx * scale))
+            new_y = to_pixel(np.where(low, ry - per_tick(galaga.ENEMY_RETURN_CLIMB_SPEED), ry + dy * scale))
+            x[rows, cols] = np.where(snap, tx, new_x)
+            y[rows, cols] = np.where(snap, ty, new_y)
+            self.returning[rows[snap], cols[snap]] = False
+            joined = joined.copy()
+            joined[rows[snap], cols[snap]] = True
+        if joined.any():
+            self.join_formation(joined)
+
+        # 진형 대기: 자리 고정
+        np.copyto(x, fx, where=waiting)
+        np.copyto(y, fy, where=waiting)
+
+        # 돌진: 패턴별 궤적, 화면 밖/플레이어 영역/시간 초과면 복귀 시작
+        rows, cols = np.nonzero(diving)
+        if len(rows):
+            t = self.dive_time[rows, cols] + np.minimum(0.08, self.dive_speed[rows, cols])
+            self.dive_time[rows, cols] = t
+            cx, cy = self.dive_cx[rows, cols], self.dive_cy[rows, cols]
+            pattern = self.pattern[rows, cols]
+            bottom_limit = SCREEN_HEIGHT - 150
+            angle = math.pi / 2 + t
+            radius = np.where(pattern == PATTERN_IDS['spiral'], 40 + 8 * t, 100)
+            curve_y_limit = np.where(pattern == PATTERN_IDS['curve'], np.minimum(bottom_limit, cy + 120), bottom_limit)
+            zigzag = pattern == PATTERN_IDS['zigzag']
+            dx_ = np.trunc(np.where(zigzag, cx + 60 * np.sin(2.5 * t), cx + radius * np.cos(angle)))
+            dy_ = np.trunc(np.where(zigzag, cy + (bottom_limit - cy) * np.minimum(1.0, t / 4),
+                                    np.minimum(cy + radius * np.sin(angle), curve_y_limit)))
+            x[rows, cols] = dx_
+            y[rows, cols] = dy_
+            leave = ((dy_ > SCREEN_HEIGHT) | (dy_ + ENEMY_SIZE < -50) | (dx_ < -50) |
+                     (dx_ + ENEMY_SIZE > SCREEN_WIDTH + 50) | (t > 12) |
+                     (dy_ + ENEMY_SIZE > SCREEN_HEIGHT - 120))
+            if leave.any():
+                rows, cols = rows[leave], cols[leave]
+                self.returning[rows, cols] = True
+                u = self.uniform(STREAM_RETURN_COOLDOWN, rows, cols)
+                cooldown = 300 + (u * 501).astype(np.int64)
+                self.dive_cooldown[rows, cols] = np.maximum(100, cooldown - self.wave[rows] * 20)
+
+    def collide(self, live, now):
+        """플레이어 총알 vs 적, 적 총알/적 vs 플레이어 충돌과 점수/목숨 처리"""
+        alive = self.alive & live[:, None]
+        # 플레이어 총알 vs 적: 가장 아래 적보다 위에 있는 총알만 골라 (총알 x 적) 겹침 판정
+        lowest = np.where(alive, self.y + ENEMY_SIZE, -np.inf).max(axis=1)
+        rows, slots = np.nonzero(self.pb_alive & (self.pb_y < lowest[:, None]))
+        if len(rows):
+            bx, by = self.pb_x[rows, slots][:, None], self.pb_y[rows, slots][:, None]
+            ex, ey = self.x[rows], self.y[rows]
+            overlap = ((bx < ex + ENEMY_SIZE) & (bx + BULLET_W > ex) &
+                       (by < ey + ENEMY_SIZE) & (by + BULLET_H > ey) & alive[rows])
+            hit_bullets = overlap.any(axis=1)
+            if hit_bullets.any():
+                # galaga.py처럼 총알 하나는 겹친 적 중 번호가 가장 작은 적 하나만 맞힘
+                first = overlap.argmax(axis=1)
+                hits = np.zeros(self.hp.shape, dtype=np.int64)
+                np.add.at(hits, (rows[hit_bullets], first[hit_bullets]), 1)
+                self.hp -= hits
+                killed = alive & (hits > 0) & (self.hp <= 0)
+                self.score += (self.points * killed).sum(axis=1)
+                self.alive &= ~killed
+                self.pb_alive[rows[hit_bullets], slots[hit_bullets]] = False
+                alive &= ~killed
+
+        # 적 총알 vs 플레이어 (무적 중에도 총알은 제거)
+        px = self.player_x[:, None]
+        touching = (self.eb_alive & (self.eb_x < px + PLAYER_SIZE) & (self.eb_x + BULLET_W > px) &
+                    (self.eb_y < PLAYER_TOP + PLAYER_SIZE) & (self.eb_y + BULLET_H > PLAYER_TOP))
+        self.eb_alive &= ~touching
+        vulnerable = live & (now > self.invincible_end)
+        bullet_hit = touching.any(axis=1) & vulnerable
+        # 적 vs 플레이어 (부딪힌 적은 점수 없이 제거)
+        rammed = (alive & (self.x < px + PLAYER_SIZE) & (self.x + ENEMY_SIZE > px) &
+                  (self.y < PLAYER_TOP + PLAYER_SIZE) & (self.y + ENEMY_SIZE > PLAYER_TOP) & vulnerable[:, None])
+        self.alive &= ~rammed
+        hits = bullet_hit.astype(np.int64) + rammed.any(axis=1)
+        if hits.any():
+            self.lives -= hits
+            hit = hits > 0
+            self.invincible_end = np.where(hit & (self.lives > 0), now + HIT_INVINCIBLE_MS, self.invincible_end)
+            self.done |= hit & (self.lives <= 0)
+
+    def observe(self):
+        """판별 관측 벡터 (float32, 판 x (3 + 적 3개 x 칸 + 적 총알 3개 x 칸))
+
+        [플레이어 중심 x/폭, 목숨, 웨이브, 적 중심 x/폭..., 적 중심 y/높이..., 적 생존...,
+        적 총알 x/폭..., 적 총알 y/높이..., 적 총알 생존...]
+        """
+        e, obs = self.max_enemies, self.obs
+        obs[:, 0] = (self.player_x + PLAYER_SIZE / 2) / SCREEN_WIDTH
+        obs[:, 1] = self.lives
+        obs[:, 2] = self.wave
+        obs[:, 3:3 + e] = (self.x + ENEMY_SIZE / 2) / SCREEN_WIDTH
+        obs[:, 3 + e:3 + 2 * e] = (self.y + ENEMY_SIZE / 2) / SCREEN_HEIGHT
+        obs[:, 3 + 2 * e:3 + 3 * e] = self.alive
+        b = 3 + 3 * e
+        obs[:, b:b + ENEMY_BULLETS] = self.eb_x / SCREEN_WIDTH
+        obs[:, b + ENEMY_BULLETS:b + 2 * ENEMY_BULLETS] = self.eb_y / SCREEN_HEIGHT
+        obs[:, b + 2 * ENEMY_BULLETS:] = self.eb_alive
+        return obs
+
+def bot_actions(env):
+    """galaga.bot_input과 같은 규칙의 자동 플레이어 입력 비트를 N판 한꺼번에 계산"""
+    px = env.player_x + PLAYER_SIZE / 2
+    bits = np.full(env.num_envs, INPUT_SPACE, dtype=np.int64)
+    # 회피 대상: 플레이어 바로 위로 내려오는 적 총알 중 가장 먼저 쏜 것
+    # (총알 칸은 재사용되므로 칸 순서 대신, 같은 속도로 내려오는 총알 중 가장 아래 것을 고름)
+    centers = env.eb_x + BULLET_W / 2
+    bottoms = env.eb_y + BULLET_H
+    danger = (env.eb_alive & (np.abs(centers - px[:, None]) < 28) &
+              (bottoms > PLAYER_TOP - 140) & (bottoms < PLAYER_TOP + PLAYER_SIZE))
+    threatened = danger.any(axis=1)
+    threat_x = centers[env.rows, np.where(danger, bottoms, -np.inf).argmax(axis=1)]
+    go_left = threat_x >= px
+    go_left = np.where(go_left & (env.player_x <= 0), False, go_left)
+    go_left = np.where(~go_left & (env.player_x >= SCREEN_WIDTH - PLAYER_SIZE), True, go_left)
+    # 위협이 없으면 x가 가장 가까운 적 아래로 이동
+    gap = np.where(env.alive, env.x + ENEMY_SIZE / 2 - px[:, None], np.inf)
+    nearest = np.abs(gap).argmin(axis=1)
+    dx = gap[env.rows, nearest]
+    chase_left = dx < -4
+    chase_right = (dx > 4) & np.isfinite(dx)
+    left = np.where(threatened, go_left, chase_left)
+    right = np.where(threatened, ~go_left, chase_right)
+    return bits | np.where(left, INPUT_LEFT, 0) | np.where(right, INPUT_RIGHT, 0)
+
+def random_actions(env, rng):
+    """무작위 좌/우 이동 + 항상 발사"""
+    return INPUT_SPACE | rng.choice([0, INPUT_LEFT, INPUT_RIGHT], size=env.num_envs)
+
+def run_sprite_game(frames, seed):
+    """비교용: galaga.py 게임 한 판을 자동 플레이어로 frames틱 진행하고 초당 틱 수 반환"""
+    game = galaga.GalagaGame(seed=seed, persist_highscore=False)
+    game.step(INPUT_SPACE)
+    start = time.perf_counter()
+    for _ in range(frames):
+        if game.game_over:
+            bits = galaga.INPUT_RESTART
+        elif game.stage_clear:
+            bits = galaga.INPUT_NEXT
+        else:
+            bits = galaga.bot_input(game)
+        game.step(bits)
+    return frames / (time.perf_counter() - start)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="갤러그 배열 기반 다중 게임 환경 처리량/결과 측정")
+    parser.add_argument('--envs', type=int, default=256, help="함께 진행할 게임 수")
+    parser.add_argument('--frames', type=int, default=3600, help="진행할 틱 수 (게임마다)")
+    parser.add_argument('--seed', type=int, default=0, help="첫 게임 seed (게임마다 1씩 증가)")
+    parser.add_argument('--policy', choices=['bot', 'random'], default='bot', help="입력 정책")
+    parser.add_argument('--compare', action='store_true', help="galaga.py 한 판의 초당 틱 수도 측정해 비교")
+    args = parser.parse_args(argv)
+    if args.envs <= 0 or args.frames <= 0:
+        parser.error("--envs와 --frames는 1 이상이어야 합니다.")
+
+    env = GalagaVecEnv(args.envs)
+    next_seed = args.seed + args.envs
+    env.reset(np.arange(args.seed, next_seed))
+    rng = np.random.default_rng(args.seed)
+    finished_waves = []
+    finished_scores = []
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        actions = bot_actions(env) if args.policy == 'bot' else random_actions(env, rng)
+        _, _, done = env.step(actions)
+        if done.any():
+            # 끝난 게임은 기록하고 새 seed로 바로 다시 시작
+            ended = np.flatnonzero(done)
+            finished_waves.extend(env.wave[ended].tolist())
+            finished_scores.extend(env.score[ended].tolist())
+            env.reset(np.arange(next_seed, next_seed + len(ended)), ended)
+            next_seed += len(ended)
+    elapsed = time.perf_counter() - start
+    total = args.envs * args.frames
+    print(f"게임 {args.envs}개 x {args.frames}틱 = {total}틱, {elapsed:.2f}초 "
+          f"({total / elapsed:,.0f}틱/초, 실시간 {total / elapsed / TICK_RATE:,.0f}배)")
+    print(f"게임 오버 {len(finished_waves)}판", end='')
+    if finished_waves:
+        print(f": 도달 웨이브 평균 {np.mean(finished_waves):.2f} (최대 {max(finished_waves)}), "
+              f"점수 평균 {np.mean(finished_scores):.0f}")
+    else:
+        print()
+    print(f"진행 중 {args.envs}판: 웨이브 평균 {env.wave.mean():.2f}, 점수 평균 {env.score.mean():.0f}")
+    if args.compare:
+        frames = min(args.frames, 3600)
+        rate = run_sprite_game(frames, args.seed)
+        print(f"galaga.py 한 판: {rate:,.0f}틱/초 -> 배열 환경이 {total / elapsed / rate:.1f}배")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())